@@ -0,0 +1,203 @@
+from functools import cached_property
+from typing import NamedTuple
+
+
+class _TrieNode:
+    def __init__(self):
+        self.children: dict[str, _TrieNode] = {}
+        self.targets: set[int] = set()  # ids of every value stored at or below this node
+        self.value = None
+        self.terminal: bool = False
+
+
+class PrefixTrie:
+    """Character trie mapping names to values, resolving unambiguous prefixes.
+
+    Several keys (a name and its aliases) may map to the same value; a prefix
+    is unambiguous when every key below it maps to one value.
+    """
+    def __init__(self):
+        self._root: _TrieNode = _TrieNode()
+
+    def insert(self, key: str, value) -> None:
+        """Add ``key`` → ``value``; raises ``ValueError`` if ``key`` is taken."""
+        if self._find(key) is not None and self._find(key).terminal:
+            raise ValueError(f"'{key}' is already registered")
+        node = self._root
+        node.targets.add(id(value))
+        for ch in key:
+            node = node.children.setdefault(ch, _TrieNode())
+            node.targets.add(id(value))
+        node.value = value
+        node.terminal = True
+
+    def _find(self, prefix: str) -> _TrieNode | None:
+        node = self._root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def resolve(self, prefix: str):
+        """Return the value for an exact key or a unique prefix, else None."""
+        node = self._find(prefix)
+        if node is None or not (node.terminal or len(node.targets) == 1):
+            return None
+        while not node.terminal:  # every key below leads to the same value
+            node = next(iter(node.children.values()))
+        return node.value
+
+    def complete(self, prefix: str) -> list[str]:
+        """Return every key starting with ``prefix``, sorted."""
+        node = self._find(prefix)
+        if node is None:
+            return []
+        keys, stack = [], [(prefix, node)]
+        while stack:
+            text, node = stack.pop()
+            if node.terminal:
+                keys.append(text)
+            stack.extend((text + ch, child) for ch, child in node.children.items())
+        return sorted(keys)
+
+
+class CommandSpec(NamedTuple):
+    """Declarative definition of one CLI command.
+
+    :param path: Command words, e.g. ``"player list scores"``.
+    :param handler: Name of the ``Setup`` method receiving the argument list.
+    :param args: Argument schema, e.g. ``"<old> <new>"``; ``[name]`` marks a
+                 trailing optional argument.
+    :param summary: One-line help description.
+    :param section: Help section heading the command is listed under.
+    :param aliases: Alternative spellings of the last path word.
+    :param keep_case: Pass arguments as typed instead of lower-cased (file paths).
+    """
+    path: str
+    handler: str
+    args: str = ""
+    summary: str = ""
+    section: str = "Misc"
+    aliases: tuple[str, ...] = ()
+    keep_case: bool = False
+
+
+class _Node:
+    def __init__(self):
+        self.children: PrefixTrie = PrefixTrie()
+        self.spec: CommandSpec | None = None
+        self.arity: tuple[int, int] = (0, 0)
+
+
+class CommandRegistry:
+    """Command tree built once from :class:`CommandSpec` definitions.
+
+    Each level of the tree is a :class:`PrefixTrie`, so any unambiguous
+    abbreviation (``p li sc`` for ``player list scores``) or alias resolves to
+    its command. Argument counts are checked here against each command's
+    schema, so handlers only see well-formed argument lists.
+    """
+    def __init__(self, specs: list[CommandSpec], header: str = ""):
+        self.specs: list[CommandSpec] = []
+        self.header: str = header
+        self._root: _Node = _Node()
+        self._nodes: dict[tuple[str, ...], _Node] = {(): self._root}
+        for spec in specs:
+            self.register(spec)
+
+    def register(self, spec: CommandSpec) -> None:
+        """Add a command, validating its path, aliases and argument schema.
+
+        :raises ValueError: If the schema is malformed (an optional argument
+                            before a required one, duplicate names) or the
+                            path/alias is already taken.
+        """
+        words = tuple(spec.path.split())
+        if not words:
+            raise ValueError("command path must not be empty")
+        if words in self._nodes and self._nodes[words].spec is not None:
+            raise ValueError(f"'{spec.path}' is already registered")
+
+        names, required, optional = [], 0, 0
+        for token in spec.args.split():
+            if token.startswith("<") and token.endswith(">"):
+                if optional:
+                    raise ValueError(f"'{spec.path}': required {token} follows an optional argument")
+                required += 1
+            elif token.startswith("[") and token.endswith("]"):
+                optional += 1
+            else:
+                raise ValueError(f"'{spec.path}': bad argument '{token}', use <name> or [name]")
+            if token[1:-1] in names:
+                raise ValueError(f"'{spec.path}': duplicate argument '{token}'")
+            names.append(token[1:-1])
+
+        node = self._root
+        for depth, word in enumerate(words):
+            key = words[:depth + 1]
+            child = self._nodes.get(key)
+            if child is None:
+                child = self._nodes[key] = _Node()
+                node.children.insert(word, child)
+            node = child
+        parent = self._nodes[words[:-1]]
+        for alias in spec.aliases:
+            parent.children.insert(alias, node)
+
+        node.spec = spec
+        node.arity = (required, required + optional)
+        self.specs.append(spec)
+        self.__dict__.pop("help_text", None)  # invalidate cached help
+
+    def resolve(self, tokens: list[str]) -> tuple[CommandSpec, list[str]] | None:
+        """Match leading ``tokens`` to a command and check the remaining arguments.
+
+        :param tokens: Lower-cased input words.
+        :type tokens: list[str]
+        :return: ``(spec, args)``, or None for an unknown command or bad arity.
+        :rtype: tuple[CommandSpec, list[str]] | None
+        """
+        node, i = self._root, 0
+        while i < len(tokens):
+            child = node.children.resolve(tokens[i])
+            if child is None:
+                break
+            node, i = child, i + 1
+
+        args = tokens[i:]
+        low, high = node.arity
+        if node.spec is None or not low <= len(args) <= high:
+            return None
+        return node.spec, args
+
+    def complete(self, tokens: list[str], text: str) -> list[str]:
+        """Tab-completion candidates for ``text`` after the complete words ``tokens``."""
+        node = self._root
+        for token in tokens:
+            node = node.children.resolve(token)
+            if node is None:
+                return []
+        return node.children.complete(text)
+
+    def check_handlers(self, cls: type) -> None:
+        """Raise ``ValueError`` unless ``cls`` defines every registered handler."""
+        missing = [spec.handler for spec in self.specs if not callable(getattr(cls, spec.handler, None))]
+        if missing:
+            raise ValueError(f"{cls.__name__} lacks handlers: {', '.join(missing)}")
+
+    @cached_property
+    def help_text(self) -> str:
+        """Help screen, rendered on first use and cached."""
+        lines = [self.header]
+        sections: dict[str, list[CommandSpec]] = {}
+        for spec in self.specs:
+            sections.setdefault(spec.section, []).append(spec)
+        for section, specs in sections.items():
+            lines += ["", "", section, "-" * len(section)]
+            for spec in specs:
+                lines.append(" ".join(filter(None, (spec.path, spec.args))))
+                lines.append(f"    {spec.summary}")
+                if spec.aliases:
+                    lines.append(f"    Aliases: {', '.join(spec.aliases)}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,106 @@
+from collections.abc import Iterator
+
+from farkle.player import Player
+
+
+class Roster:
+    """Players in turn order, indexed by normalized username.
+
+    Seats live in a list and a dict maps each upper-cased username to its
+    seat, so lookup, rename, swap and removal are O(1) however large the
+    lobby. Removal leaves an empty seat behind; the list is compacted once
+    more than half of it is empty, which keeps removal amortized O(1)
+    without disturbing turn order. Indexed reads are O(1) until a removal
+    leaves an empty seat, then O(n) until the next compaction.
+    """
+    def __init__(self, players: list[Player] = ()):
+        self._seats: list[Player | None] = []
+        self._index: dict[str, int] = {}
+        for player in players:
+            self.add(player)
+
+    @staticmethod
+    def key(username: str) -> str:
+        """Normalize ``username`` the way players are named (upper case)."""
+        return username.upper()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[Player]:
+        return (player for player in self._seats if player is not None)
+
+    def __contains__(self, username: str) -> bool:
+        return self.key(username) in self._index
+
+    def __getitem__(self, position: int) -> Player:
+        """Player at turn-order ``position`` (negative counts from the end); reads never compact."""
+        if len(self._seats) == len(self._index):
+            return self._seats[position]
+        count = len(self._index)
+        if not -count <= position < count:
+            raise IndexError("roster index out of range")
+        seats = self._seats if position >= 0 else reversed(self._seats)
+        skip = position if position >= 0 else -position - 1
+        for player in seats:
+            if player is not None:
+                if skip == 0:
+                    return player
+                skip -= 1
+
+    def get(self, username: str) -> Player | None:
+        seat = self._index.get(self.key(username))
+        return None if seat is None else self._seats[seat]
+
+    def add(self, player: Player) -> bool:
+        """Seat ``player`` last; False if the name is taken."""
+        if player.username in self._index:
+            return False
+        self._index[player.username] = len(self._seats)
+        self._seats.append(player)
+        return True
+
+    def remove(self, username: str) -> Player | None:
+        seat = self._index.pop(self.key(username), None)
+        if seat is None:
+            return None
+        player, self._seats[seat] = self._seats[seat], None
+        if len(self._seats) > 2 * len(self._index):
+            self._compact()
+        return player
+
+    def rename(self, username: str, new: str) -> Player | None:
+        """Rename a player in place; None if it is missing or ``new`` is taken."""
+        old, new = self.key(username), self.key(new)
+        if old not in self._index or new in self._index:
+            return None
+        seat = self._index.pop(old)
+        self._index[new] = seat
+        player = self._seats[seat]
+        player.username = new
+        return player
+
+    def swap(self, username: str, other: str) -> tuple[Player, Player] | None:
+        """Exchange two players' seats; return them in their new order."""
+        first, second = self._index.get(self.key(username)), self._index.get(self.key(other))
+        if first is None or second is None:
+            return None
+        seats = self._seats
+        seats[first], seats[second] = seats[second], seats[first]
+        self._index[seats[first].username], self._index[seats[second].username] = first, second
+        return seats[first], seats[second]
+
+    def free_names(self, prefix: str, count: int) -> list[str]:
+        """The first ``count`` unused names ``PREFIX1``, ``PREFIX2``, ...."""
+        names, number, prefix = [], 0, self.key(prefix)
+        while len(names) < count:
+            number += 1
+            if f"{prefix}{number}" not in self._index:
+                names.append(f"{prefix}{number}")
+        return names
+
+    def _compact(self):
+        if len(self._seats) == len(self._index):
+            return
+        self._seats = [player for player in self._seats if player is not None]
+        self._index = {player.username: seat for seat, player in enumerate(self._seats)}
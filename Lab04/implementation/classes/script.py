@@ -0,0 +1,84 @@
+from collections.abc import Iterable, Iterator
+
+
+class ScriptError(ValueError):
+    """Raised when a command script has a malformed directive."""
+    def __init__(self, line_no: int, message: str):
+        super().__init__(f"line {line_no}: {message}")
+        self.line_no: int = line_no
+
+
+def iter_commands(lines: Iterable[str]) -> Iterator[str]:
+    """Expand a command script into the plain ``Setup`` commands it stands for.
+
+    Lines are read lazily, so a script piped through stdin is executed as it
+    arrives. Besides ordinary commands, scripts may use:
+
+      - ``# comment`` — ignored, as are blank lines;
+      - ``repeat <n> <command...>`` — run one command ``n`` times;
+      - ``loop <n>`` … ``end`` — run the enclosed block ``n`` times.
+        Blocks nest; only the lines of an open block are buffered.
+
+    :param lines: Script lines (a file object, ``sys.stdin`` or a list).
+    :type lines: Iterable[str]
+    :return: Generator of commands in execution order.
+    :rtype: Iterator[str]
+    :raises ScriptError: On bad counts, a stray ``end`` or an unclosed ``loop``.
+    """
+    # each open block is (count, line_no, body); body entries are commands or nested blocks
+    stack: list[tuple[int, int, list]] = []
+
+    for line_no, raw in enumerate(lines, start=1):
+        line = raw.split("#", 1)[0].strip()
+        if not line:
+            continue
+
+        word, *rest = line.split(maxsplit=1)
+        word = word.lower()
+        if word == "loop":
+            stack.append((_count(rest[0] if rest else "", line_no), line_no, []))
+            continue
+        if word == "end":
+            if not stack:
+                raise ScriptError(line_no, "'end' without 'loop'")
+            block = stack.pop()
+            if stack:
+                stack[-1][2].append(block)
+            else:
+                yield from _expand(block)
+            continue
+        if word == "repeat":
+            parts = rest[0].split(maxsplit=1) if rest else []
+            if len(parts) != 2:
+                raise ScriptError(line_no, "usage: repeat <n> <command>")
+            item = (_count(parts[0], line_no), line_no, [parts[1]])
+        else:
+            item = line
+
+        if stack:
+            stack[-1][2].append(item)
+        else:
+            yield from _expand(item) if isinstance(item, tuple) else (item,)
+
+    if stack:
+        raise ScriptError(stack[-1][1], "'loop' without 'end'")
+
+
+def _count(token: str, line_no: int) -> int:
+    try:
+        count = int(token)
+    except ValueError:
+        raise ScriptError(line_no, f"'{token}' is not an integer") from None
+    if count < 0:
+        raise ScriptError(line_no, "count must not be negative")
+    return count
+
+
+def _expand(block: tuple[int, int, list]) -> Iterator[str]:
+    count, _, body = block
+    for _ in range(count):
+        for item in body:
+            if isinstance(item, tuple):
+                yield from _expand(item)
+            else:
+                yield item
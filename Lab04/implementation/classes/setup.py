@@ -1,47 +1,104 @@
-from .game import Game
-from .player import Player
-import textwrap
+from farkle.archive import ARCHIVE_DIR, MatchArchive, recordable
+from farkle.audit import DiceAuditor
+from farkle.bulk import export_players, import_players
+from farkle.game import Game
+from farkle.player import Player
+from farkle.strategy import strategies
+from farkle.results import RESULTS_DIR, ResultStore
+from .script import iter_commands
+from .commands import CommandRegistry, CommandSpec
+from .roster import Roster
+from collections.abc import Iterable
 import os
 
+try:
+    import readline
+except ImportError:  # Windows
+    readline = None
+
+COMMANDS = CommandRegistry([
+    CommandSpec("player add", "cmd_player_add", "<username>", "Add a new human player.", "Players"),
+    CommandSpec("player remove", "cmd_player_remove", "<username>",
+                "Remove a player (requires at least 2 total players to remain).", "Players", aliases=("rm",)),
+    CommandSpec("player rename", "cmd_player_rename", "<old_username> <new_username>",
+                "Rename an existing player to a new, unused name.", "Players", aliases=("mv",)),
+    CommandSpec("player toggle-ai", "cmd_player_toggleai", "<username>",
+                "Toggle AI control for the given player.", "Players", aliases=("ai",)),
+    CommandSpec("player strategy", "cmd_player_strategy", "<username> <name>",
+                f"Choose how an AI player decides. Available: {', '.join(strategies)}", "Players"),
+    CommandSpec("player swap", "cmd_player_swap", "<username1> <username2>",
+                "Swap the turn order of two players.", "Players"),
+    CommandSpec("player bots add", "cmd_player_bots_add", "<count> [strategy]",
+                "Add <count> AI players named BOT1, BOT2, ... (skipping taken names), playing [strategy].",
+                "Players"),
+    CommandSpec("player bots remove", "cmd_player_bots_remove", "",
+                "Remove every AI player, keeping at least two players.", "Players", aliases=("rm",)),
+    CommandSpec("player list", "cmd_player_list", "", "List all player usernames on one line.", "Players",
+                aliases=("ls",)),
+    CommandSpec("player list scores", "cmd_player_list_scores", "",
+                "Show current scores for each player.", "Players"),
+    CommandSpec("player list stats", "cmd_player_list_stats", "",
+                "Show lifetime stats (Wins/Games and Lifetime Score) per player.", "Players"),
+    CommandSpec("player list ratings", "cmd_player_list_ratings", "",
+                "Rank players and bots by skill rating (mu - 3 sigma).", "Players"),
+    CommandSpec("player save", "cmd_player_save", "[username]",
+                "Save one player by name, or all non-AI players. Wins, games and lifetime score gained "
+                "since the last load or save are added to the save on disk, so a player added under a "
+                "saved name adds to that save (use 'player load' to pick up a saved player).", "Players"),
+    CommandSpec("player load", "cmd_player_load", "[username]",
+                "Load one saved player by name, or all saved players.", "Players"),
+    CommandSpec("player import", "cmd_player_import", "<path> [mode]",
+                "Stream players from a .csv or .jsonl file into the save store; existing players are "
+                "skipped unless mode is 'replace'.", "Players", keep_case=True),
+    CommandSpec("player export", "cmd_player_export", "<path>",
+                "Write every saved player to a .csv or .jsonl file.", "Players", keep_case=True),
+
+    CommandSpec("scoring method", "cmd_scoring_method", "<name>",
+                f"Select a scoring method by name. Available: {', '.join(Game.scoring_methods.keys())}",
+                "Scoring Configuration"),
+    CommandSpec("scoring target", "cmd_scoring_target", "<points>",
+                "Set the target score to end the game (integer).", "Scoring Configuration"),
+
+    CommandSpec("dice toggle-hot", "cmd_dice_togglehot", "", "Enable/disable Hot Dice.", "Dice Configuration"),
+    CommandSpec("dice set", "cmd_dice_set", "<n>",
+                "Set number of dice rolled each roll to <n> (integer).", "Dice Configuration"),
+    CommandSpec("dice audit", "cmd_dice_audit", "",
+                "Show dice fairness per player and recent game (face shares, chi-square and runs tests).",
+                "Dice Configuration"),
+    CommandSpec("dice seed", "cmd_dice_seed", "<value>",
+                "Replay the same dice every game (integer), or 'off' for fresh dice.", "Dice Configuration"),
+
+    CommandSpec("hints", "cmd_hints", "", "Toggle bank/roll hints for human players.", "Misc"),
+    CommandSpec("timer limit", "cmd_timer_limit", "<seconds>",
+                "Give humans <seconds> per bank/roll decision, or 'off' to wait forever.", "Misc"),
+    CommandSpec("timer action", "cmd_timer_action", "<bank|roll>",
+                "What happens when a human's decision time runs out (default bank).", "Misc"),
+    CommandSpec("help", "cmd_help", "", "Show this help screen.", aliases=("?",)),
+    CommandSpec("start", "cmd_start", "", "Start a game with the current settings and players."),
+    CommandSpec("exit", "cmd_exit", "", "Quit the program.", aliases=("quit",)),
+], header="""
+Farkle CLI — Commands Reference
+===============================
+Type a command followed by its arguments. Arguments in <> are required, in [] optional.
+Commands may be abbreviated to any unambiguous prefix (e.g. 'p li sc'); Tab completes them.""")
+
 class Setup:
-    def __init__(self, load_on_init = True):
+    def __init__(self, load_on_init = True, results_dir: str | None = RESULTS_DIR,
+                 archive_dir: str | None = ARCHIVE_DIR):
         self.calculate_score = Game.scoring_methods["default"]
         self.hot_dice_enabled = True
         self.running = True
-        self.players = []
+        self.players = Roster()
         self.target_score = 10000
         self.num_dice = 6
-
-        self.commands = {
-            "help" : self.cmd_help,
-            "scoring" : self.cmd_scoring,
-            "dice" : self.cmd_dice,
-            "player" : self.cmd_player,
-            "start" : self.cmd_start,
-            "exit" : self.cmd_exit
-        }
-        self.scoring_commands = {
-            "method" : self.cmd_scoring_method,
-            "target" : self.cmd_scoring_target
-        }
-        self.dice_commands = {
-            "toggle-hot" : self.cmd_dice_togglehot,
-            "set" : self.cmd_dice_set
-        }
-        self.player_commands = {
-            "list" : self.cmd_player_list,
-            "add" : self.cmd_player_add,
-            "remove" : self.cmd_player_remove,
-            "rename" : self.cmd_player_rename,
-            "toggle-ai" : self.cmd_player_toggleai,
-            "swap" : self.cmd_player_swap,
-            "save" : self.cmd_player_save,
-            "load" : self.cmd_player_load
-        }
-        self.player_list_commands = {
-            "scores" : self.cmd_player_list_scores,
-            "stats" : self.cmd_player_list_stats
-        }
+        self.ai_delay = True
+        self.hints_enabled = False
+        self.seed: int | None = None
+        self.auditor = DiceAuditor()
+        self.decision_timeout: float | None = None
+        self.timeout_action = "b"
+        self.results = ResultStore(results_dir) if results_dir is not None else None
+        self.archive = MatchArchive(archive_dir) if archive_dir is not None else None
 
         if load_on_init:
             self.load()
@@ -54,44 +111,62 @@ class Setup:
     def run(self): # configure game using cli. tokenize user input to parse input commands
         print("====  SETUP SCREEN  ====\n"
               "Type 'help' for commands")
+        if readline is not None:
+            readline.set_completer(self.complete)
+            readline.parse_and_bind("tab: complete")
         while self.running:
-            user_in = input("> ").lower().split()
-            if len(user_in) == 0:
-                continue
-
-            cmd, *args = user_in
-            handler = self.commands.get(cmd)
-            if handler is None:
-                print("Bad input")
-                continue
-
-            handler(args)
-
-    def cmd_help(self, args: list[str]):
-        if len(args) != 0:
-            print("Bad input")
+            self.dispatch(input("> "))
+
+    def run_script(self, lines: Iterable[str]):
+        """Execute commands from a script without prompting.
+
+        Commands are streamed through :func:`iter_commands` (which expands
+        ``repeat``/``loop`` directives) into the same dispatch tables as the
+        interactive loop. AI players decide instantly instead of pausing, so a
+        script can drive thousands of games. Stops early on ``exit``; recorded
+        match results and archived matches are flushed when the script ends.
+
+        :param lines: Script lines, e.g. an open file or ``sys.stdin``.
+        :type lines: Iterable[str]
+        """
+        self.ai_delay = False
+        for line in iter_commands(lines):
+            if not self.running:
+                break
+            self.dispatch(line)
+        self.flush()
+
+    def complete(self, text: str, state: int) -> str | None:
+        """``readline`` completer: the ``state``-th command word matching ``text``."""
+        words = readline.get_line_buffer()[:readline.get_begidx()].lower().split()
+        candidates = COMMANDS.complete(words, text.lower())
+        return candidates[state] + " " if state < len(candidates) else None
+
+    def dispatch(self, line: str):
+        """Tokenize one command line and run its top-level handler.
+
+        :param line: Raw command text, e.g. ``"player add sam"``.
+        :type line: str
+        """
+        words = line.split()
+        user_in = [word.lower() for word in words]
+        if len(user_in) == 0:
             return
 
-        self.help()
-
-    def cmd_scoring(self, args: list[str]):
-        if len(args) == 0:
+        resolved = COMMANDS.resolve(user_in)
+        if resolved is None:
             print("Bad input")
             return
 
-        cmd, *scoring_args = args
-        handler = self.scoring_commands.get(cmd)
-        if handler is None:
-            print("Bad input")
-            return
+        spec, args = resolved
+        if spec.keep_case:
+            args = words[len(words) - len(args):]
+        getattr(self, spec.handler)(args)
 
-        handler(scoring_args)
+    def cmd_help(self, args: list[str]):
+        self.help()
 
     def cmd_scoring_method(self, args: list[str]):
-        if len(args) != 1:
-            print("Bad input")
-            return
-
         if args[0] in Game.scoring_methods:
             self.calculate_score = Game.scoring_methods[args[0]]
             print(f"Scoring method '{args[0]}' enabled")
@@ -99,46 +174,34 @@ class Setup:
         print(f"'{args[0]}' not a scoring method")
 
     def cmd_scoring_target(self, args: list[str]):
-        if len(args) != 1:
-            print("Bad input")
-            return
-
         try:
             self.target_score = int(args[0])
             print(f"Set target score to {self.target_score} points")
         except ValueError:
             print(f"'{args[0]}' is not an integer")
 
-    def cmd_player(self, args: list[str]):
-        if len(args) == 0:
-            print("Bad input")
-            return
-
-        cmd, *scoring_args = args
-        handler = self.player_commands.get(cmd)
-        if handler is None:
-            print("Bad input")
+    def cmd_player_toggleai(self, args: list[str]):
+        player = self.toggle_ai(args[0])
+        if player is None:
+            print(f"Player '{args[0].upper()}' not a player")
             return
 
-        handler(scoring_args)
+        print(f"'{player.username}' AI {'enabled' if player.is_ai else 'disabled'}")
 
-    def cmd_player_toggleai(self, args: list[str]):
-        if len(args) != 1:
-            print("Bad input")
+    def cmd_player_strategy(self, args: list[str]):
+        if args[1] not in strategies:
+            print(f"'{args[1]}' not a strategy")
             return
 
-        player = self.toggle_ai(args[0])
+        player = self.players.get(args[0])
         if player is None:
             print(f"Player '{args[0].upper()}' not a player")
             return
 
-        print(f"'{player.username}' AI {'enabled' if player.is_ai else 'disabled'}")
+        player.strategy = args[1]
+        print(f"'{player.username}' now plays '{args[1]}'")
 
     def cmd_player_rename(self, args: list[str]):
-        if len(args) != 2:
-            print("Bad input")
-            return
-
         player = self.rename(args[0], args[1])
         if player is None:
             print(f"Player '{args[0].upper()}' not a player or '{args[1].upper()}' already exists'")
@@ -147,10 +210,6 @@ class Setup:
         print(f"Player '{args[0].upper()}' renamed to '{player.username}'")
 
     def cmd_player_add(self, args: list[str]):
-        if len(args) != 1:
-            print("Bad input")
-            return
-
         player = self.add_player(args[0])
         if player is None:
             print(f"Player '{args[0].upper()}' already exists")
@@ -159,10 +218,6 @@ class Setup:
         print(f"Player '{player.username}' added")
 
     def cmd_player_remove(self, args: list[str]):
-        if len(args) != 1:
-            print("Bad input")
-            return
-
         player = self.remove_player(args[0])
         if player is None:
             print(f"Player '{args[0].upper()}' not a player or is one of two players (there must be at least two players)")
@@ -170,41 +225,52 @@ class Setup:
 
         print(f"Player '{player.username}' removed")
 
-    def cmd_player_list(self, args: list[str]):
-        if len(args) == 0:
-            for player in self.players:
-                print(f"{player.username}", end=" ")
-            print()
+    def cmd_player_bots_add(self, args: list[str]):
+        strategy = args[1] if len(args) > 1 else "default"
+        if strategy not in strategies:
+            print(f"'{strategy}' not a strategy")
             return
-
-        cmd, *list_args = args
-        handler = self.player_list_commands.get(cmd)
-        if handler is None:
-            print("Bad input")
+        try:
+            count = int(args[0])
+        except ValueError:
+            print(f"'{args[0]}' is not an integer")
+            return
+        if count < 1:
+            print("Add at least one bot")
             return
 
-        handler(list_args)
+        added = self.add_bots(count, strategy)
+        print(f"Added {len(added)} '{strategy}' bots ({added[0].username} to {added[-1].username})")
 
-    def cmd_player_list_scores(self, args: list[str]):
-        if len(args) != 0:
-            print("Bad input")
-            return
+    def cmd_player_bots_remove(self, args: list[str]):
+        removed = self.remove_bots()
+        print(f"Removed {len(removed)} bots")
 
+    def cmd_player_list(self, args: list[str]):
+        for player in self.players:
+            print(f"{player.username}", end=" ")
+        print()
+
+    def cmd_player_list_scores(self, args: list[str]):
         print("Player     Score\n"
               "-----------------")
         for player in self.players:
             print(f"{player.username: <10} {player.points:0>6}")
 
     def cmd_player_list_stats(self, args: list[str]):
-        if len(args) != 0:
-            print("Bad input")
-            return
-
         print("Player     Wins/Games Lifetime\n"
               "------------------------------")
         for player in self.players:
             print(f"{player.username: <10} {player.wins:0>3}/{player.games:0>3}    {player.lifetime_score:0>8}")
 
+    def cmd_player_list_ratings(self, args: list[str]):
+        print("Player     Rating  Mu     Sigma  Strategy\n"
+              "----------------------------------------")
+        for player in sorted(self.players, key=lambda p: -p.rating.conservative):
+            strategy = player.strategy if player.is_ai else "human"
+            print(f"{player.username: <10} {player.rating.conservative:6.2f}  "
+                  f"{player.rating.mu:5.2f}  {player.rating.sigma:5.2f}  {strategy}")
+
     def cmd_player_save(self, args: list[str]):
         if len(args) == 0:
             for player in self.players:
@@ -213,19 +279,11 @@ class Setup:
                     print(f"Player '{player.username}' saved")
             return
 
-        if len(args) == 1:
-            self.save(args[0])
-            print(f"Player '{args[0].upper()}' saved")
-            return
-
-        print("Bad input")
+        self.save(args[0])
+        print(f"Player '{args[0].upper()}' saved")
 
     def cmd_player_load(self, args: list[str]):
-        loaded: tuple = ()
-        if len(args) == 0:
-            loaded = self.load()
-        elif len(args) == 1:
-            loaded = self.load(args[0])
+        loaded = self.load(*args)
 
         if loaded is None:
             print("No players loaded")
@@ -234,11 +292,33 @@ class Setup:
         for player in loaded:
             print(f"Player '{player.username}' loaded")
 
-    def cmd_player_swap(self, args: list[str]):
-        if len(args) != 2:
-            print("Bad input")
+    def cmd_player_import(self, args: list[str]):
+        if len(args) > 1 and args[1].lower() != "replace":
+            print(f"Unknown import mode '{args[1]}' (use 'replace' or nothing)")
             return
+        try:
+            report = import_players(args[0], replace=len(args) > 1)
+        except OSError as error:
+            print(f"Could not import '{args[0]}': {error.strerror or error}")
+            return
+        print(f"Imported {report.written} players ({report.duplicates} duplicates skipped, "
+              f"{report.invalid} invalid records)")
+        for error in report.errors:
+            print(f"  {error}")
+        if report.written:
+            print("Imported players are in the save store; use 'player load <username>' to seat them")
+
+    def cmd_player_export(self, args: list[str]):
+        try:
+            report = export_players(args[0])
+        except (OSError, ValueError) as error:
+            print(f"Could not export to '{args[0]}': {getattr(error, 'strerror', None) or error}")
+            return
+        print(f"Exported {report.written} players to '{args[0]}'")
+        for skipped in report.skipped:
+            print(f"  skipped {skipped}")
 
+    def cmd_player_swap(self, args: list[str]):
         swapped = self.swap(args[0], args[1])
         if swapped is None:
             print(f"Player '{args[0].upper()}' and/or '{args[1].upper()}' not (a) player(s)")
@@ -246,219 +326,168 @@ class Setup:
 
         print(f"Players '{swapped[1].username}' and '{swapped[0].username}' swapped")
 
-    def cmd_dice(self, args: list[str]):
-        if len(args) == 0:
-            print("Bad input")
-            return
-
-        cmd, *dice_args = args
-        handler = self.dice_commands.get(cmd)
-        if handler is None:
-            print("Bad input")
-            return
-
-        handler(dice_args)
-
     def cmd_dice_togglehot(self, args: list[str]):
-        if len(args) != 0:
-            print("Bad input")
-            return
-
         self.hot_dice_enabled = not self.hot_dice_enabled
         print(f"Hot dice {'enabled' if self.hot_dice_enabled else 'disabled'}")
 
     def cmd_dice_set(self, args: list[str]):
-        if len(args) != 1:
-            print("Bad input")
-            return
-
         try:
             self.num_dice = int(args[0])
             print(f"Set roll to {self.num_dice} dice")
         except ValueError:
             print(f"'{args[0]}' is not an integer")
 
-    def cmd_start(self, args: list[str]):
-        if len(args) != 0:
-            print("Bad input")
+    def cmd_dice_audit(self, args: list[str]):
+        print(self.auditor.render())
+
+    def cmd_dice_seed(self, args: list[str]):
+        if args[0] == "off":
+            self.seed = None
+            print("Dice seeding disabled")
             return
+        try:
+            self.seed = int(args[0])
+            print(f"Dice seeded with {self.seed}")
+        except ValueError:
+            print(f"'{args[0]}' is not an integer")
 
+    def cmd_timer_limit(self, args: list[str]):
+        if args[0] == "off":
+            self.decision_timeout = None
+            print("Decision timer disabled")
+            return
+        try:
+            seconds = float(args[0])
+        except ValueError:
+            print(f"'{args[0]}' is not a number")
+            return
+        if seconds <= 0:
+            print("The time limit must be positive")
+            return
+        self.decision_timeout = seconds
+        print(f"Humans have {seconds:g} seconds per decision")
+
+    def cmd_timer_action(self, args: list[str]):
+        action = {"bank": "b", "roll": "r"}.get(args[0].lower())
+        if action is None:
+            print(f"'{args[0]}' is not an action; choose bank or roll")
+            return
+        self.timeout_action = action
+        print(f"Timed-out decisions will {args[0].lower()}")
+
+    def cmd_hints(self, args: list[str]):
+        self.hints_enabled = not self.hints_enabled
+        print(f"Hints {'enabled' if self.hints_enabled else 'disabled'}")
+
+    def cmd_start(self, args: list[str]):
         game_ran = self.create_game()
         if not game_ran:
             print("Not enough players")
 
     def cmd_exit(self, args: list[str]):
-        if len(args) != 0:
-            print("Bad input")
-            return
-
         self.running = False
+        self.flush()
         print("Byee :)")
 
+    def flush(self):
+        """Write out buffered match results and archived matches (timeouts included) for the query tools."""
+        if self.results is not None:
+            self.results.flush()
+        if self.archive is not None:
+            self.archive.flush()
+
     def help(self):
-        help_text = textwrap.dedent(f"""
-        Farkle CLI — Commands Reference
-        ===============================
-        Type a command followed by its arguments. Arguments in <> are required.
-
-
-        Players
-        -------
-        player add <username>
-            Add a new human player.
-        player remove <username>
-            Remove a player (requires at least 2 total players to remain).
-        player rename <old_username> <new_username>
-            Rename an existing player to a new, unused name.
-        player toggle-ai <username>
-            Toggle AI control for the given player.
-        player swap <username1> <username2>
-            Swap the turn order of two players.
-        
-        player list
-            List all player usernames on one line.
-        player list scores
-            Show current scores for each player.
-        player list stats
-            Show lifetime stats (Wins/Games and Lifetime Score) per player.
-
-        player save
-            Save all non-AI players.
-        player save <username>
-            Save a single player by name.
-        player load
-            Load all saved players (if supported by your storage).
-        player load <username>
-            Load a single saved player.
-
-
-        Scoring Configuration
-        ---------------------
-        scoring method <name>
-            Select a scoring method by name. Available: {', '.join(Game.scoring_methods.keys())}
-        scoring target <points>
-            Set the target score to end the game (integer).
-
-
-        Dice Configuration
-        ------------------
-        dice toggle-hot
-            Enable/disable Hot Dice.
-        dice set <n>
-            Set number of dice rolled each roll to <n> (integer).
-
-
-        Misc
-        ----
-        help
-            Show this help screen.
-        start
-            Start a game with the current settings and players.
-        exit
-            Quit the program.
-        """)
-        print(help_text, end="")
+        print(COMMANDS.help_text, end="")
 
     def save(self, player: str | Player) -> Player | None:
         if isinstance(player, str):
-            for player_obj in self.players:
-                if player_obj.username == player.upper():
-                    player_obj.save()
-                    return player_obj
+            player_obj = self.players.get(player)
+            if player_obj is not None:
+                player_obj.save()
+            return player_obj
         elif isinstance(player, Player):
             player.save()
             return player
         return None
 
     def load(self, username: str | None = None) -> tuple[Player, ...] | None:
-        if not os.path.exists("players"):
+        if not os.path.exists(Player.directory):
             return None
 
         if username is None:
             # load data to existing players, create new player objs for nonexisting
             loaded: list[Player] = []
-            with os.scandir("players") as entries:
+            with os.scandir(Player.directory) as entries:
                 for entry in entries:
-                    if entry.is_file():
+                    if entry.is_file() and entry.name.endswith(".json"):
                         json_username = entry.name[:-5].upper()
-                        player_exists = False
-                        for player in self.players:
-                            if json_username == player.username:
-                                player_exists = True
-                                player.load()
-                                loaded.append(player)
-                        if not player_exists:
+                        player = self.players.get(json_username)
+                        if player is None:
                             player = Player(json_username)
-                            player.load()
-                            loaded.append(player)
-                            self.players.append(player)
+                            self.players.add(player)
+                        player.load()
+                        loaded.append(player)
             return tuple(loaded) if loaded else None
         else:
-            for player in self.players:
-                if player.username == username.upper():
-                    player.load()
-                    return (player,)
+            player = self.players.get(username)
+            if player is not None:
+                player.load()
+                return (player,)
         return None
 
     def toggle_ai(self, username: str) -> Player | None:
-        for player in self.players:
-            if player.username == username.upper():
-                player.is_ai = not player.is_ai
-                return player
-        return None
+        player = self.players.get(username)
+        if player is not None:
+            player.is_ai = not player.is_ai
+        return player
 
     def rename(self, username: str, new: str) -> Player | None:
-        rename: Player | None = None
-        for player in self.players:
-            if player.username == new.upper(): # only rename uniquely
-                return None
-            if player.username == username.upper():
-                rename = player
-        if rename is not None:
-            rename.username = new.upper()
-        return rename
+        return self.players.rename(username, new) # only rename uniquely
 
     def swap(self, username: str, other: str) -> tuple[Player, Player] | None:
-        first_index: int = -1
-        second_index: int = -1
-        for i in range(len(self.players)):
-            player: Player = self.players[i]
-            if player.username == username.upper():
-                first_index = i
-            if player.username == other.upper():
-                second_index = i
-        if first_index == -1 or second_index == -1:
-            return None
-        swap: Player = self.players[first_index]
-        self.players[first_index] = self.players[second_index]
-        self.players[second_index] = swap
-        return self.players[first_index], self.players[second_index]
+        return self.players.swap(username, other)
 
     def add_player(self, username: str) -> Player | None:
-        for player in self.players:
-            if player.username == username.upper():
-                return None
         player = Player(username.upper())
-        self.players.append(player)
+        if not self.players.add(player):
+            return None
         return player
 
+    def add_bots(self, count: int, strategy: str = "default") -> list[Player]:
+        bots = [Player(name, is_ai=True) for name in self.players.free_names("BOT", count)]
+        for bot in bots:
+            bot.strategy = strategy
+            self.players.add(bot)
+        return bots
 
     def remove_player(self, username: str) -> Player | None:
         if len(self.players) <= 2:
             return None
-        for player in self.players:
-            if player.username == username.upper():
-                self.players.remove(player)
-                return player
-        return None
+        return self.players.remove(username)
+
+    def remove_bots(self) -> list[Player]:
+        removed = []
+        for player in [player for player in self.players if player.is_ai]:
+            if len(self.players) <= 2:
+                break
+            removed.append(self.players.remove(player.username))
+        return removed
 
     def create_game(self) -> bool:
         if len(self.players) < 2:
             return False
-        game = Game(self.calculate_score, self.players, self.target_score, self.num_dice)
+        game = Game(self.calculate_score, list(self.players), self.target_score, self.num_dice,
+                    self.hot_dice_enabled, ai_delay=self.ai_delay, hints_enabled=self.hints_enabled,
+                    results=self.results, seed=self.seed, auditor=self.auditor,
+                    decision_timeout=self.decision_timeout, timeout_action=self.timeout_action)
+        if self.archive is not None and recordable(game):  # tables the record format cannot hold go unarchived
+            game.archive = self.archive
         success = game.run()
         if not success:
             print("Game quit")
         else:
             print("Game ran successfully")
         return True
+
+
+COMMANDS.check_handlers(Setup)
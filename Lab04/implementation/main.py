@@ -1,5 +1,26 @@
+import argparse
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))  # shared ``farkle`` core
+
 from classes.setup import Setup
+from classes.script import ScriptError
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Farkle CLI")
+    parser.add_argument("--script", metavar="FILE",
+                        help="run setup commands from FILE without prompting")
+    options = parser.parse_args()
+
     setup = Setup()
-    setup.run()
+    try:
+        if options.script is not None:
+            with open(options.script) as script:
+                setup.run_script(script)
+        elif not sys.stdin.isatty():
+            setup.run_script(sys.stdin)
+        else:
+            setup.run()
+    except ScriptError as e:
+        sys.exit(f"Script error, {e}")
@@ -0,0 +1,92 @@
+# tests/test_commands.py
+import unittest
+from unittest.mock import patch
+from io import StringIO
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+REPO_ROOT = PROJECT_ROOT.parents[1]  # home of the shared ``farkle`` core
+for path in (REPO_ROOT, PROJECT_ROOT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from classes.commands import CommandRegistry, CommandSpec, PrefixTrie  # noqa: E402
+from classes.setup import COMMANDS, Setup  # noqa: E402
+from farkle.bulk import ExportReport  # noqa: E402
+
+
+class TestPrefixTrie(unittest.TestCase):
+    def test_exact_unique_and_ambiguous_prefixes(self):
+        trie = PrefixTrie()
+        trie.insert("start", 1)
+        trie.insert("stats", 2)
+        trie.insert("scoring", 3)
+        self.assertEqual(trie.resolve("start"), 1)
+        self.assertEqual(trie.resolve("sc"), 3)
+        self.assertIsNone(trie.resolve("st"))
+        self.assertIsNone(trie.resolve("x"))
+        self.assertListEqual(trie.complete("st"), ["start", "stats"])
+
+    def test_aliases_of_one_value_are_not_ambiguous(self):
+        trie = PrefixTrie()
+        target = object()
+        trie.insert("exit", target)
+        trie.insert("exeunt", target)
+        self.assertIs(trie.resolve("ex"), target)
+
+    def test_duplicate_key_rejected(self):
+        trie = PrefixTrie()
+        trie.insert("add", 1)
+        with self.assertRaises(ValueError):
+            trie.insert("add", 2)
+
+
+class TestRegistry(unittest.TestCase):
+    def test_bad_schemas_rejected_at_registration(self):
+        for args in ["[a] <b>", "<a> <a>", "name"]:
+            with self.assertRaises(ValueError):
+                CommandRegistry([CommandSpec("x", "cmd_x", args)])
+        with self.assertRaises(ValueError):
+            CommandRegistry([CommandSpec("x", "cmd_x"), CommandSpec("x", "cmd_y")])
+
+    def test_resolve_abbreviations_aliases_and_arity(self):
+        spec, args = COMMANDS.resolve(["p", "li", "sc"])
+        self.assertEqual(spec.handler, "cmd_player_list_scores")
+        self.assertEqual(COMMANDS.resolve(["player", "rm", "bot"])[0].handler, "cmd_player_remove")
+        self.assertEqual(COMMANDS.resolve(["player", "save"])[1], [])
+        self.assertEqual(COMMANDS.resolve(["player", "save", "p1"])[1], ["p1"])
+        self.assertIsNone(COMMANDS.resolve(["player", "save", "a", "b"]))
+        self.assertIsNone(COMMANDS.resolve(["player", "rename", "a"]))
+        self.assertIsNone(COMMANDS.resolve(["s"]))  # scoring or start
+
+    def test_completion(self):
+        self.assertListEqual(COMMANDS.complete([], "s"), ["scoring", "start"])
+        self.assertIn("toggle-hot", COMMANDS.complete(["dice"], ""))
+
+    def test_help_rendered_once(self):
+        self.assertIs(COMMANDS.help_text, COMMANDS.help_text)
+        self.assertIn("doubling", COMMANDS.help_text)
+
+
+class TestSetupDispatch(unittest.TestCase):
+    def test_dispatch_runs_handlers_and_rejects_bad_arity(self):
+        setup = Setup(load_on_init=False, results_dir=None, archive_dir=None)
+        with patch("sys.stdout", new_callable=StringIO) as out:
+            setup.dispatch("pl add sam")
+            setup.dispatch("sc tar 500")
+            setup.dispatch("dice set")
+        self.assertIn("SAM", [p.username for p in setup.players])
+        self.assertEqual(setup.target_score, 500)
+        self.assertTrue(out.getvalue().rstrip().endswith("Bad input"))
+
+    def test_path_arguments_keep_their_case(self):
+        setup = Setup(load_on_init=False, results_dir=None, archive_dir=None)
+        with patch("sys.stdout", new_callable=StringIO), \
+                patch("classes.setup.export_players", return_value=ExportReport(0, ())) as export:
+            setup.dispatch("PLAYER EXPORT /tmp/League.CSV")
+        export.assert_called_once_with("/tmp/League.CSV")
+
+
+if __name__ == "__main__":
+    unittest.main()
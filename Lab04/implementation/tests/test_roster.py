@@ -0,0 +1,74 @@
+# tests/test_roster.py
+import unittest
+from unittest.mock import patch
+from io import StringIO
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+REPO_ROOT = PROJECT_ROOT.parents[1]  # home of the shared ``farkle`` core
+for path in (REPO_ROOT, PROJECT_ROOT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from classes.roster import Roster  # noqa: E402
+from classes.setup import Setup  # noqa: E402
+from farkle.player import Player  # noqa: E402
+
+
+def names(roster) -> list[str]:
+    return [player.username for player in roster]
+
+
+class TestRoster(unittest.TestCase):
+    def test_lookup_rename_swap_and_remove_keep_turn_order(self):
+        roster = Roster([Player(name) for name in ("A", "B", "C", "D")])
+        self.assertIs(roster.get("c"), roster[2])
+        self.assertFalse(roster.add(Player("A")))
+        self.assertIsNone(roster.rename("a", "b"))
+        self.assertEqual(roster.rename("a", "zed").username, "ZED")
+        self.assertNotIn("a", roster)
+        self.assertEqual(names(roster.swap("zed", "d")), ["D", "ZED"])
+        self.assertEqual(names(roster), ["D", "B", "C", "ZED"])
+        self.assertEqual(roster.remove("b").username, "B")
+        self.assertIsNone(roster.remove("b"))
+        self.assertEqual((names(roster), len(roster), roster[-1].username), (["D", "C", "ZED"], 3, "ZED"))
+
+    def test_indexed_reads_skip_empty_seats_without_compacting(self):
+        roster = Roster([Player(name) for name in "ABCDE"])
+        roster.remove("b")
+        roster.remove("d")
+        seats = list(roster._seats)
+        self.assertEqual([roster[i].username for i in range(-3, 3)], ["A", "C", "E", "A", "C", "E"])
+        self.assertEqual(roster._seats, seats)
+        for position in (3, -4):
+            with self.assertRaises(IndexError):
+                roster[position]
+
+    def test_many_removals_compact_the_seats(self):
+        roster = Roster([Player(f"P{i}") for i in range(1000)])
+        for i in range(0, 1000, 3):
+            roster.remove(f"p{i}")
+        self.assertEqual(names(roster), [f"P{i}" for i in range(1000) if i % 3])
+        self.assertLessEqual(len(roster._seats), 2 * len(roster))
+        self.assertEqual(roster.swap("p1", "p998"), (roster[0], roster[-1]))
+        self.assertEqual(roster.get("p998"), roster[0])
+
+
+class TestSetupBots(unittest.TestCase):
+    def test_bulk_add_and_remove_bots(self):
+        setup = Setup(load_on_init=False, results_dir=None, archive_dir=None)
+        with patch("sys.stdout", new_callable=StringIO) as out:
+            setup.dispatch("player bots add 3 max-ev")
+            setup.dispatch("player bots add 2 nope")
+            setup.dispatch("p bo add 1")
+        self.assertEqual(names(setup.players), ["BOT", "P1", "BOT1", "BOT2", "BOT3", "BOT4"])
+        self.assertEqual([p.strategy for p in setup.players][2:], ["max-ev"] * 3 + ["default"])
+        self.assertIn("'nope' not a strategy", out.getvalue())
+        with patch("sys.stdout", new_callable=StringIO):
+            setup.dispatch("player bots rm")
+        self.assertEqual(names(setup.players), ["P1", "BOT4"])
+
+
+if __name__ == "__main__":
+    unittest.main()
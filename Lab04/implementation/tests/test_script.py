@@ -0,0 +1,69 @@
+# tests/test_script.py
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from io import StringIO
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+REPO_ROOT = PROJECT_ROOT.parents[1]  # home of the shared ``farkle`` core
+for path in (REPO_ROOT, PROJECT_ROOT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from farkle.archive import MatchArchive  # noqa: E402
+from farkle.results import ResultStore  # noqa: E402
+from classes.script import ScriptError, iter_commands  # noqa: E402
+from classes.setup import Setup  # noqa: E402
+
+
+class TestIterCommands(unittest.TestCase):
+    def test_plain_commands_and_comments(self):
+        lines = ["help", "", "# a comment", "player list  # trailing"]
+        self.assertListEqual(list(iter_commands(lines)), ["help", "player list"])
+
+    def test_repeat(self):
+        self.assertListEqual(list(iter_commands(["repeat 3 start"])), ["start"] * 3)
+
+    def test_nested_loops(self):
+        lines = ["loop 2", "a", "loop 2", "b", "end", "repeat 2 c", "end"]
+        self.assertListEqual(list(iter_commands(lines)), ["a", "b", "b", "c", "c"] * 2)
+
+    def test_streams_lazily(self):
+        def lines():
+            yield "first"
+            raise AssertionError("read too far")
+        self.assertEqual(next(iter_commands(lines())), "first")
+
+    def test_errors_report_line(self):
+        for lines, line_no in [(["help", "end"], 2), (["loop 2", "help"], 1),
+                               (["repeat x help"], 1), (["repeat 2"], 1)]:
+            with self.assertRaises(ScriptError) as ctx:
+                list(iter_commands(lines))
+            self.assertEqual(ctx.exception.line_no, line_no)
+
+
+class TestRunScript(unittest.TestCase):
+    def test_script_drives_setup_and_games(self):
+        results_dir, archive_dir = tempfile.mkdtemp(), tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, results_dir)
+        self.addCleanup(shutil.rmtree, archive_dir)
+        setup = Setup(load_on_init=False, results_dir=results_dir, archive_dir=archive_dir)
+        script = ["player toggle-ai p1", "scoring target 300", "repeat 5 start", "exit", "player add late"]
+        with patch("sys.stdout", new_callable=StringIO) as out, \
+                patch("builtins.input", side_effect=AssertionError("prompted")):
+            setup.run_script(script)
+
+        self.assertEqual(len(ResultStore(results_dir)), 5)
+        self.assertEqual(len(MatchArchive(archive_dir)), 5)
+
+        self.assertEqual(out.getvalue().count("Game ran successfully"), 5)
+        self.assertEqual(sum(p.games for p in setup.players), 10)
+        self.assertFalse(setup.running)
+        self.assertNotIn("LATE", [p.username for p in setup.players])
+
+
+if __name__ == "__main__":
+    unittest.main()
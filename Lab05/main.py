@@ -1,3 +1,8 @@
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))  # shared ``farkle`` core
+
 from src.setup import Setup
 
 if __name__ == "__main__":
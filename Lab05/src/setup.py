@@ -14,6 +14,7 @@ class Setup:
         running (bool): Whether the setup screen loop continues running.
         players (list[Player]): Current player roster (index 0 is human).
         target_score (int): Points required to end the game.
+        seed (int | None): Dice seed for reproducible games, or None.
         commands (dict[str, callable]): Top-level command dispatch table.
         scoring_commands (dict[str, callable]): Subcommands for ``scoring``.
         player_commands (dict[str, callable]): Subcommands for ``player``.
@@ -26,13 +27,14 @@ class Setup:
         Behavior:
           1) Enables Hot Dice by default and sets ``running = True``.
           2) Creates a default human player ``P1`` and an AI player ``BOT``.
-          3) Sets ``target_score = 10000``.
+          3) Sets ``target_score = 10000`` and leaves games unseeded.
           4) Registers top-level commands and their subcommand tables.
         """
         self.hot_dice_enabled = True
         self.running = True
         self.players = [Player("P1"), Player("BOT", is_ai=True)]
         self.target_score = 10000
+        self.seed = None
 
         self.commands = {
             "help" : self.cmd_help,
@@ -43,7 +45,8 @@ class Setup:
         }
         self.scoring_commands = {
             "target" : self.cmd_scoring_target,
-            "hot-dice" : self.cmd_scoring_hotdice
+            "hot-dice" : self.cmd_scoring_hotdice,
+            "seed" : self.cmd_scoring_seed
         }
         self.player_commands = {
             "show" : self.cmd_player_show,
@@ -132,6 +135,8 @@ class Setup:
                     Turn hot-dice on or off. Must input 'on' or 'off'.
                 scoring target <points>
                     Set the target score to end the game (integer).
+                scoring seed <value>
+                    Replay the same dice every game (integer), or 'off' for fresh dice.
 
 
                 Misc
@@ -220,6 +225,33 @@ class Setup:
             print(f"{args[0]} not an option, must input 'on' or 'off'")
         print(f"Hot dice {'enabled' if self.hot_dice_enabled else 'disabled'}")
 
+    def cmd_scoring_seed(self, args: list[str]):
+        """Seed the dice of every following game, or turn seeding off.
+
+        Behavior:
+          1) Requires exactly one argument: an integer seed or ``\"off\"``.
+          2) Games started with the same seed, players and settings roll the
+             same dice (identically in the Lab04 front end).
+
+        :param args: ``[seed]`` or ``[\"off\"]``.
+        :type args: list[str]
+        :return: ``None``. Side effects: updates ``seed``; prints.
+        :rtype: None
+        """
+        if len(args) != 1:
+            print("Bad input")
+            return
+
+        if args[0] == "off":
+            self.seed = None
+            print("Dice seeding disabled")
+            return
+        try:
+            self.seed = int(args[0])
+            print(f"Dice seeded with {self.seed}")
+        except ValueError:
+            print(f"'{args[0]}' is not an integer")
+
     def cmd_player(self, args: list[str]):
         """Dispatch a player subcommand.
 
@@ -400,8 +432,8 @@ class Setup:
 
         Behavior:
           1) Requires no arguments; otherwise prints ``\"Bad input\"``.
-          2) Instantiates ``Game`` with current players and target score,
-             runs it, and prints either ``\"Game ran successfully\"`` or
+          2) Instantiates ``Game`` with current players, target score, hot
+             dice setting and seed, runs it, and prints either ``\"Game ran successfully\"`` or
              ``\"Game quit\"`` based on the boolean return.
 
         :param args: Must be empty.
@@ -413,7 +445,8 @@ class Setup:
             print("Bad input")
             return
 
-        if Game(players=self.players, target_score=self.target_score).run():
+        if Game(players=self.players, target_score=self.target_score,
+                hot_dice_enabled=self.hot_dice_enabled, seed=self.seed).run():
             print("Game ran successfully")
             return
         print("Game quit")
@@ -12,8 +12,10 @@ def no_blocking_io(monkeypatch):
 
 
 PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
+REPO_ROOT = PROJECT_ROOT.parent  # home of the shared ``farkle`` core
+for path in (REPO_ROOT, PROJECT_ROOT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
 
 @pytest.fixture
 def temp_cwd(tmp_path, monkeypatch):
@@ -1,5 +1,7 @@
 import json
+import multiprocessing
 from pathlib import Path
+import pytest
 from src.player import Player
 
 def test_bank_and_record_win_loss():
@@ -32,3 +34,38 @@ def test_save_and_load_roundtrip(temp_cwd):
     assert loaded.wins == 7
     assert loaded.games == 11
     assert loaded.is_ai is False
+
+def test_concurrent_saves_merge_increments(temp_cwd):
+    base = Player("ALI")
+    base.wins, base.games = 2, 3
+    base.save()
+
+    a, b = Player("X"), Player("Y")
+    assert a.load("ali") and b.load("ali")
+    a.win()
+    a.lifetime_score += 100
+    b.lose()
+    b.lifetime_score += 50
+    a.save()
+    b.save()
+
+    merged = Player("ALI")
+    merged.load()
+    assert (merged.wins, merged.games, merged.lifetime_score) == (3, 5, 150)
+    assert (b.wins, b.games) == (3, 5), "saving refreshes the in-memory counters"
+    assert not [p for p in Path("data/players").iterdir() if p.suffix == ".tmp"]
+
+def _record_wins(n):
+    for _ in range(n):
+        p = Player("POOL", is_ai=True)
+        p.win()
+        p.save()
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+def test_parallel_workers_do_not_lose_updates(temp_cwd):
+    with multiprocessing.get_context("fork").Pool(4) as pool:
+        pool.map(_record_wins, [10] * 4)
+
+    data = json.loads(Path("data/players/pool.json").read_text())
+    assert data["wins"] == 40
+    assert data["games"] == 40
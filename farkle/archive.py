@@ -0,0 +1,382 @@
+import mmap
+import os
+import struct
+from collections.abc import Generator, Iterator
+from typing import NamedTuple
+
+from .events import Bank, Decision, Event, MatchEnd, Quit, Roll, Timeout, TurnStart
+from .solver import method_name
+
+ARCHIVE_DIR = "archive"
+MAGIC = b"FRKARC01"
+# seed, target, turns, payload length, dice, hot, seats, winner seat, scoring method
+HEADER = struct.Struct("<qIIIBBBB8s")
+OFFSET = struct.Struct("<Q")
+PLAYER = struct.Struct("<IB")  # final points, username length; the username bytes follow
+MAX_SEATS = 16  # a TURN token has four bits for the seat
+MAX_DICE = 15  # and a ROLL token four bits for the dice count
+METHOD_BYTES = 8  # the header's scoring-method field
+
+# move tokens: the high nibble is the kind, the low nibble the seat or dice count
+TURN = 0x10
+ROLL = 0x20  # followed by the faces, two per byte
+BANK, ROLL_AGAIN, QUIT = 0x30, 0x31, 0x32
+TIMEOUT = 0x40  # the decision token that follows was the timeout action
+DECISIONS = {Bank: BANK, Roll: ROLL_AGAIN, Quit: QUIT}
+
+
+class ArchivedMatch(NamedTuple):
+    """One decoded archive record.
+
+    Attributes
+    ----------
+    number : int
+        Position in the archive, from 0.
+    seed : int
+        Dice seed, -1 if the match was not seeded.
+    method : str
+        Scoring method name (see ``Game.scoring_methods``).
+    target_score, num_dice, hot_dice_enabled
+        The match rules.
+    winner : int
+        Winning seat.
+    turns : int
+        Turns played.
+    usernames : tuple[str, ...]
+        Seat order.
+    points : tuple[int, ...]
+        Final points per seat.
+    payload : bytes
+        The encoded move stream; decode it with :meth:`moves`.
+    """
+    number: int
+    seed: int
+    method: str
+    target_score: int
+    num_dice: int
+    hot_dice_enabled: bool
+    winner: int
+    turns: int
+    usernames: tuple[str, ...]
+    points: tuple[int, ...]
+    payload: bytes
+
+    def moves(self) -> Iterator[tuple]:
+        """Decode the match as ``("turn", seat)``, ``("roll", faces)``, ``("timeout",)`` and
+        ``("decision", "b"|"r"|"q")``.
+
+        Scores, Farkles, Hot Dice and automatic banks are not stored; they
+        follow from the rolls under the match's rules.
+        """
+        data = self.payload
+        i = 0
+        while i < len(data):
+            token = data[i]
+            i += 1
+            kind = token & 0xF0
+            if kind == TURN:
+                yield "turn", token & 0x0F
+            elif kind == ROLL:
+                n = token & 0x0F
+                packed = data[i:i + (n + 1) // 2]
+                i += len(packed)
+                yield "roll", tuple(packed[k // 2] >> 4 * (k % 2) & 0x0F for k in range(n))
+            elif token == TIMEOUT:
+                yield "timeout",
+            else:
+                yield "decision", "brq"[token - BANK]
+
+
+class MatchArchive:
+    """Append-only archive of whole matches with O(1) access to any match by number.
+
+    ``matches.dat`` holds a magic string and then one record per match: a
+    fixed :data:`HEADER` followed by a variable payload (each seat's name and
+    points, then the roll and decision tokens). ``matches.idx`` holds one
+    8-byte offset per match, so match ``k`` is found at offset ``8 * k``
+    without reading anything else. Both files are read through ``mmap``;
+    appends only add bytes to the ends of both files and never rewrite the
+    index.
+
+    Records are written before their index entry, so readers only ever see
+    complete records and ignore anything past the last indexed one. Before
+    its first append, the writer cuts off a record without an index entry
+    (or an entry whose record is incomplete) left by an interrupted writer;
+    opening an archive to read never changes the files. One process writes
+    an archive at a time; any number may read it, even while it is written.
+
+    Attributes
+    ----------
+    directory : str
+        Where the two files live.
+    """
+    def __init__(self, directory: str = ARCHIVE_DIR):
+        self.directory: str = directory
+        self.data_path: str = os.path.join(directory, "matches.dat")
+        self.index_path: str = os.path.join(directory, "matches.idx")
+        self._data = self._index = None  # append handles, opened on first write
+        self._offsets = bytearray()  # index entries waiting for their records to reach the data file
+        self._maps: tuple[mmap.mmap | None, mmap.mmap | None] = (None, None)
+        self._count: int = 0  # indexed records complete in the mapped data file
+        self._seeds: dict[int, list[int]] = {}
+        self._seeds_scanned: int = 0
+
+    def _repair(self):
+        """Cut the files back to the last complete indexed record (writer only, before its first append)."""
+        if not os.path.exists(self.index_path):
+            return
+        data_size = os.path.getsize(self.data_path) if os.path.exists(self.data_path) else 0
+        count = os.path.getsize(self.index_path) // OFFSET.size if data_size else 0
+        end = len(MAGIC) if data_size else 0
+        if count:
+            with open(self.index_path, "rb") as index, open(self.data_path, "rb") as data:
+                while count:
+                    index.seek((count - 1) * OFFSET.size)
+                    offset, = OFFSET.unpack(index.read(OFFSET.size))
+                    data.seek(offset)
+                    header = data.read(HEADER.size)
+                    if len(header) == HEADER.size:
+                        record_end = offset + HEADER.size + HEADER.unpack(header)[3]
+                        if record_end <= data_size:
+                            end = record_end
+                            break
+                    count -= 1
+        if os.path.getsize(self.index_path) != count * OFFSET.size:
+            os.truncate(self.index_path, count * OFFSET.size)
+        if data_size != end:
+            os.truncate(self.data_path, end)
+
+    def append(self, seed: int, method: str, target_score: int, num_dice: int, hot_dice_enabled: bool,
+               winner: int, turns: int, usernames: list[str], points: list[int], moves: bytes) -> int:
+        """Append one match and return its number.
+
+        :raises ValueError: If the match does not fit the record format (see :func:`recordable`).
+        """
+        _check_recordable(method, len(usernames), num_dice, seed, target_score)
+        if self._data is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._repair()
+            self._data = open(self.data_path, "ab")
+            self._index = open(self.index_path, "ab")
+            if self._data.tell() == 0:
+                self._data.write(MAGIC)
+        payload = bytearray()
+        for username, total in zip(usernames, points):
+            name = username.encode()
+            payload += PLAYER.pack(total, len(name))
+            payload += name
+        payload += moves
+        offset = self._data.tell()
+        self._data.write(HEADER.pack(seed, target_score, turns, len(payload), num_dice, hot_dice_enabled,
+                                     len(usernames), winner, method.encode()))
+        self._data.write(payload)
+        self._offsets += OFFSET.pack(offset)
+        return (self._index.tell() + len(self._offsets)) // OFFSET.size - 1
+
+    def flush(self):
+        """Push buffered appends to the files, the records before their index entries."""
+        if self._data is not None:
+            self._data.flush()
+            self._index.write(self._offsets)
+            self._index.flush()
+            self._offsets.clear()
+
+    def close(self):
+        self.flush()
+        for handle in (self._data, self._index):
+            if handle is not None:
+                handle.close()
+        self._data = self._index = None
+        for view in self._maps:
+            if view is not None:
+                view.close()
+        self._maps = (None, None)
+
+    def _view(self) -> tuple[mmap.mmap | None, mmap.mmap | None]:
+        """Memory maps of the data and index files, remapped when appends have grown them."""
+        self.flush()
+        data, index = self._maps
+        size = os.path.getsize(self.index_path) if os.path.exists(self.index_path) else 0
+        if size and (index is None or len(index) != size):
+            for view in self._maps:
+                if view is not None:
+                    view.close()
+            # index first: every record it lists is already in the data file
+            with open(self.index_path, "rb") as f:
+                index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            with open(self.data_path, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps = (data, index)
+            # a torn index entry, or one whose record an interrupted writer left short, is not counted
+            count = len(index) // OFFSET.size
+            while count:
+                offset, = OFFSET.unpack_from(index, (count - 1) * OFFSET.size)
+                if offset + HEADER.size <= len(data) and \
+                        offset + HEADER.size + HEADER.unpack_from(data, offset)[3] <= len(data):
+                    break
+                count -= 1
+            self._count = count
+        return self._maps
+
+    def __len__(self) -> int:
+        self._view()
+        return self._count
+
+    def __getitem__(self, number: int) -> ArchivedMatch:
+        """Decode match ``number`` (negative numbers count from the end)."""
+        data, index = self._view()
+        count = self._count
+        if number < 0:
+            number += count
+        if not 0 <= number < count:
+            raise IndexError(f"match {number} is not in the archive ({count} matches)")
+        offset, = OFFSET.unpack_from(index, number * OFFSET.size)
+        seed, target, turns, length, dice, hot, seats, winner, method = HEADER.unpack_from(data, offset)
+        position = offset + HEADER.size
+        end = position + length
+        usernames, points = [], []
+        for _ in range(seats):
+            total, size = PLAYER.unpack_from(data, position)
+            position += PLAYER.size
+            usernames.append(data[position:position + size].decode())
+            points.append(total)
+            position += size
+        return ArchivedMatch(number, seed, method.rstrip(b"\0").decode(), target, dice, bool(hot), winner, turns,
+                             tuple(usernames), tuple(points), data[position:end])
+
+    def __iter__(self) -> Iterator[ArchivedMatch]:
+        for number in range(len(self)):
+            yield self[number]
+
+    def by_seed(self, seed: int) -> list[int]:
+        """Numbers of every match played with ``seed``.
+
+        Reads only the fixed-size headers, and only those appended since the
+        previous call; the seed index is kept in memory.
+        """
+        data, index = self._view()
+        count = self._count
+        seeds = self._seeds
+        for number in range(self._seeds_scanned, count):
+            offset, = OFFSET.unpack_from(index, number * OFFSET.size)
+            match_seed, = struct.unpack_from("<q", data, offset)
+            seeds.setdefault(match_seed, []).append(number)
+        self._seeds_scanned = count
+        return list(seeds.get(seed, ()))
+
+    def recording(self, game, events: Generator[Event, str | None, bool]) -> Generator[Event, str | None, bool]:
+        """Pass a game's event stream through unchanged, appending the match once it finishes.
+
+        Decisions are read off the event that follows each :class:`Decision`,
+        so choices sent in by the caller and those made by the game are both
+        recorded. Abandoned or quit matches are not archived.
+
+        :raises ValueError: Before the first event, if the match cannot be
+            archived (see :meth:`append`).
+        """
+        _check_game(game)
+        moves = bytearray()
+        decided = False
+        choice = None
+        while True:
+            try:
+                event = events.send(choice)
+            except StopIteration as stop:
+                return stop.value
+            kind = type(event)
+            if decided and kind is not Timeout:
+                moves.append(DECISIONS[kind])
+                decided = False
+            if kind is Roll:
+                faces = [d.value for d in event.dice]
+                moves.append(ROLL | len(faces))
+                moves += bytes(faces[k] | (faces[k + 1] << 4 if k + 1 < len(faces) else 0)
+                               for k in range(0, len(faces), 2))
+            elif kind is TurnStart:
+                moves.append(TURN | event.seat)
+            elif kind is Decision:
+                decided = True
+            elif kind is Timeout:
+                moves.append(TIMEOUT)
+                decided = True  # the action taken still shows in the next event
+            elif kind is MatchEnd:
+                self.append(-1 if game.seed is None else game.seed, method_name(game.calculate_score),
+                            game.target_score, len(game.dice_pool.dice), game.hot_dice_enabled, game.turn,
+                            event.turns, [p.username for p in game.players], [p.points for p in game.players],
+                            bytes(moves))
+            choice = yield event
+
+
+def _check_recordable(method: str, seats: int, num_dice: int, seed: int, target_score: int):
+    if seats > MAX_SEATS:
+        raise ValueError(f"cannot archive a match with {seats} seats (at most {MAX_SEATS})")
+    if not 1 <= num_dice <= MAX_DICE:
+        raise ValueError(f"cannot archive a match with {num_dice} dice (1 to {MAX_DICE})")
+    if len(method.encode()) > METHOD_BYTES:
+        raise ValueError(f"cannot archive scoring method {method!r}: names are at most {METHOD_BYTES} bytes")
+    if not -2 ** 63 <= seed < 2 ** 63:
+        raise ValueError(f"cannot archive seed {seed}: seeds are 64-bit signed integers")
+    if not 0 <= target_score < 2 ** 32:
+        raise ValueError(f"cannot archive target score {target_score}: targets are 32-bit unsigned integers")
+
+
+def _check_game(game):
+    _check_recordable(method_name(game.calculate_score), len(game.players), len(game.dice_pool.dice),
+                      -1 if game.seed is None else game.seed, game.target_score)
+
+
+def recordable(game) -> bool:
+    """Whether ``game``'s matches fit the archive: at most :data:`MAX_SEATS` seats and :data:`MAX_DICE`
+    dice, a method name of at most :data:`METHOD_BYTES` bytes, a 64-bit seed and a 32-bit target.
+    """
+    try:
+        _check_game(game)
+    except ValueError:
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    import argparse
+    import contextlib
+    import time
+    from .game import Game
+    from .player import Player
+
+    parser = argparse.ArgumentParser(description="Record bot matches into an archive or look them up")
+    parser.add_argument("--directory", default=ARCHIVE_DIR)
+    commands = parser.add_subparsers(dest="command", required=True)
+    record = commands.add_parser("record", help="play seeded bot matches into the archive")
+    record.add_argument("--seeds", type=int, nargs=2, default=[0, 1000], metavar=("START", "STOP"))
+    record.add_argument("--strategies", nargs="+", default=["default", "max-ev"])
+    record.add_argument("--target", type=int, default=10000)
+    show = commands.add_parser("show", help="print one match by number")
+    show.add_argument("number", type=int)
+    find = commands.add_parser("seed", help="list the matches played with a seed")
+    find.add_argument("seed", type=int)
+    options = parser.parse_args()
+
+    archive = MatchArchive(options.directory)
+    if options.command == "record":
+        players = [Player(f"SEAT{seat + 1}", is_ai=True) for seat in range(len(options.strategies))]
+        for player, strategy in zip(players, options.strategies):
+            player.strategy = strategy
+        began = time.perf_counter()
+        with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+            for seed in range(*options.seeds):
+                for _ in Game(players=players, target_score=options.target, ai_delay=False, seed=seed,
+                              archive=archive).iter_events():
+                    pass
+        archive.close()
+        print(f"Archived {options.seeds[1] - options.seeds[0]} matches in {time.perf_counter() - began:.1f}s "
+              f"({len(MatchArchive(options.directory))} in total)")
+    elif options.command == "show":
+        match = archive[options.number]
+        print(f"Match #{match.number}: seed {match.seed}, {match.method} to {match.target_score}, "
+              f"{match.num_dice} dice, hot dice {'on' if match.hot_dice_enabled else 'off'}, {match.turns} turns")
+        for username, points in zip(match.usernames, match.points):
+            print(f"  {username}: {points}")
+        for move in match.moves():
+            print(" ", *move)
+    else:
+        print(*archive.by_seed(options.seed) or ["none"])
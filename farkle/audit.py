@@ -0,0 +1,159 @@
+import math
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from .dice import Die
+
+FACES = 6
+
+
+def chi_square_p(statistic: float) -> float:
+    """Upper-tail probability of a chi-square statistic with 5 degrees of freedom (six faces).
+
+    Uses the closed form for odd degrees of freedom, so no tables or SciPy are needed.
+    """
+    if statistic <= 0:
+        return 1.0
+    x = statistic
+    return min(1.0, math.erfc(math.sqrt(x / 2))
+               + math.sqrt(2 / math.pi) * math.exp(-x / 2) * (math.sqrt(x) + x ** 1.5 / 3))
+
+
+class FaceStats:
+    """Streaming fairness statistics for one stream of die faces.
+
+    Every update is O(1): the chi-square statistic comes from a running sum
+    of squared face counts, and the runs test (Wald–Wolfowitz on low 1–3 vs
+    high 4–6 faces, in roll order) from running counts of runs and high faces.
+
+    Attributes
+    ----------
+    counts : list[int]
+        ``counts[f - 1]`` is how often face ``f`` came up.
+    total : int
+        Dice observed.
+    rolls : int
+        Rolls (groups of dice) observed.
+    """
+    __slots__ = ("counts", "total", "rolls", "_sum_sq", "_high", "_runs", "_last_high")
+
+    def __init__(self):
+        self.counts: list[int] = [0] * FACES
+        self.total: int = 0
+        self.rolls: int = 0
+        self._sum_sq: int = 0
+        self._high: int = 0
+        self._runs: int = 0
+        self._last_high: bool | None = None
+
+    def add(self, faces: Iterable[int]):
+        """Fold in one roll's faces."""
+        counts = self.counts
+        sum_sq, high, runs, last = self._sum_sq, self._high, self._runs, self._last_high
+        total = self.total
+        for face in faces:
+            c = counts[face - 1]
+            sum_sq += 2 * c + 1  # (c + 1)^2 - c^2
+            counts[face - 1] = c + 1
+            is_high = face > 3
+            high += is_high
+            if is_high is not last:
+                runs += 1
+                last = is_high
+            total += 1
+        self.total = total
+        self._sum_sq, self._high, self._runs, self._last_high = sum_sq, high, runs, last
+        self.rolls += 1
+
+    @property
+    def chi_square(self) -> float:
+        """Pearson statistic against equal face probabilities."""
+        if not self.total:
+            return 0.0
+        return FACES * self._sum_sq / self.total - self.total
+
+    @property
+    def chi_square_p(self) -> float:
+        """Probability that fair dice deviate at least this much; small values are suspicious."""
+        return chi_square_p(self.chi_square)
+
+    @property
+    def runs_z(self) -> float:
+        """Runs-test z score: strongly negative means streaky dice, strongly positive means alternating."""
+        n, high = self.total, self._high
+        low = n - high
+        if not high or not low or n < 2:
+            return 0.0
+        product = 2 * high * low
+        mean = product / n + 1
+        variance = product * (product - n) / (n * n * (n - 1))
+        return (self._runs - mean) / math.sqrt(variance) if variance > 0 else 0.0
+
+    @property
+    def runs_p(self) -> float:
+        """Two-sided probability of a runs count at least this far from fair."""
+        return math.erfc(abs(self.runs_z) / math.sqrt(2))
+
+
+class DiceAuditor:
+    """Taps :meth:`DicePool.roll` and keeps :class:`FaceStats` per player, per game and overall.
+
+    A game attaches itself with :meth:`attach`; every roll then costs one
+    update per tracked stream. Only the most recent ``max_games`` games are
+    kept so long simulation runs stay bounded.
+
+    Attributes
+    ----------
+    overall : FaceStats
+        Every die observed.
+    players : dict[str, FaceStats]
+        Per username.
+    games : OrderedDict[int, FaceStats]
+        Per game number, oldest first.
+    """
+    def __init__(self, max_games: int = 20):
+        self.overall: FaceStats = FaceStats()
+        self.players: dict[str, FaceStats] = {}
+        self.games: OrderedDict[int, FaceStats] = OrderedDict()
+        self.max_games: int = max_games
+        self._next_game: int = 1
+
+    def attach(self, game) -> int:
+        """Start auditing ``game``'s dice pool under a new game number, which is returned."""
+        number = self._next_game
+        self._next_game += 1
+        stats = self.games[number] = FaceStats()
+        if len(self.games) > self.max_games:
+            self.games.popitem(last=False)
+        overall, players = self.overall, self.players
+
+        def observe(dice: list[Die]):
+            username = game.players[game.turn].username
+            player = players.get(username)
+            if player is None:
+                player = players[username] = FaceStats()
+            faces = [d.value for d in dice]
+            overall.add(faces)
+            player.add(faces)
+            stats.add(faces)
+
+        game.dice_pool.observer = observe
+        return number
+
+    def render(self) -> str:
+        """Fairness table for every player and the recent games."""
+        header = (f"{'Scope': <12} {'Dice': >6}" + "".join(f"{f'{face}s %': >6}" for face in range(1, FACES + 1))
+                  + f" {'Chi2': >7} {'p(chi2)': >8} {'Runs z': >7} {'p(runs)': >8}")
+        lines = [header, "-" * len(header)]
+
+        def row(label: str, stats: FaceStats):
+            shares = "".join(f"{100 * c / stats.total:6.1f}" for c in stats.counts) if stats.total else " " * 36
+            lines.append(f"{label: <12} {stats.total: >6} {shares} {stats.chi_square:7.2f} {stats.chi_square_p:8.3f}"
+                         f" {stats.runs_z:7.2f} {stats.runs_p:8.3f}")
+
+        row("all", self.overall)
+        for username, stats in sorted(self.players.items()):
+            row(username, stats)
+        for number, stats in self.games.items():
+            row(f"game {number}", stats)
+        return "\n".join(lines)
@@ -0,0 +1,74 @@
+import random
+from array import array
+from collections.abc import Iterable
+
+from .strategy import strength_order
+
+BANDIT = "bandit"  # the strategy name that puts a bot in portfolio mode
+PORTFOLIO = tuple(strength_order)  # the strategies a bandit bot picks from, one per match
+
+
+class Bandit:
+    """Per-opponent Thompson sampling over the strategies in :data:`PORTFOLIO`.
+
+    Before each match the bot draws a win rate for every strategy from
+    ``Beta(wins + 1, losses + 1)`` of its record with that strategy against
+    the opponents at the table and plays the best draw; after the match that
+    strategy's record against each opponent gets the result. Strategies that
+    win against a given player get picked more against that player, while
+    rarely tried ones still get sampled now and then.
+
+    Attributes
+    ----------
+    stats : dict[str, array]
+        Per opponent username, ``array("I")`` of ``[wins, games]`` for each
+        strategy in :data:`PORTFOLIO` order.
+    arm : str
+        The strategy picked for the current match.
+    """
+    __slots__ = ("stats", "arm")
+
+    def __init__(self, stats: dict[str, array] | None = None):
+        self.stats: dict[str, array] = {} if stats is None else stats
+        self.arm: str = PORTFOLIO[-1]
+
+    def choose(self, opponents: Iterable[str], rng: random.Random | None = None) -> str:
+        """Pick :attr:`arm` for a match against ``opponents`` (usernames) and return it."""
+        draw = (rng or random).betavariate
+        totals = [0] * (2 * len(PORTFOLIO))
+        for opponent in opponents:
+            counts = self.stats.get(opponent)
+            if counts is not None:
+                for k, count in enumerate(counts):
+                    totals[k] += count
+        samples = [draw(totals[2 * k] + 1, totals[2 * k + 1] - totals[2 * k] + 1) for k in range(len(PORTFOLIO))]
+        self.arm = PORTFOLIO[samples.index(max(samples))]
+        return self.arm
+
+    def update(self, opponents: Iterable[str], won: bool):
+        """Record the finished match for :attr:`arm` against each opponent."""
+        k = 2 * PORTFOLIO.index(self.arm)
+        for opponent in opponents:
+            counts = self.stats.get(opponent)
+            if counts is None:
+                counts = self.stats[opponent] = array("I", [0]) * (2 * len(PORTFOLIO))
+            counts[k] += won
+            counts[k + 1] += 1
+
+    def to_dict(self) -> dict:
+        return {"arms": list(PORTFOLIO), "opponents": {name: list(counts) for name, counts in self.stats.items()}}
+
+    @staticmethod
+    def from_dict(data: dict | None) -> "Bandit":
+        """Rebuild saved stats; strategies no longer in :data:`PORTFOLIO` are dropped and new ones start at 0."""
+        data = data or {}
+        arms = data.get("arms", [])
+        stats = {}
+        for name, saved in data.get("opponents", {}).items():
+            counts = array("I", [0]) * (2 * len(PORTFOLIO))
+            for k, arm in enumerate(arms):
+                if arm in PORTFOLIO:
+                    slot = 2 * PORTFOLIO.index(arm)
+                    counts[slot], counts[slot + 1] = saved[2 * k], saved[2 * k + 1]
+            stats[name] = counts
+        return Bandit(stats)
@@ -0,0 +1,298 @@
+import csv
+import json
+import os
+import re
+import tempfile
+from collections.abc import Iterator
+from typing import NamedTuple
+
+from .player import Player, _locked
+from .rating import MU, SIGMA
+
+FIELDS = ("username", "lifetime_score", "wins", "games", "is_ai", "rating_mu", "rating_sigma")
+USERNAME = re.compile(r"[A-Za-z0-9_-]{1,32}")  # safe as a file name and as one command word
+TRUE, FALSE = {"true", "1", "yes", "y"}, {"false", "0", "no", "n", ""}
+
+
+class ImportReport(NamedTuple):
+    """Outcome of :func:`import_players`.
+
+    Attributes
+    ----------
+    written : int
+        Player files created (or, with ``replace``, overwritten).
+    duplicates : int
+        Records skipped because the player already exists in the store or
+        appeared earlier in the file (always 0 with ``replace``).
+    invalid : int
+        Records rejected by validation.
+    errors : tuple[str, ...]
+        ``"line N: reason"`` for the first rejected records.
+    """
+    written: int
+    duplicates: int
+    invalid: int
+    errors: tuple[str, ...]
+
+
+class ExportReport(NamedTuple):
+    """Outcome of :func:`export_players`.
+
+    Attributes
+    ----------
+    written : int
+        Players written to the export file.
+    skipped : tuple[str, ...]
+        ``"file: reason"`` for each save that vanished or could not be read.
+    """
+    written: int
+    skipped: tuple[str, ...]
+
+
+def _format(path: str, fmt: str | None) -> str:
+    fmt = fmt or ("csv" if path.lower().endswith(".csv") else "jsonl")
+    if fmt not in ("csv", "jsonl"):
+        raise ValueError(f"unknown format {fmt!r}; use csv or jsonl")
+    return fmt
+
+
+def read_records(path: str, fmt: str | None = None) -> Iterator[tuple[int, dict]]:
+    """Stream ``(line number, raw record)`` pairs from a JSON-lines or CSV file, one line in memory at a time.
+
+    :param fmt: ``"csv"`` or ``"jsonl"``; by default ``.csv`` files are CSV and anything else JSON lines.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if _format(path, fmt) == "csv":
+            reader = csv.DictReader(f)
+            for record in reader:
+                yield reader.line_num, record
+            return
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as error:
+                record = error  # reported by validate() with the line number
+            yield number, record
+
+
+def _count(record: dict, field: str) -> int:
+    value = record.get(field)
+    if value is None or value == "":
+        return 0
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise ValueError(f"{field} must be a whole number")
+    try:
+        value = int(value)
+    except ValueError:
+        raise ValueError(f"{field} must be a whole number, got {value!r}") from None
+    if value < 0:
+        raise ValueError(f"{field} must not be negative")
+    return value
+
+
+def _number(record: dict, field: str, default: float) -> float:
+    value = record.get(field)
+    if value is None or value == "":
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{field} must be a number, got {value!r}") from None
+
+
+def validate(record) -> dict:
+    """Check one raw record and return it in the player save format (see :meth:`Player.save`).
+
+    Missing stats default to 0, ``is_ai`` to False and the rating to a new
+    player's.
+
+    :raises ValueError: Describing the first problem found.
+    """
+    if isinstance(record, json.JSONDecodeError):
+        raise ValueError(f"not JSON ({record.msg})")
+    if not isinstance(record, dict):
+        raise ValueError("not a record")
+    username = record.get("username")
+    if not isinstance(username, str) or not USERNAME.fullmatch(username.strip()):
+        raise ValueError(f"username must be 1-32 letters, digits, '-' or '_', got {username!r}")
+    data = {"username": username.strip().lower()}
+    for field in ("lifetime_score", "wins", "games"):
+        data[field] = _count(record, field)
+    if data["wins"] > data["games"]:
+        raise ValueError("wins exceed games")
+    is_ai = record.get("is_ai", False)
+    if isinstance(is_ai, str):
+        if is_ai.strip().lower() not in TRUE | FALSE:
+            raise ValueError(f"is_ai must be true or false, got {is_ai!r}")
+        is_ai = is_ai.strip().lower() in TRUE
+    elif not isinstance(is_ai, bool):
+        raise ValueError(f"is_ai must be true or false, got {is_ai!r}")
+    data["is_ai"] = is_ai
+    sigma = _number(record, "rating_sigma", SIGMA)
+    if sigma <= 0:
+        raise ValueError("rating_sigma must be positive")
+    data["rating"] = {"mu": _number(record, "rating_mu", MU), "sigma": sigma}
+    return data
+
+
+def _sync_directory(directory: str):
+    """Make the batch's renames and links durable with one fsync of the directory (POSIX only)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_batch(directory: str, batch: list[dict], replace: bool) -> tuple[int, int]:
+    """Write one batch of validated records; return ``(written, duplicates)``.
+
+    New players are created by hard-linking a finished temporary file into
+    place, which fails atomically if the name is taken: that single check
+    deduplicates against both the existing store and earlier records
+    without remembering any names. On file systems without hard links the
+    name is checked and the file renamed into place under the player's
+    lock instead. ``replace`` overwrites under the player's lock, like
+    :meth:`Player.save`.
+    """
+    written = duplicates = 0
+    links = True
+    for data in batch:
+        username = data["username"]
+        path = os.path.join(directory, f"{username}.json")
+        if not replace and os.path.exists(path):
+            duplicates += 1
+            continue
+        fd, temp = tempfile.mkstemp(dir=directory, prefix=f".{username}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(json.dumps(data))
+            if replace:
+                with _locked(directory, username, exclusive=True):
+                    os.replace(temp, path)
+                    temp = None
+            else:
+                placed = None
+                if links:
+                    try:
+                        os.link(temp, path)
+                        placed = True
+                    except FileExistsError:
+                        placed = False
+                    except OSError:  # no hard links here; stop trying for the rest of the batch
+                        links = False
+                if placed is None:
+                    with _locked(directory, username, exclusive=True):
+                        placed = not os.path.exists(path)
+                        if placed:
+                            os.replace(temp, path)
+                            temp = None
+                if not placed:
+                    duplicates += 1
+                    continue
+            written += 1
+        finally:
+            if temp is not None:
+                os.unlink(temp)
+    _sync_directory(directory)
+    return written, duplicates
+
+
+def import_players(path: str, directory: str | None = None, replace: bool = False, batch_size: int = 1000,
+                   fmt: str | None = None, max_errors: int = 20) -> ImportReport:
+    """Stream player records from ``path`` into the player store in one pass and constant memory.
+
+    Each record is validated as it is read and queued; every ``batch_size``
+    valid records are written together (see :func:`_write_batch`) and
+    dropped from memory. Players already in the store, or repeated later in
+    the file, are skipped and counted unless ``replace`` is set, in which
+    case the last record for a name wins.
+
+    :param directory: The player store (default: :attr:`Player.directory`).
+    :param max_errors: How many rejected records to describe in the report.
+    :rtype: ImportReport
+    """
+    directory = Player.directory if directory is None else directory
+    os.makedirs(directory, exist_ok=True)
+    batch: list[dict] = []
+    pending: set[str] = set()  # names in the unwritten batch, so repeats inside it are caught too
+    written = duplicates = invalid = 0
+    errors: list[str] = []
+    for number, record in read_records(path, fmt):
+        try:
+            data = validate(record)
+        except ValueError as error:
+            invalid += 1
+            if len(errors) < max_errors:
+                errors.append(f"line {number}: {error}")
+            continue
+        if data["username"] in pending:
+            if not replace:
+                duplicates += 1
+                continue
+            batch = [queued for queued in batch if queued["username"] != data["username"]]
+        batch.append(data)
+        pending.add(data["username"])
+        if len(batch) >= batch_size:
+            done, skipped = _write_batch(directory, batch, replace)
+            written, duplicates = written + done, duplicates + skipped
+            batch, pending = [], set()
+    if batch:
+        done, skipped = _write_batch(directory, batch, replace)
+        written, duplicates = written + done, duplicates + skipped
+    return ImportReport(written, duplicates, invalid, tuple(errors))
+
+
+def export_players(path: str, directory: str | None = None, fmt: str | None = None) -> ExportReport:
+    """Stream every saved player in ``directory`` to a JSON-lines or CSV file.
+
+    Saves are read one at a time in directory order, without taking player
+    locks, so memory does not grow with the store. Saves deleted mid-export
+    or not holding a JSON object are skipped and reported. The file is
+    written to a temporary name and moved into place once complete.
+
+    :rtype: ExportReport
+    """
+    directory = Player.directory if directory is None else directory
+    fmt = _format(path, fmt)
+    target = os.path.dirname(os.path.abspath(path))
+    fd, temp = tempfile.mkstemp(dir=target, suffix=".tmp")
+    count = 0
+    skipped: list[str] = []
+    try:
+        with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f) if fmt == "csv" else None
+            if writer is not None:
+                writer.writerow(FIELDS)
+            if os.path.isdir(directory):
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.startswith(".") or not entry.name.endswith(".json") or not entry.is_file():
+                            continue
+                        username = entry.name[:-5]
+                        try:
+                            data = Player._read(entry.path)  # saves are atomic renames, so no lock is needed
+                        except (OSError, ValueError) as error:
+                            skipped.append(f"{entry.name}: {getattr(error, 'strerror', None) or error}")
+                            continue
+                        if not isinstance(data, dict):
+                            skipped.append(f"{entry.name}: " + ("no longer saved" if data is None else "not a save"))
+                            continue
+                        rating = data.get("rating") or {}
+                        row = (data.get("username", username).upper(), data.get("lifetime_score", 0),
+                               data.get("wins", 0), data.get("games", 0), data.get("is_ai", False),
+                               rating.get("mu", MU), rating.get("sigma", SIGMA))
+                        if writer is not None:
+                            writer.writerow(row)
+                        else:
+                            f.write(json.dumps(dict(zip(FIELDS, row))) + "\n")
+                        count += 1
+        os.replace(temp, path)
+    except BaseException:
+        os.unlink(temp)
+        raise
+    return ExportReport(count, tuple(skipped))
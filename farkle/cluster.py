@@ -0,0 +1,321 @@
+import contextlib
+import os
+import threading
+import time
+from collections import deque
+from multiprocessing import AuthenticationError, Process
+from multiprocessing.connection import Client, Listener
+from typing import NamedTuple
+
+from .events import MatchEnd
+from .game import Game
+from .player import Player
+
+
+class MatchConfig(NamedTuple):
+    """The match settings every seed of a batch is played with, mirroring :class:`Game`'s arguments.
+
+    Attributes
+    ----------
+    strategies : tuple[str, ...]
+        One bot strategy name (see ``farkle.strategy.strategies``) per seat.
+    target_score, num_dice, hot_dice_enabled
+        As for :class:`Game`.
+    method : str
+        Key of ``Game.scoring_methods``.
+    """
+    strategies: tuple[str, ...] = ("default", "max-ev")
+    target_score: int = 10000
+    num_dice: int = 6
+    hot_dice_enabled: bool = True
+    method: str = "default"
+
+
+class Summary(NamedTuple):
+    """Additive totals for a batch of matches; summaries of disjoint seed ranges :meth:`merge` exactly.
+
+    Attributes
+    ----------
+    games : int
+        Matches played.
+    turns : int
+        Turns over all matches.
+    wins : tuple[int, ...]
+        Matches won per seat.
+    points : tuple[int, ...]
+        Final points per seat, summed over matches.
+    """
+    games: int
+    turns: int
+    wins: tuple[int, ...]
+    points: tuple[int, ...]
+
+    @staticmethod
+    def empty(seats: int) -> "Summary":
+        return Summary(0, 0, (0,) * seats, (0,) * seats)
+
+    def merge(self, other: "Summary") -> "Summary":
+        return Summary(self.games + other.games, self.turns + other.turns,
+                       tuple(a + b for a, b in zip(self.wins, other.wins)),
+                       tuple(a + b for a, b in zip(self.points, other.points)))
+
+
+def play_range(config: MatchConfig, start: int, stop: int) -> Summary:
+    """Play one silent bot match per seed in ``range(start, stop)`` and total the results.
+
+    Every match is a real :class:`Game` seeded with its seed and played by
+    fresh players, so the same range gives the same summary on any machine
+    or worker however it is batched (``"bandit"`` seats start every match
+    without a record).
+    """
+    calculate_score = Game.scoring_methods[config.method]
+    seats = len(config.strategies)
+    games = turns = 0
+    wins, points = [0] * seats, [0] * seats
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        for seed in range(start, stop):
+            players = [Player(f"SEAT{seat + 1}", is_ai=True) for seat in range(seats)]
+            for player, strategy in zip(players, config.strategies):
+                player.strategy = strategy
+            game = Game(calculate_score, players, config.target_score, config.num_dice,
+                        config.hot_dice_enabled, ai_delay=False, seed=seed)
+            for event in game.iter_events():
+                if type(event) is MatchEnd:
+                    wins[players.index(event.winner)] += 1
+                    turns += event.turns
+            games += 1
+            for seat, player in enumerate(players):
+                points[seat] += player.points
+    return Summary(games, turns, tuple(wins), tuple(points))
+
+
+class Coordinator:
+    """Split a seed range into batches and farm them out to :func:`work` processes over TCP.
+
+    Workers connect whenever they like (before, during or after other workers
+    fail) and are handed one batch at a time as ``("batch", config, start,
+    stop)``; they answer ``("done", start, summary)``. A batch whose worker
+    disconnects goes back to the queue. With ``lease``, a batch held longer
+    than that many seconds is also handed to the next idle worker and the
+    first answer wins, so a hung machine cannot stall the run. Summaries are
+    merged in seed order once every batch is in.
+
+    Connections are authenticated with ``authkey`` and messages are pickles,
+    so anyone holding the key can run code on the other end: use a long
+    random key, keep it secret and only listen on trusted networks.
+
+    Attributes
+    ----------
+    config : MatchConfig
+        Settings every match is played with.
+    batches : list[tuple[int, int]]
+        The ``(start, stop)`` seed ranges.
+    address : tuple[str, int]
+        Where workers connect (the real port when 0 was requested).
+    """
+    def __init__(self, config: MatchConfig, seeds: range, authkey: bytes, chunk: int = 100,
+                 address: tuple[str, int] = ("127.0.0.1", 0), lease: float | None = None):
+        if seeds.step != 1:
+            raise ValueError("seeds must be a contiguous range")
+        if not authkey:
+            raise ValueError("an authkey is required")
+        self.config: MatchConfig = config
+        self.batches: list[tuple[int, int]] = [(s, min(s + chunk, seeds.stop))
+                                               for s in range(seeds.start, seeds.stop, chunk)]
+        self.lease: float | None = lease
+        self._authkey: bytes = authkey
+        self._listener = Listener(address, authkey=authkey)
+        self.address: tuple[str, int] = self._listener.address
+        self._pending: deque[tuple[int, int]] = deque(self.batches)
+        self._leased: dict[tuple[int, int], float] = {}
+        self._done: dict[int, Summary] = {}
+        self._closed: bool = False
+        self._cond = threading.Condition()
+
+    @property
+    def finished(self) -> bool:
+        return len(self._done) == len(self.batches)
+
+    def _next_batch(self) -> tuple[int, int] | None:
+        """Hand out a queued batch, or re-lease an overdue one; None if there is nothing to do now."""
+        now = time.monotonic()
+        while self._pending:
+            batch = self._pending.popleft()
+            if batch[0] not in self._done:
+                self._leased[batch] = now
+                return batch
+        if self.lease is not None:
+            for batch, since in self._leased.items():
+                if now - since > self.lease:
+                    self._leased[batch] = now
+                    return batch
+        return None
+
+    def _serve(self, conn):
+        with conn:
+            while True:
+                with self._cond:
+                    batch = None
+                    while not (self.finished or self._closed):
+                        batch = self._next_batch()
+                        if batch is not None:
+                            break
+                        self._cond.wait(self.lease)
+                if batch is None:
+                    with contextlib.suppress(OSError):
+                        conn.send(("stop",))
+                    return
+                try:
+                    conn.send(("batch", self.config, *batch))
+                    _, start, summary = conn.recv()
+                except (EOFError, OSError):
+                    with self._cond:
+                        if batch[0] not in self._done:
+                            self._leased.pop(batch, None)
+                            self._pending.appendleft(batch)
+                            self._cond.notify_all()
+                    return
+                with self._cond:
+                    self._done.setdefault(start, summary)
+                    self._leased.pop(batch, None)
+                    self._cond.notify_all()
+
+    def _accept(self):
+        while True:
+            try:
+                conn = self._listener.accept()
+            except AuthenticationError:
+                continue
+            except OSError:
+                return
+            if self._closed:
+                conn.close()
+                return
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def run(self, timeout: float | None = None) -> Summary:
+        """Serve workers until every batch is summarized and return the merged summary.
+
+        :param timeout: Give up after this many seconds.
+        :raises TimeoutError: If batches are still missing after ``timeout``.
+        """
+        accepter = threading.Thread(target=self._accept, daemon=True)
+        accepter.start()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            with self._cond:
+                while not self.finished:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"{len(self.batches) - len(self._done)} of {len(self.batches)} "
+                                           f"batches unfinished after {timeout}s")
+                    self._cond.wait(remaining)
+        finally:
+            with self._cond:
+                self._closed = True
+                self._cond.notify_all()
+            # accept() does not notice close(); wake it with one last connection
+            with contextlib.suppress(OSError):
+                Client(self.address, authkey=self._authkey).close()
+            accepter.join()
+            self._listener.close()
+        total = Summary.empty(len(self.config.strategies))
+        for start, _ in self.batches:
+            total = total.merge(self._done[start])
+        return total
+
+
+def work(address: tuple[str, int], authkey: bytes, connect_timeout: float = 10.0) -> int:
+    """Run as a worker: play every batch the coordinator at ``address`` sends until told to stop.
+
+    Workers keep no state between batches, so one can be killed and another
+    started at any time. Connection attempts are retried for
+    ``connect_timeout`` seconds so workers may start before the coordinator.
+
+    :return: The number of batches played.
+    :rtype: int
+    """
+    deadline = time.monotonic() + connect_timeout
+    while True:
+        try:
+            conn = Client(address, authkey=authkey)
+            break
+        except ConnectionRefusedError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.1)
+    played = 0
+    with conn:
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                return played
+            if message[0] == "stop":
+                return played
+            _, config, start, stop = message
+            conn.send(("done", start, play_range(config, start, stop)))
+            played += 1
+
+
+def run_local(config: MatchConfig, seeds: range, workers: int | None = None, chunk: int = 100,
+              timeout: float | None = None) -> Summary:
+    """Play ``seeds`` with a coordinator and ``workers`` worker processes on localhost, under a one-off key."""
+    authkey = os.urandom(32)
+    coordinator = Coordinator(config, seeds, authkey, chunk)
+    processes = [Process(target=work, args=(coordinator.address, authkey), daemon=True)
+                 for _ in range(workers or os.cpu_count() or 1)]
+    for process in processes:
+        process.start()
+    try:
+        return coordinator.run(timeout)
+    finally:
+        # connected workers are told to stop; any still retrying to connect are not needed
+        for process in processes:
+            process.join(1)
+            if process.is_alive():
+                process.terminate()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Play seeded bot matches across machines")
+    parser.add_argument("--authkey", default=os.environ.get("FARKLE_AUTHKEY"),
+                        help="shared secret for coordinator and workers (default: $FARKLE_AUTHKEY)")
+    commands = parser.add_subparsers(dest="role", required=True)
+    serve = commands.add_parser("coordinator", help="hand out seed ranges and merge the summaries")
+    serve.add_argument("--host", default="127.0.0.1",
+                       help="interface to listen on; only expose it on a trusted network")
+    serve.add_argument("--port", type=int, default=6000)
+    serve.add_argument("--seeds", type=int, nargs=2, default=[0, 10000], metavar=("START", "STOP"))
+    serve.add_argument("--chunk", type=int, default=100)
+    serve.add_argument("--lease", type=float, default=None)
+    serve.add_argument("--strategies", nargs="+", default=["default", "max-ev"])
+    serve.add_argument("--target", type=int, default=10000)
+    serve.add_argument("--dice", type=int, default=6)
+    serve.add_argument("--no-hot-dice", action="store_true")
+    serve.add_argument("--method", choices=list(Game.scoring_methods), default="default")
+    join = commands.add_parser("worker", help="play seed ranges for a coordinator")
+    join.add_argument("--host", default="127.0.0.1")
+    join.add_argument("--port", type=int, default=6000)
+    options = parser.parse_args()
+    if not options.authkey:
+        parser.error("an authkey is required: pass --authkey or set FARKLE_AUTHKEY")
+    authkey = options.authkey.encode()
+
+    if options.role == "worker":
+        print(f"Played {work((options.host, options.port), authkey)} batches")
+    else:
+        config = MatchConfig(tuple(options.strategies), options.target, options.dice, not options.no_hot_dice,
+                             options.method)
+        coordinator = Coordinator(config, range(*options.seeds), authkey, options.chunk,
+                                  (options.host, options.port), options.lease)
+        print(f"Waiting for workers on {coordinator.address[0]}:{coordinator.address[1]}")
+        began = time.perf_counter()
+        summary = coordinator.run()
+        print(f"{summary.games} matches in {time.perf_counter() - began:.1f}s, "
+              f"{summary.turns / summary.games:.1f} turns per match")
+        for seat, strategy in enumerate(config.strategies):
+            print(f"  seat {seat + 1} ({strategy}): {summary.wins[seat] / summary.games:.1%} wins, "
+                  f"{summary.points[seat] / summary.games:.0f} mean points")
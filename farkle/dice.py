@@ -1,5 +1,4 @@
 import random
-import time
 
 class Die:
     """A six-sided die.
@@ -7,13 +6,13 @@ class Die:
     Attributes
     ----------
     value : int
-        The current face value (1–6). Initialized by rolling once.
+        The current face value (1–6).
+    rng : random.Random | None
+        Private generator to roll with, or None for the shared ``random`` module.
     """
-    def __init__(self, value: int = 1):
+    def __init__(self, value: int = 1, rng: random.Random | None = None):
         self.value: int = value
-
-        # Ensure randomness
-        random.seed(time.time())
+        self.rng: random.Random | None = rng
 
     def roll(self) -> int:
         """Roll the die and update its face value.
@@ -21,7 +20,7 @@ class Die:
         :return: The new face value in [1, 6].
         :rtype: int
         """
-        self.value = random.randint(1, 6)
+        self.value = (random if self.rng is None else self.rng).randint(1, 6)
         return self.value
 
 
@@ -34,9 +33,16 @@ class DicePool:
         The managed dice (default: six dice).
     remaining_dice : int
         How many dice are available to roll this turn (1–6).
+    rng : random.Random | None
+        Generator shared by every die, e.g. ``random.Random(seed)`` for a
+        reproducible match; None rolls with the ``random`` module.
+    observer : callable | None
+        Called with every roll's dice, e.g. by :class:`~farkle.audit.DiceAuditor`.
     """
-    def __init__(self, length: int = 6):
-        self.dice: list[Die] = [Die() for _ in range(length)]
+    def __init__(self, length: int = 6, rng: random.Random | None = None):
+        self.rng: random.Random | None = rng
+        self.observer = None
+        self.dice: list[Die] = [Die(rng=rng) for _ in range(length)]
         self.remaining_dice: int = length
 
     def roll(self) -> list[Die]:
@@ -50,7 +56,10 @@ class DicePool:
         for i in range(self.remaining_dice):
             self.dice[i].roll()
         # print(f"debug dice: {[die.value for die in self.dice]} | rem: {self.remaining_dice}")
-        return self.dice[:self.remaining_dice]
+        rolled = self.dice[:self.remaining_dice]
+        if self.observer is not None:
+            self.observer(rolled)
+        return rolled
 
     def reset(self) -> None:
         """Reset the pool to allow rolling all six dice again.
@@ -0,0 +1,182 @@
+from itertools import accumulate
+from math import gcd, isqrt
+from operator import mul
+
+from .odds import turn_distribution
+from .results import ResultStore
+from .solver import method_name
+from .strategy import strategies
+
+
+class GameLength:
+    """Distribution of how many turns a match lasts.
+
+    Attributes
+    ----------
+    players : int
+        Seats in the match.
+    survival : list[float]
+        ``survival[m]`` is the probability the match is still running after
+        ``m`` turns (``survival[0] == 1``). The list stops once that drops
+        below the tolerance it was computed to.
+    """
+    def __init__(self, players: int, survival: list[float]):
+        self.players: int = players
+        self.survival: list[float] = survival
+
+    @property
+    def mean(self) -> float:
+        """Expected turns (the sum of the survival function)."""
+        return sum(self.survival)
+
+    def percentile(self, q: float) -> int:
+        """Smallest number of turns by which at least a ``q`` share of matches (0–1) has finished."""
+        for turns, alive in enumerate(self.survival):
+            if 1.0 - alive >= q:
+                return turns
+        return len(self.survival)
+
+    def wall_clock(self, seconds_per_turn: float, q: float | None = None) -> float:
+        """Seconds a match takes on average, or at percentile ``q``, at ``seconds_per_turn``."""
+        return seconds_per_turn * (self.mean if q is None else self.percentile(q))
+
+    def render(self, seconds_per_turn: float | None = None) -> str:
+        lines = [f"{self.players} players: mean {self.mean:.1f} turns ({self.mean / self.players:.1f} rounds)"]
+        for q in (0.5, 0.9, 0.99, 0.999):
+            turns = self.percentile(q)
+            clock = f", {seconds_per_turn * turns:.1f}s" if seconds_per_turn is not None else ""
+            lines.append(f"  p{q * 100:g}: {turns} turns{clock}")
+        if seconds_per_turn is not None:
+            lines.append(f"  expected wall clock {self.wall_clock(seconds_per_turn):.1f}s "
+                         f"at {seconds_per_turn * 1000:.2f} ms per turn")
+        return "\n".join(lines)
+
+
+def _convolve(a: list[float], b: list[float], size: int) -> list[float]:
+    """The first ``size`` entries of the convolution of ``a`` and ``b`` (zero entries of ``a`` are skipped)."""
+    total = [0.0] * size
+    for i, p in enumerate(a):
+        if p:
+            for j in range(min(len(b), size - i)):
+                total[i + j] += p * b[j]
+    return total
+
+
+def turns_to_target(turn_scores: dict[int, float], target_score: int, tolerance: float = 1e-9,
+                    max_turns: int = 100000) -> list[float]:
+    """``result[t]`` is the probability that ``t`` turns bank less than ``target_score`` in total.
+
+    The total after ``t`` turns is the ``t``-fold convolution power of the
+    turn distribution ``P``. Scores are never negative, so only totals below
+    the target matter and every power is truncated there: vectors hold
+    ``target_score / step`` entries (``step`` being the gcd of all turn
+    scores). Rather than convolving once per turn, the powers are split
+    baby-step giant-step with a block of ``B ~ sqrt(expected turns)``: the
+    baby powers ``P^0 .. P^B`` are built once, the giant powers ``P^(aB)``
+    by one convolution with ``P^B`` per block, and ``result[aB + b]`` is a
+    dot product of ``P^(aB)`` with the cumulative ``P^b``. That is about
+    ``2 sqrt(T)`` convolutions instead of ``T`` for ``T`` turns, with no
+    sampling. (An FFT would need its wraparound undone after every product
+    to keep the truncation, and brings no speedup in pure Python at these
+    sizes.)
+
+    :raises ValueError: If no turn ever banks points, so the target is never reached.
+    """
+    step = 0
+    for score in turn_scores:
+        step = gcd(step, score)
+    if step == 0 or turn_scores.get(0, 0.0) >= 1.0:
+        raise ValueError("turns never bank points")
+    size = -(-target_score // step)  # totals 0, step, ... below the target
+    kernel = [0.0] * size
+    for score, p in turn_scores.items():
+        if score // step < size:
+            kernel[score // step] += p
+    mean = sum(score * p for score, p in turn_scores.items())
+    block = max(1, isqrt(-(-target_score // max(1, int(mean)))))
+
+    powers = [[1.0] + [0.0] * (size - 1)]  # P^0 .. P^block
+    for _ in range(block):
+        powers.append(_convolve(kernel, powers[-1], size))
+    # tails[b][x]: probability that b turns bank less than the target minus x * step
+    tails = [list(accumulate(power))[::-1] for power in powers[:block]]
+    giant = powers[0]
+    result = []
+    while True:
+        for tail in tails:
+            result.append(sum(map(mul, giant, tail)))
+            if result[-1] <= tolerance or len(result) > max_turns:
+                return result
+        giant = _convolve(giant, powers[block], size)
+
+
+def game_length(turn_scores: dict[int, float], target_score: int, players: int = 2,
+                tolerance: float = 1e-9) -> GameLength:
+    """Match length distribution when every seat banks ``turn_scores`` per turn independently.
+
+    A match ends on the first turn that brings its player to the target (see
+    :meth:`Game._match_events`). After ``m`` turns seat ``i`` has played
+    ``ceil((m - i) / players)`` of them, so the match is still running with
+    probability ``prod_i P(that many turns stay below the target)``.
+    """
+    alive = turns_to_target(turn_scores, target_score, tolerance / players)
+    survival = [1.0]
+    while survival[-1] > tolerance:
+        m = len(survival)
+        p = 1.0
+        for seat in range(players):
+            played = max(0, -(-(m - seat) // players))
+            p *= alive[played] if played < len(alive) else 0.0
+        survival.append(p)
+    return GameLength(players, survival[:-1] if survival[-1] == 0.0 else survival)
+
+
+def seconds_per_turn(store: ResultStore, method: str | None = None, target: int | None = None) -> float | None:
+    """Measured wall-clock seconds per turn over stored matches (optionally one scoring method/target).
+
+    ``method`` may be any key of ``Game.scoring_methods``; aliases such as
+    ``"default"`` match the name the store records (see :func:`~farkle.solver.method_name`).
+    """
+    from .game import Game
+    if method in Game.scoring_methods:
+        method = method_name(Game.scoring_methods[method])
+    seconds = turns = 0
+    for chunk in store.chunks():
+        c = chunk.columns
+        code = chunk.methods.index(method) if method in chunk.methods else -1
+        for row in range(len(chunk)):
+            if (method is None or c["method"][row] == code) and (target is None or c["target"][row] == target):
+                seconds += c["duration"][row]
+                turns += c["turns"][row]
+    return seconds / turns if turns else None
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    from .game import Game
+    from .results import RESULTS_DIR
+
+    parser = argparse.ArgumentParser(description="Estimate how many turns (and seconds) matches last")
+    parser.add_argument("--target", type=int, default=10000)
+    parser.add_argument("--method", choices=list(Game.scoring_methods), default="default")
+    parser.add_argument("--dice", type=int, default=6)
+    parser.add_argument("--no-hot-dice", action="store_true")
+    parser.add_argument("--strategy", choices=list(strategies), default="default")
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--seconds-per-turn", type=float, default=None,
+                        help="per-turn latency; measured from --results when omitted")
+    parser.add_argument("--results", default=RESULTS_DIR)
+    options = parser.parse_args()
+
+    began = time.perf_counter()
+    turn = turn_distribution(strategies[options.strategy], Game.scoring_methods[options.method], options.dice,
+                             not options.no_hot_dice, options.target)
+    length = game_length(turn.probabilities, options.target, options.players)
+    latency = options.seconds_per_turn
+    if latency is None:
+        latency = seconds_per_turn(ResultStore(options.results), options.method, options.target)
+    print(f"'{options.strategy}' banks {turn.mean:.0f} points per turn on average "
+          f"(exact to {turn.error:.1e} over {turn.states} turn states)")
+    print(length.render(latency))
+    print(f"({time.perf_counter() - began:.1f}s)")
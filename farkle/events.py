@@ -0,0 +1,121 @@
+from .dice import Die
+from .player import Player
+
+
+class Event:
+    """Base of the records yielded by :meth:`Game.iter_events`.
+
+    A game owns one record of each type and refills it before every yield,
+    so a consumer that wants to keep an event past the next ``send()`` must
+    take a :meth:`copy`.
+    """
+    __slots__ = ()
+
+    def copy(self) -> "Event":
+        """A detached copy of this record."""
+        other = object.__new__(type(self))
+        for name in self.__slots__:
+            setattr(other, name, getattr(self, name))
+        return other
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class TurnStart(Event):
+    """``player`` (in seat ``seat``) begins a turn."""
+    __slots__ = ("player", "seat")
+
+    def __init__(self):
+        self.player: Player | None = None
+        self.seat: int = 0
+
+
+class Roll(Event):
+    """``dice`` were just rolled; scoring follows."""
+    __slots__ = ("player", "dice")
+
+    def __init__(self):
+        self.player: Player | None = None
+        self.dice: list[Die] = []
+
+
+class Score(Event):
+    """The last roll scored ``score`` using ``used`` dice."""
+    __slots__ = ("player", "score", "used", "tentative", "remaining")
+
+    def __init__(self):
+        self.player: Player | None = None
+        self.score: int = 0
+        self.used: int = 0
+        self.tentative: int = 0
+        self.remaining: int = 0
+
+
+class HotDice(Event):
+    """Every die scored and the pool was reset."""
+    __slots__ = ("player",)
+
+    def __init__(self):
+        self.player: Player | None = None
+
+
+class Farkle(Event):
+    """The last roll scored nothing; the turn ends with nothing banked."""
+    __slots__ = ("player",)
+
+    def __init__(self):
+        self.player: Player | None = None
+
+
+class Decision(Event):
+    """``player`` must bank or roll; answer with ``send("b")``, ``send("r")`` or ``send("q")``.
+
+    Sending None (plain iteration) lets the game ask the player itself: bots
+    use their strategy and humans are prompted.
+    """
+    __slots__ = ("player", "tentative", "remaining")
+
+    def __init__(self):
+        self.player: Player | None = None
+        self.tentative: int = 0
+        self.remaining: int = 0
+
+
+class Timeout(Event):
+    """``player`` let the decision time ``limit`` (seconds) run out, so ``action`` (``"b"`` or ``"r"``) was taken."""
+    __slots__ = ("player", "limit", "action")
+
+    def __init__(self):
+        self.player: Player | None = None
+        self.limit: float = 0.0
+        self.action: str = "b"
+
+
+class Bank(Event):
+    """``points`` were banked, bringing ``player`` to ``total``; ``auto`` when no dice were left."""
+    __slots__ = ("player", "points", "total", "auto")
+
+    def __init__(self):
+        self.player: Player | None = None
+        self.points: int = 0
+        self.total: int = 0
+        self.auto: bool = False
+
+
+class Quit(Event):
+    """``player`` quit; the match ends unrated."""
+    __slots__ = ("player",)
+
+    def __init__(self):
+        self.player: Player | None = None
+
+
+class MatchEnd(Event):
+    """``winner`` reached the target after ``turns`` turns; stats and ratings are settled."""
+    __slots__ = ("winner", "turns")
+
+    def __init__(self):
+        self.winner: Player | None = None
+        self.turns: int = 0
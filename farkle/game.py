@@ -0,0 +1,338 @@
+import os
+import time
+import random
+import selectors
+import sys
+from .player import Player
+from .dice import DicePool, Die
+from .strategy import DecisionState, heuristic, strategies, hint, preload_hints
+from .rating import update_ratings
+from .state import GameState, StateCodec, state_codec
+from .results import ResultStore
+from .solver import method_name
+from .audit import DiceAuditor
+from .archive import MatchArchive
+from .bandit import BANDIT
+from .profile import endgame_choice
+from .events import Bank, Decision, Event, Farkle, HotDice, MatchEnd, Quit, Roll, Score, Timeout, TurnStart
+from .scoring import adding, doubling, scoring_methods
+from collections.abc import Generator
+from itertools import cycle
+
+
+
+class Game:
+    def __init__(self, calculate_score = None, players: list[Player] = (Player("P1"), Player("BOT", is_ai=True)),
+                 target_score: int = 10000, num_dice: int = 6, hot_dice_enabled: bool = True,
+                 ai_delay: bool = True, hints_enabled: bool = False, results: ResultStore | None = None,
+                 seed: int | None = None, auditor: DiceAuditor | None = None,
+                 archive: MatchArchive | None = None, decision_timeout: float | None = None,
+                 timeout_action: str = "b"):
+        if calculate_score is None:
+            self.calculate_score = Game.scoring_methods["default"]
+        else:
+            self.calculate_score = calculate_score
+        self.players: list[Player] = players
+        self.target_score: int = target_score
+        self.seed: int | None = seed  # with a seed the match's dice are reproducible
+        self.dice_pool: DicePool = DicePool(num_dice, None if seed is None else random.Random(seed))
+        if auditor is not None:
+            auditor.attach(self)
+        self.current_round: int = 0
+        self.turn: int = 0  # seat index of the player to move
+        self.hot_dice_enabled: bool = hot_dice_enabled
+        self.game_running: bool = True
+        self.tentative_score: int = 0
+        self.ai_delay: bool = ai_delay
+        self.results: ResultStore | None = results
+        self.archive: MatchArchive | None = archive
+        if timeout_action not in ("b", "r"):
+            raise ValueError(f"timeout_action must be 'b' or 'r', got {timeout_action!r}")
+        self.decision_timeout: float | None = decision_timeout  # seconds a human has per decision
+        self.timeout_action: str = timeout_action
+        self.hints_enabled: bool = hints_enabled and num_dice <= 6  # odds tables cover up to 6 dice
+        if self.hints_enabled:
+            preload_hints(self.calculate_score, target_score, num_dice, hot_dice_enabled)
+
+    def run(self) -> bool:
+        """Play the match interactively, printing every event of :meth:`iter_events`.
+
+        :return: True if the match finished, False if a player quit.
+        :rtype: bool
+        """
+        print("==== New Farkle Match ====")
+        print("Type 'q' to quit")
+
+        for event in self.iter_events():
+            self.report(event)
+        return self.game_running
+
+    def report(self, event: Event):
+        """Print one event for an interactive match; front ends override this to add their own output."""
+        kind = type(event)
+        if kind is Roll:
+            print(f"Rolled: {[d.value for d in event.dice]}")
+        elif kind is Score:
+            print(f"Scored {event.score}  |  Tentative this turn: {event.tentative}")
+        elif kind is HotDice:
+            print("Hot Dice! All dice scored. You may roll all six again.")
+        elif kind is Farkle:
+            print("Farkle! No scoring dice.")
+        elif kind is Timeout:
+            print(f"\nTime's up ({event.limit:g}s) → {'Bank' if event.action == 'b' else 'Roll again'}")
+        elif kind is Bank and event.auto:
+            print("All dice scored; Hot Dice is off → banking automatically.")
+        elif kind is TurnStart:
+            print(f"\n-- {event.player.username}'s turn (Total: {event.player.points}) --")
+        elif kind is MatchEnd:
+            print(f"{event.winner.username} wins!")
+
+    def iter_events(self) -> Generator[Event, str | None, bool]:
+        """Play the match lazily, yielding an :mod:`~farkle.events` record for every step.
+
+        At each :class:`Decision` the caller may ``send()`` ``"b"``, ``"r"`` or
+        ``"q"``; sending None (or iterating normally) lets the player decide
+        through :meth:`get_player_choice`. Records are reused between yields
+        (see :class:`Event`), so a match streams without buffering. Closing the
+        generator early abandons the match without settling stats. When a
+        human lets ``decision_timeout`` run out, a :class:`Timeout` follows the
+        decision and ``timeout_action`` is taken.
+
+        With an ``archive``, every finished match is appended to it as it
+        streams past (see :meth:`MatchArchive.recording`).
+
+        :return: (as the generator's return value) True if the match finished,
+                 False if a player quit.
+        """
+        events = self._match_events()
+        if self.archive is not None:
+            events = self.archive.recording(self, events)
+        return (yield from events)
+
+    def _match_events(self) -> Generator[Event, str | None, bool]:
+        turn_start, match_end = TurnStart(), MatchEnd()
+        events = (Roll(), Score(), HotDice(), Farkle(), Decision(), Timeout(), Bank(), Quit())
+        self.game_running = True
+        picks = None if self.seed is None else random.Random(f"bandit:{self.seed}")  # seeded matches pick alike
+        for player in self.players:
+            player.points = 0
+            if player.is_ai and player.strategy == BANDIT:
+                player.bandit.choose((p.username for p in self.players if p is not player), picks)
+
+        began = time.perf_counter()
+        turns = 0
+        for self.turn, player in cycle(enumerate(self.players)):
+            turn_start.player, turn_start.seat = player, self.turn
+            yield turn_start
+            yield from self._turn_events(player, events)
+            turns += 1
+
+            if not self.game_running:
+                return False
+
+            if player.points >= self.target_score:
+                break
+
+        winner = player
+        for player in self.players:
+            player.lifetime_score += player.points if not player.is_ai else 0
+            if player is winner:
+                player.win()
+            else:
+                player.lose()
+            if player.is_ai and player.strategy == BANDIT:
+                player.bandit.update((p.username for p in self.players if p is not player), player is winner)
+        update_ratings([player.rating for player in self.players], [player.points for player in self.players])
+        if self.results is not None:
+            self.results.record(method_name(self.calculate_score), self.target_score, len(self.dice_pool.dice),
+                                self.hot_dice_enabled, [p.username for p in self.players],
+                                [p.points for p in self.players], turns, self.turn, time.perf_counter() - began,
+                                -1 if self.seed is None else self.seed)
+        match_end.winner, match_end.turns = winner, turns
+        yield match_end
+        return True
+
+    def get_player_choice(self, player: Player) -> str | None:
+        """Ask ``player`` to bank (``"b"``), roll (``"r"``) or quit (``"q"``).
+
+        Bots answer through their strategy. Humans are prompted; with a
+        ``decision_timeout`` the prompt gives up after that many seconds and
+        None is returned, and the turn continues with ``timeout_action``.
+        """
+        if player.is_ai:
+            if self.ai_delay:
+                time.sleep(random.uniform(.5, 1.5))
+            strategy = strategies[player.playing]
+            state = self.decision_state(player, getattr(strategy, "uses_state_key", False))
+            choice = strategy(state)
+            if player.playing in heuristic:
+                choice = endgame_choice(state, choice, ((p.profile, p.points) for p in self.players
+                                                        if p is not player and not p.is_ai))
+            print(f"AI decision → {'Bank' if choice == 'b' else 'Roll again'}")
+            return choice
+
+        if self.hints_enabled:
+            print(hint(self.decision_state(player)))
+        deadline = None if self.decision_timeout is None else time.monotonic() + self.decision_timeout
+        while True:
+            line = self._read_line(f"{self.dice_pool.remaining_dice} dice left. Bank points (b) or roll again (r)? ",
+                                   deadline)
+            if line is None:
+                return None
+            choice = line.strip().lower()
+            if choice in ("b", "r", "q"):
+                return choice
+
+    @staticmethod
+    def _read_line(prompt: str, deadline: float | None) -> str | None:
+        """``input(prompt)``, but give up at ``deadline`` (a ``time.monotonic()`` value) and return None.
+
+        The wait is a selector on the stdin descriptor, so no thread is left
+        blocked on a read after a timeout. The line is read a byte at a time
+        straight from the descriptor, leaving anything typed after it for the
+        next prompt. Only interactive terminals are timed: piped or scripted
+        input may already sit in ``sys.stdin``'s buffer where a selector
+        cannot see it, and streams that cannot be selected on (Windows
+        consoles, test doubles) wait without a limit too.
+        """
+        selector = None
+        try:
+            timed = deadline is not None and sys.stdin.isatty()
+            if timed:
+                fd = sys.stdin.fileno()
+                selector = selectors.DefaultSelector()
+                selector.register(fd, selectors.EVENT_READ)
+                selector.select(0)  # Windows registers a console handle but only fails here
+        except (AttributeError, ValueError, OSError):
+            timed = False
+            if selector is not None:
+                selector.close()
+        if not timed:
+            return input(prompt)
+        print(prompt, end="", flush=True)
+        line = bytearray()
+        with selector:
+            try:
+                while not line.endswith(b"\n"):
+                    if not selector.select(max(0.0, deadline - time.monotonic())):
+                        print()
+                        return None
+                    byte = os.read(fd, 1)
+                    if not byte:
+                        if not line:
+                            raise EOFError
+                        break
+                    line += byte
+            except OSError:
+                return line.decode(errors="replace") + input()  # finish the line untimed
+        return line.decode(errors="replace")
+
+    def decision_state(self, player: Player, keyed: bool = False) -> DecisionState:
+        """Snapshot the bank/roll decision facing ``player``.
+
+        :param keyed: Also pack :attr:`DecisionState.state_key`, which costs an
+            :meth:`encode_state` per decision and is left None otherwise.
+        """
+        return DecisionState(self.tentative_score, self.dice_pool.remaining_dice, len(self.dice_pool.dice),
+                             player.points,
+                             max((p.points for p in self.players if p is not player), default=0),
+                             self.target_score, self.calculate_score, self.hot_dice_enabled,
+                             self.rules, self.encode_state() if keyed else None)
+
+    @property
+    def rules(self) -> tuple:
+        """Hashable description of everything that makes two games' state keys comparable."""
+        return (self.calculate_score, len(self.players), len(self.dice_pool.dice), self.target_score,
+                self.hot_dice_enabled)
+
+    @property
+    def state_codec(self) -> StateCodec:
+        return state_codec(len(self.players), len(self.dice_pool.dice), self.target_score)
+
+    def encode_state(self) -> int | None:
+        """Pack the current decision state (seat to move, dice left, every seat's points and the
+        tentative score) into one integer, or None if it does not fit the layout (see :class:`StateCodec`).
+        """
+        try:
+            return self.state_codec.encode(self.turn, self.dice_pool.remaining_dice,
+                                           [p.points for p in self.players], self.tentative_score)
+        except ValueError:
+            return None
+
+    def decode_state(self, key: int) -> GameState:
+        """Restore a state packed by :meth:`encode_state` onto this game and its players."""
+        state = self.state_codec.decode(key)
+        self.turn = state.turn
+        self.dice_pool.remaining_dice = state.remaining_dice
+        for player, points in zip(self.players, state.points):
+            player.points = points
+        self.tentative_score = state.tentative_score
+        return state
+
+    def record_roll(self, score: int, used: int) -> bool:
+        """Add a scoring roll to the turn; return True if it triggered Hot Dice (pool reset)."""
+        self.tentative_score += score
+        self.dice_pool.remaining_dice -= used
+
+        if self.hot_dice_enabled and self.dice_pool.remaining_dice == 0:
+            self.dice_pool.reset()
+            return True
+        return False
+
+    def _turn_events(self, player: Player, events: tuple) -> Generator[Event, str | None, None]:
+        roll, scored, hot_dice, farkle, decision, timeout, bank, quit_ = events
+        self.tentative_score = 0
+        self.dice_pool.reset()
+
+        auto = False
+        while True:
+            rolled: list[Die] = self.dice_pool.roll()
+            roll.player, roll.dice = player, rolled
+            yield roll
+            score, used = self.calculate_score(rolled)
+
+            if score == 0:
+                self.tentative_score = 0
+                farkle.player = player
+                yield farkle
+                return
+
+            reset = self.record_roll(score, used)
+            scored.player, scored.score, scored.used = player, score, used
+            scored.tentative, scored.remaining = self.tentative_score, self.dice_pool.remaining_dice
+            yield scored
+            if reset:
+                hot_dice.player = player
+                yield hot_dice
+
+            if self.dice_pool.remaining_dice == 0:
+                auto = True
+                break
+
+            decision.player, decision.tentative = player, self.tentative_score
+            decision.remaining = self.dice_pool.remaining_dice
+            choice = yield decision
+            timed_out = False
+            if choice is None:
+                choice = self.get_player_choice(player)
+                if choice is None:
+                    choice, timed_out = self.timeout_action, True
+                    timeout.player, timeout.limit, timeout.action = player, self.decision_timeout, choice
+                    yield timeout
+            if not player.is_ai and not timed_out:  # learn how this human banks
+                player.profile.observe(decision.remaining, decision.tentative, choice)
+            if choice == "b":
+                break
+            elif choice == "q":
+                self.game_running = False
+                quit_.player = player
+                yield quit_
+                return
+
+        player.bank_points(self.tentative_score)
+        bank.player, bank.points, bank.total, bank.auto = player, self.tentative_score, player.points, auto
+        yield bank
+
+    doubling = staticmethod(doubling)
+    adding = staticmethod(adding)
+    scoring_methods = scoring_methods
@@ -0,0 +1,185 @@
+from collections.abc import Callable
+from functools import lru_cache
+from math import gcd
+
+from .simulate import RollTable
+
+
+class TurnOdds:
+    """Exact single-turn odds for one rule set, precomputed into lookup tables.
+
+    ``value[n][k]`` is the best expected banked score of a turn with ``n``
+    dice left and a tentative score of ``k * step``, assuming every later
+    bank/roll choice is made to maximize that expectation; ``roll[n][k]`` is
+    the same expectation when rolling now. Tentative scores are multiples of
+    ``step`` (the gcd of all roll scores), so the tables cover every
+    reachable state up to ``cap``. Above ``cap`` the turn is assumed to bank
+    after one more roll, which is within a fraction of a point there.
+
+    Attributes
+    ----------
+    num_dice : int
+        Dice in a fresh pool.
+    hot_dice_enabled : bool
+        Whether scoring every die resets the pool.
+    step : int
+        Score granularity of the tables.
+    farkle : list[float]
+        ``farkle[n]`` is the probability that ``n`` dice score nothing.
+    value, roll : list[list[float]]
+        The tables described above, indexed ``[n][tentative // step]``.
+    """
+    def __init__(self, calculate_score=None, num_dice: int = 6, hot_dice_enabled: bool = True, cap: int = 25000):
+        table = RollTable(calculate_score, num_dice)
+        self.num_dice: int = num_dice
+        self.hot_dice_enabled: bool = hot_dice_enabled
+        self.outcomes: list[list[tuple[float, int, int]]] = [[]] + [
+            [(p, score, used) for p, score, used in table.distribution(n) if score > 0]
+            for n in range(1, num_dice + 1)]
+        self.farkle: list[float] = [0.0] + [table.farkle_probability(n) for n in range(1, num_dice + 1)]
+
+        step = 0
+        for outcomes in self.outcomes:
+            for _, score, _ in outcomes:
+                step = gcd(step, score)
+        self.step: int = step
+        self.size: int = cap // step + 1
+
+        self.value: list[list[float]] = [[0.0] * self.size for _ in range(num_dice + 1)]
+        self.roll: list[list[float]] = [[0.0] * self.size for _ in range(num_dice + 1)]
+        # tentative only grows within a turn, so fill from the top down
+        for k in range(self.size - 1, -1, -1):
+            tentative = k * step
+            for n in range(1, num_dice + 1):
+                ev = 0.0
+                for p, score, used in self.outcomes[n]:
+                    ev += p * self._after_roll(n - used, tentative + score)
+                self.roll[n][k] = ev
+                self.value[n][k] = max(float(tentative), ev)
+
+    def _after_roll(self, left: int, tentative: int) -> float:
+        """Expected banked score once a roll leaves ``left`` dice and ``tentative`` points."""
+        if left == 0:
+            if not self.hot_dice_enabled:
+                return float(tentative)
+            left = self.num_dice
+        k = tentative // self.step
+        if k < self.size:
+            return self.value[left][k]
+        return max(float(tentative), self._one_more_roll(left, tentative))
+
+    def _one_more_roll(self, n: int, tentative: int) -> float:
+        return sum(p * (tentative + score) for p, score, _ in self.outcomes[n])
+
+    def roll_ev(self, n: int, tentative: int) -> float:
+        """Expected banked score if ``n`` dice are rolled now at ``tentative`` points."""
+        k = tentative // self.step
+        if k < self.size:
+            return self.roll[n][k]
+        return self._one_more_roll(n, tentative)
+
+    def should_roll(self, n: int, tentative: int) -> bool:
+        """Whether rolling beats banking ``tentative`` points in expectation."""
+        return self.roll_ev(n, tentative) > tentative
+
+
+@lru_cache(maxsize=None)
+def turn_odds(calculate_score=None, num_dice: int = 6, hot_dice_enabled: bool = True) -> TurnOdds:
+    """Return the shared :class:`TurnOdds` for a rule set, building it on first use."""
+    return TurnOdds(calculate_score, num_dice, hot_dice_enabled)
+
+
+class TurnDistribution:
+    """Exact distribution of the points one turn banks under a bot strategy.
+
+    Attributes
+    ----------
+    probabilities : dict[int, float]
+        ``{banked points: probability}``, with farkles banking 0, sorted by points.
+    error : float
+        Probability of the turns left out because their tentative score
+        passed the cap (long hot-dice chains). Every probability above, and
+        the total, is within ``error`` of the true value.
+    states : int
+        Reachable ``(dice left, tentative)`` decision states evaluated.
+    """
+    def __init__(self, probabilities: dict[int, float], error: float, states: int):
+        self.probabilities: dict[int, float] = probabilities
+        self.error: float = error
+        self.states: int = states
+
+    @property
+    def mean(self) -> float:
+        return sum(points * p for points, p in self.probabilities.items())
+
+
+def turn_distribution(strategy: Callable, calculate_score=None, num_dice: int = 6, hot_dice_enabled: bool = True,
+                      target_score: int = 10000, cap: int = 25000,
+                      table: RollTable | None = None) -> TurnDistribution:
+    """Compute the exact banked-score distribution of one turn played by ``strategy``.
+
+    Turns follow :meth:`Game._turn_events`: a scoreless roll farkles,
+    :meth:`Game.record_roll` resets the pool on hot dice (or, without hot
+    dice, the turn auto-banks), and after every other scoring roll the
+    strategy banks or rolls. The tentative score only grows within a turn,
+    so probability mass is pushed forward through the ``(dice left,
+    tentative)`` states in order of tentative score: each reachable state is
+    visited once, and the strategy is asked once per state. Mass that would
+    pass ``cap`` is dropped and reported as :attr:`TurnDistribution.error`.
+
+    The strategy is asked as at the start of a match (both players on 0
+    points), so strategies that look at match scores are evaluated at their
+    opening play.
+
+    :param strategy: A function from :class:`~farkle.strategy.DecisionState` to ``"b"`` or ``"r"``.
+    :param cap: Highest tentative score tracked.
+    :rtype: TurnDistribution
+    """
+    from .strategy import DecisionState  # strategy.py imports this module
+
+    if table is None:
+        table = RollTable(calculate_score, num_dice)
+    outcomes = [[]] + [table.distribution(n) for n in range(1, num_dice + 1)]
+    step = 0
+    for rolls in outcomes:
+        for _, score, _ in rolls:
+            step = gcd(step, score)
+    size = cap // step + 1
+    mass = [[0.0] * size for _ in range(num_dice + 1)]  # mass[n][k]: chance of deciding with n dice at k * step
+    banked: dict[int, float] = {}
+    error = 0.0
+
+    def roll(n: int, tentative: int, weight: float):
+        nonlocal error
+        for p, score, used in outcomes[n]:
+            if score == 0:
+                banked[0] = banked.get(0, 0.0) + weight * p
+                continue
+            left, total = n - used, tentative + score
+            if left == 0:
+                if not hot_dice_enabled:
+                    banked[total] = banked.get(total, 0.0) + weight * p
+                    continue
+                left = num_dice
+            k = total // step
+            if k < size:
+                mass[left][k] += weight * p
+            else:
+                error += weight * p
+
+    roll(num_dice, 0, 1.0)
+    states = 0
+    for k in range(size):
+        tentative = k * step
+        for n in range(1, num_dice + 1):
+            weight = mass[n][k]
+            if weight == 0.0:
+                continue
+            states += 1
+            state = DecisionState(tentative, n, num_dice, target_score=target_score,
+                                  calculate_score=calculate_score, hot_dice_enabled=hot_dice_enabled)
+            if strategy(state) == "b":
+                banked[tentative] = banked.get(tentative, 0.0) + weight
+            else:
+                roll(n, tentative, weight)
+    return TurnDistribution(dict(sorted(banked.items())), error, states)
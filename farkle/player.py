@@ -0,0 +1,195 @@
+import os
+import json
+import tempfile
+from contextlib import contextmanager
+from .bandit import BANDIT, Bandit
+from .profile import BankingProfile
+from .rating import Rating
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+PLAYER_DIR = "players"
+COUNTERS = ("lifetime_score", "wins", "games")
+
+
+@contextmanager
+def _locked(directory: str, username: str, exclusive: bool):
+    """Hold an advisory lock on one player's save file.
+
+    Each player has its own lock file under ``<directory>/.locks`` so saves of
+    different players never wait on each other. Readers take a shared lock and
+    writers an exclusive one (Windows only offers exclusive locks).
+
+    :param directory: The save directory.
+    :type directory: str
+    :param username: Lower-cased username whose save is being accessed.
+    :type username: str
+    :param exclusive: True for writers, False for readers.
+    :type exclusive: bool
+    """
+    lock_dir = os.path.join(directory, ".locks")
+    os.makedirs(lock_dir, exist_ok=True)
+    with open(os.path.join(lock_dir, f"{username}.lock"), "a+") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        else:
+            lock.seek(0)
+            msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+            else:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class Player:
+    """A player's match state, lifetime stats and save file.
+
+    Attributes
+    ----------
+    username : str
+        Upper-cased display name; the save file is ``<directory>/<username>.json``
+        in lower case.
+    points : int
+        Banked points in the current match.
+    wins, games, lifetime_score : int
+        Lifetime counters.
+    is_ai : bool
+        Whether a bot strategy takes this player's decisions.
+    strategy : str
+        Name of the bot strategy (see ``farkle.strategy.strategies``).
+    rating : Rating
+        Skill estimate updated after every finished match.
+    bandit : Bandit
+        Per-opponent record of the strategies a ``"bandit"`` bot has played.
+    profile : BankingProfile
+        When this (human) player banks, learned from their decisions; bots
+        read it to judge how likely the player is to finish a match.
+    directory : str
+        Class attribute: where saves live. Front ends with a different layout
+        subclass and override it.
+    """
+    directory: str = PLAYER_DIR
+
+    def __init__(self, username: str, is_ai: bool = False):
+        self.username: str = username
+        self.lifetime_score: int = 0
+        self.wins: int = 0
+        self.games: int = 0
+        self.is_ai: bool = is_ai
+        self.points: int = 0
+        self.strategy: str = "default"
+        self.rating: Rating = Rating()
+        self.bandit: Bandit = Bandit()
+        self.profile: BankingProfile = BankingProfile()
+        # Counter values last read from / written to disk under ``_saved_as``;
+        # save() merges only the difference since then
+        self._saved: dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self._saved_as: str | None = None
+
+    def win(self):
+        self.wins += 1
+        self.games += 1
+
+    def lose(self):
+        self.games += 1
+
+    def bank_points(self, points: int):
+        self.points += points
+
+    @property
+    def playing(self) -> str:
+        """Strategy deciding for this bot in the current match: :attr:`strategy`, or the one its bandit picked."""
+        return self.bandit.arm if self.strategy == BANDIT else self.strategy
+
+    def save(self):
+        """Persist the player's stats as JSON under :attr:`directory`.
+
+        The write is atomic: data goes to a temporary file that is renamed
+        over the save, so readers never see partial JSON. While holding this
+        player's lock, the counters gained since the last load/save (wins,
+        games, lifetime_score) are added to whatever is on disk, so concurrent
+        saves of the same player from several processes all count instead of
+        the last writer winning. A player that was never loaded or saved
+        counts everything it holds as gained, so saving a new ``Player`` under
+        an existing username adds to that save rather than replacing it.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        username = self.username.lower()
+        path = os.path.join(self.directory, f"{username}.json")
+
+        baseline = self._saved if self._saved_as == username else dict.fromkeys(COUNTERS, 0)
+
+        with _locked(self.directory, username, exclusive=True):
+            on_disk = self._read(path) or {}
+            for key in COUNTERS:
+                setattr(self, key, on_disk.get(key, 0) + getattr(self, key) - baseline[key])
+            self._saved = {key: getattr(self, key) for key in COUNTERS}
+            self._saved_as = username
+
+            data_dict = {
+                "username": username,
+                "lifetime_score": self.lifetime_score,
+                "wins": self.wins,
+                "games": self.games,
+                "is_ai": self.is_ai,
+                "rating": self.rating.to_dict(),
+                "bandit": self.bandit.to_dict(),
+                "profile": self.profile.to_dict()
+            }
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{username}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data_dict, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+    @staticmethod
+    def _read(path: str) -> dict | None:
+        """Return the saved JSON at ``path``, or None if there is no save."""
+        if not os.path.exists(path):
+            return None
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def load(self, username_to_load: str | None = None) -> bool:
+        """Load stats from a save, by default this player's own.
+
+        :param username_to_load: Username (case-insensitive) whose save to load;
+                                 the player takes that name.
+        :type username_to_load: str | None
+        :return: True if a save was found and loaded.
+        :rtype: bool
+        """
+        username = self.username.lower() if username_to_load is None else username_to_load.lower()
+        path = os.path.join(self.directory, f"{username}.json")
+
+        if not os.path.exists(path):
+            return False
+        with _locked(self.directory, username, exclusive=False):
+            data_dict = self._read(path)
+        if data_dict is None:
+            return False
+
+        self.username = data_dict.get("username", username).upper()
+        self.lifetime_score = data_dict.get("lifetime_score", 0)
+        self.wins = data_dict.get("wins", 0)
+        self.games = data_dict.get("games", 0)
+        self.is_ai = data_dict.get("is_ai", False)
+        self.rating = Rating.from_dict(data_dict.get("rating"))
+        self.bandit = Bandit.from_dict(data_dict.get("bandit"))
+        self.profile = BankingProfile.from_dict(data_dict.get("profile"))
+        self._saved = {key: getattr(self, key) for key in COUNTERS}
+        self._saved_as = username
+        return True
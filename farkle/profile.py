@@ -0,0 +1,165 @@
+from array import array
+from collections.abc import Iterable
+from functools import lru_cache
+from math import gcd
+
+from .simulate import RollTable
+
+BUCKET = 250  # tentative-score width of one profile cell
+BUCKETS = 16  # the last bucket holds every tentative score from 3750 up
+MAX_DICE = 6
+MIN_DECISIONS = 30  # decisions seen before a profile is trusted
+ENDGAME = 0.3  # opponents within this fraction of the target are modelled
+
+
+class BankingProfile:
+    """How often one player banks, counted per (dice left, tentative-score bucket).
+
+    Attributes
+    ----------
+    counts : array
+        ``array("I")`` of ``[banks, decisions]`` per cell; the cell for ``n``
+        dice and bucket ``b`` starts at ``2 * ((n - 1) * BUCKETS + b)``.
+    """
+    __slots__ = ("counts", "_memo")
+
+    def __init__(self, counts: array | None = None):
+        self.counts: array = array("I", [0]) * (2 * MAX_DICE * BUCKETS) if counts is None else counts
+        self._memo: dict = {}  # finish probabilities for the counts as they are now
+
+    @staticmethod
+    def cell(remaining: int, tentative: int) -> int:
+        return 2 * ((remaining - 1) * BUCKETS + min(tentative // BUCKET, BUCKETS - 1))
+
+    def observe(self, remaining: int, tentative: int, choice: str):
+        """Count one bank (``"b"``) or roll (``"r"``) decision; anything else is ignored."""
+        if choice not in ("b", "r") or not 1 <= remaining <= MAX_DICE:
+            return
+        k = self.cell(remaining, tentative)
+        self.counts[k] += choice == "b"
+        self.counts[k + 1] += 1
+        if self._memo:
+            self._memo = {}
+
+    @property
+    def decisions(self) -> int:
+        return sum(self.counts[1::2])
+
+    def bank_probabilities(self) -> list[list[float]]:
+        """``result[n][b]``: estimated chance of banking with ``n`` dice in bucket ``b``.
+
+        Each cell's counts are shrunk toward the player's bank rate with that
+        many dice (one pseudo-decision), so sparse cells fall back on the row.
+        """
+        counts = self.counts
+        result = [[0.5] * BUCKETS]
+        for n in range(1, MAX_DICE + 1):
+            row = slice(2 * (n - 1) * BUCKETS, 2 * n * BUCKETS)
+            rate = (sum(counts[row][0::2]) + 0.5) / (sum(counts[row][1::2]) + 1)
+            k = 2 * (n - 1) * BUCKETS
+            result.append([(counts[k + 2 * b] + rate) / (counts[k + 2 * b + 1] + 1) for b in range(BUCKETS)])
+        return result
+
+    def finish_probability(self, need: int, calculate_score=None, num_dice: int = 6,
+                           hot_dice_enabled: bool = True) -> float:
+        """Chance that this player's next turn banks at least ``need`` points, playing as profiled.
+
+        Mass is pushed forward through ``(dice left, tentative)`` states as in
+        :func:`~farkle.odds.turn_distribution`, except that each state banks
+        with the profiled probability. Reaching ``need`` is assumed to end the
+        turn, so only tentative scores below it are tracked.
+        """
+        if need <= 0:
+            return 1.0
+        key = (need, calculate_score, num_dice, hot_dice_enabled)
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+        outcomes, step = _outcomes(calculate_score, num_dice)
+        banks = self.bank_probabilities()
+        size = -(-need // step)
+        mass = [[0.0] * size for _ in range(num_dice + 1)]
+        finished = 0.0
+
+        def roll(n: int, tentative: int, weight: float):
+            nonlocal finished
+            for p, score, used in outcomes[n]:
+                total = tentative + score
+                if score == 0:
+                    continue
+                if total >= need:
+                    finished += weight * p
+                    continue
+                left = n - used
+                if left == 0:
+                    if not hot_dice_enabled:
+                        continue  # auto-banks short of the target
+                    left = num_dice
+                mass[left][total // step] += weight * p
+
+        roll(num_dice, 0, 1.0)
+        for k in range(size):
+            tentative = k * step
+            for n in range(1, num_dice + 1):
+                weight = mass[n][k]
+                if weight:
+                    roll(n, tentative, weight * (1.0 - banks[n][min(tentative // BUCKET, BUCKETS - 1)]))
+        self._memo[key] = finished
+        return finished
+
+    def to_dict(self) -> dict:
+        return {"bucket": BUCKET, "counts": list(self.counts)}
+
+    @staticmethod
+    def from_dict(data: dict | None) -> "BankingProfile":
+        """Rebuild a saved profile; one saved with another cell layout starts over."""
+        data = data or {}
+        counts = data.get("counts")
+        if data.get("bucket") != BUCKET or counts is None or len(counts) != 2 * MAX_DICE * BUCKETS:
+            return BankingProfile()
+        return BankingProfile(array("I", counts))
+
+
+@lru_cache(maxsize=None)
+def _outcomes(calculate_score, num_dice: int) -> tuple[list[list[tuple[float, int, int]]], int]:
+    """Roll outcome distributions for 0..``num_dice`` dice and the gcd of their scores."""
+    table = RollTable(calculate_score, num_dice)
+    outcomes = [[]] + [table.distribution(n) for n in range(1, num_dice + 1)]
+    step = 0
+    for rolls in outcomes:
+        for _, score, _ in rolls:
+            step = gcd(step, score)
+    return outcomes, step
+
+
+def endgame_choice(state, choice: str, opponents: Iterable[tuple[BankingProfile, int]]) -> str:
+    """Adjust a bot's bank/roll ``choice`` for opponents whose banking habits are known.
+
+    Banking short of the target only pays if no opponent finishes before the
+    bot plays again. When the profiled opponents (``(profile, points)``
+    pairs, skipping profiles with fewer than :data:`MIN_DECISIONS` decisions
+    and opponents more than :data:`ENDGAME` of the target short) are more likely to
+    finish on their next turns than the coming roll is to farkle, the bank
+    becomes a roll.
+
+    Games with more than :data:`MAX_DICE` dice, or rules whose rolls cannot
+    be tabled, are not modelled and keep ``choice``.
+
+    :param state: The bot's :class:`~farkle.strategy.DecisionState`.
+    """
+    if choice != "b" or state.points + state.tentative_score >= state.target_score or state.num_dice > MAX_DICE:
+        return choice
+    try:
+        survive = 1.0
+        for profile, points in opponents:
+            need = state.target_score - points
+            if need <= ENDGAME * state.target_score and profile.decisions >= MIN_DECISIONS:
+                survive *= 1.0 - profile.finish_probability(need, state.calculate_score,
+                                                            state.num_dice, state.hot_dice_enabled)
+        if survive == 1.0:
+            return choice
+        outcomes, _ = _outcomes(state.calculate_score, state.num_dice)
+    except ValueError:
+        return choice
+    farkle = sum(p for p, score, _ in outcomes[state.remaining_dice] if score == 0)
+    return "r" if 1.0 - survive > farkle else choice
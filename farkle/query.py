@@ -0,0 +1,306 @@
+import operator
+import os
+from collections.abc import Iterator
+from multiprocessing import Pool
+from typing import NamedTuple
+
+from .archive import ARCHIVE_DIR, BANK, QUIT, TIMEOUT, ArchivedMatch, MatchArchive
+from .simulate import RollTable
+
+# row layouts of the two queryable tables; ``turn`` counts turns within the match from 0
+MATCH_FIELDS = ("match", "seed", "method", "target", "dice", "hot", "seat", "player", "turn",
+                "points", "opponent_points")
+TABLES = {
+    # one row per turn: rolls made, Hot Dice resets, decision timeouts, how it ended and what it banked
+    "turns": MATCH_FIELDS + ("rolls", "hot_dice", "timeouts", "farkle", "banked", "quit"),
+    # one row per bank/roll decision: the situation, the choice ("b", "r" or "q") and whether
+    # the player's time ran out (the choice was then the game's timeout action)
+    "decisions": MATCH_FIELDS + ("remaining", "tentative", "choice", "timed_out"),
+}
+OPERATORS = {"==": operator.eq, "!=": operator.ne, "<": operator.lt, "<=": operator.le,
+             ">": operator.gt, ">=": operator.ge, "in": lambda value, options: value in options}
+AGGREGATES = ("count", "sum", "mean", "min", "max")
+
+
+class Query(NamedTuple):
+    """A filter / group-by / aggregate query over one table of replayed archive rows.
+
+    Queries are immutable and built fluently, e.g.
+    ``Query("decisions").where("remaining", "==", 2).where("tentative", "<", 400).group_by("choice")``.
+
+    Attributes
+    ----------
+    table : str
+        ``"turns"`` or ``"decisions"`` (see :data:`TABLES`).
+    conditions : tuple[tuple[str, str, object], ...]
+        ``(field, operator, value)`` filters, all of which must hold.
+    keys : tuple[str, ...]
+        Fields to group by; no keys makes a single group ``()``.
+    aggregates : tuple[tuple[str, str | None], ...]
+        ``(function, field)`` pairs from :data:`AGGREGATES`; ``count`` takes no field.
+    """
+    table: str = "decisions"
+    conditions: tuple[tuple[str, str, object], ...] = ()
+    keys: tuple[str, ...] = ()
+    aggregates: tuple[tuple[str, str | None], ...] = (("count", None),)
+
+    def where(self, field: str, op: str, value) -> "Query":
+        return self._replace(conditions=self.conditions + ((field, op, value),))
+
+    def group_by(self, *fields: str) -> "Query":
+        return self._replace(keys=self.keys + fields)
+
+    def aggregate(self, *specs: str) -> "Query":
+        """Replace the aggregates with ``"count"`` or ``"function:field"`` specs, e.g. ``"mean:banked"``."""
+        return self._replace(aggregates=tuple((spec.partition(":")[0], spec.partition(":")[2] or None)
+                                              for spec in specs))
+
+    def validate(self):
+        """:raises ValueError: On an unknown table, field, operator or aggregate."""
+        if self.table not in TABLES:
+            raise ValueError(f"unknown table {self.table!r}; choose from {', '.join(TABLES)}")
+        fields = TABLES[self.table]
+        named = [f for f, _, _ in self.conditions] + list(self.keys) + [f for _, f in self.aggregates if f]
+        for field in named:
+            if field not in fields:
+                raise ValueError(f"{self.table} has no field {field!r}; fields are {', '.join(fields)}")
+        for _, op, _ in self.conditions:
+            if op not in OPERATORS:
+                raise ValueError(f"unknown operator {op!r}")
+        for function, field in self.aggregates:
+            if function not in AGGREGATES or (field is None) != (function == "count"):
+                raise ValueError(f"bad aggregate {function}:{field or ''}")
+
+
+def rows(match: ArchivedMatch, table: RollTable, kind: str, rolls_seen: dict | None = None) -> Iterator[tuple]:
+    """Replay one archived match under its own rules, yielding rows of ``TABLES[kind]``.
+
+    Scores are looked up in ``table`` (which must be built from the match's
+    scoring method), mirroring :meth:`Game.iter_events` turn by turn.
+
+    :param rolls_seen: Optional cache from encoded roll bytes to ``(score, used)``
+                       for ``table``, shared between matches with the same rules.
+    """
+    turns = kind == "turns"
+    outcomes, dice, hot = table.outcomes, match.num_dice, match.hot_dice_enabled
+    seen = {} if rolls_seen is None else rolls_seen
+    base = (match.number, match.seed, match.method, match.target_score, dice, hot)
+    points = [0] * len(match.usernames)
+    data = match.payload
+    size = len(data)
+    i = turn = 0
+    while i < size:
+        seat = data[i] & 0x0F  # every turn opens with a TURN token
+        i += 1
+        others = points[:seat] + points[seat + 1:]
+        prefix = base + (seat, match.usernames[seat], turn, points[seat], max(others) if others else 0)
+        tentative, n, rolls, resets, timeouts = 0, dice, 0, 0, 0
+        banked, quit_ = None, False
+        while banked is None and not quit_:
+            end = i + 1 + ((data[i] & 0x0F) + 1) // 2
+            encoded = data[i:end]
+            outcome = seen.get(encoded)
+            if outcome is None:
+                count = data[i] & 0x0F
+                index = 0  # base-6 roll index, first die most significant (see RollTable.outcomes)
+                for byte in data[i + 1:end]:
+                    index = index * 36 + (byte & 0x0F) * 6 + (byte >> 4) - 7
+                if count % 2:
+                    index = (index + 1) // 6  # the odd last byte's empty high nibble counted as face 0
+                outcome = seen[encoded] = outcomes[count][index]
+            i = end
+            rolls += 1
+            score, used = outcome
+            if score == 0:
+                banked = 0
+                break
+            tentative += score
+            n -= used
+            if n == 0:
+                if not hot:
+                    banked = tentative
+                    break
+                n = dice
+                resets += 1
+            token = data[i]  # a decision follows every scoring roll that leaves dice
+            i += 1
+            timed_out = token == TIMEOUT
+            if timed_out:
+                timeouts += 1
+                token = data[i]
+                i += 1
+            if not turns:
+                yield prefix + (n, tentative, "brq"[token - BANK], timed_out)
+            if token == BANK:
+                banked = tentative
+            elif token == QUIT:
+                quit_ = True
+        if turns:
+            yield prefix + (rolls, resets, timeouts, banked == 0 and not quit_, banked or 0, quit_)
+        points[seat] += banked or 0
+        turn += 1
+
+
+class _Plan:
+    """A validated query compiled to tuple positions, plus per-process roll tables."""
+    def __init__(self, query: Query):
+        query.validate()
+        fields = TABLES[query.table]
+        self.query = query
+        self.checks = [(fields.index(f), OPERATORS[op], value) for f, op, value in query.conditions]
+        self.keys = [fields.index(f) for f in query.keys]
+        self.values = sorted({fields.index(f) for _, f in query.aggregates if f})
+        self.tables: dict[tuple[str, int], tuple[RollTable, dict]] = {}
+
+    def table(self, match: ArchivedMatch) -> tuple[RollTable, dict]:
+        """The roll table for the match's rules and its cache of decoded rolls."""
+        from .game import Game
+        rules = (match.method, match.num_dice)
+        entry = self.tables.get(rules)
+        if entry is None:
+            if match.method not in Game.scoring_methods:
+                raise ValueError(f"match {match.number} uses scoring method {match.method!r}, "
+                                 f"which cannot be replayed")
+            entry = self.tables[rules] = (RollTable(Game.scoring_methods[match.method], match.num_dice), {})
+        return entry
+
+    def scan(self, archive: MatchArchive, start: int, stop: int) -> dict[tuple, list]:
+        """Partial aggregates of matches ``start``..``stop``: per group ``[rows, (sum, min, max) per value]``."""
+        groups: dict[tuple, list] = {}
+        checks, values, kind = self.checks, self.values, self.query.table
+        keys = self.keys
+        key_of = (lambda row: ()) if not keys else (lambda row: (row[keys[0]],)) if len(keys) == 1 \
+            else operator.itemgetter(*keys)
+        for number in range(start, stop):
+            match = archive[number]
+            table, seen = self.table(match)
+            for row in rows(match, table, kind, seen):
+                if checks and not all(op(row[k], value) for k, op, value in checks):
+                    continue
+                key = key_of(row)
+                state = groups.get(key)
+                if state is None:
+                    state = groups[key] = [0] + [0, None, None] * len(values)
+                state[0] += 1
+                for slot, k in enumerate(values, 1):
+                    v = row[k]
+                    base = 3 * slot - 2
+                    state[base] += v
+                    if state[base + 1] is None or v < state[base + 1]:
+                        state[base + 1] = v
+                    if state[base + 2] is None or v > state[base + 2]:
+                        state[base + 2] = v
+        return groups
+
+    @staticmethod
+    def merge(total: dict[tuple, list], part: dict[tuple, list]):
+        for key, state in part.items():
+            into = total.get(key)
+            if into is None:
+                total[key] = state
+                continue
+            into[0] += state[0]
+            for base in range(1, len(state), 3):
+                into[base] += state[base]
+                into[base + 1] = min(into[base + 1], state[base + 1])
+                into[base + 2] = max(into[base + 2], state[base + 2])
+
+    def finish(self, groups: dict[tuple, list]) -> dict[tuple, dict[str, object]]:
+        fields = TABLES[self.query.table]
+        result = {}
+        for key in sorted(groups, key=repr):
+            state = groups[key]
+            out = {}
+            for function, field in self.query.aggregates:
+                if function == "count":
+                    out["count"] = state[0]
+                    continue
+                base = 3 * (self.values.index(fields.index(field)) + 1) - 2
+                total, low, high = state[base:base + 3]
+                out[f"{function}({field})"] = {"sum": total, "mean": total / state[0], "min": low,
+                                              "max": high}[function]
+            result[key] = out
+        return result
+
+
+# --- worker side: each process opens the archive and compiles the query once ---
+
+_worker: dict = {}
+
+
+def _init_worker(directory: str, query: Query):
+    _worker.update(archive=MatchArchive(directory), plan=_Plan(query))
+
+
+def _scan(span: tuple[int, int]) -> dict[tuple, list]:
+    return _worker["plan"].scan(_worker["archive"], *span)
+
+
+def run_query(query: Query, directory: str = ARCHIVE_DIR, workers: int | None = None,
+              chunk: int = 5000) -> dict[tuple, dict[str, object]]:
+    """Answer ``query`` over every match in the archive at ``directory``.
+
+    The archive is split into runs of ``chunk`` matches; each worker process
+    maps its own view of the archive, replays its runs and returns partial
+    aggregates (row count plus sum, min and max per field), which are reduced
+    here. Only the groups travel between processes, never rows.
+
+    :param workers: Processes to use (default: CPU count; 1 runs inline).
+    :return: ``{group key: {aggregate name: value}}``, e.g. ``{("b",): {"count": 812}}``.
+    :raises ValueError: If the query is malformed or a match cannot be replayed.
+    """
+    plan = _Plan(query)
+    count = len(MatchArchive(directory))
+    spans = [(start, min(start + chunk, count)) for start in range(0, count, chunk)]
+    workers = min(workers or os.cpu_count() or 1, len(spans)) or 1
+    groups: dict[tuple, list] = {}
+    if workers == 1:
+        archive = MatchArchive(directory)
+        try:
+            for span in spans:
+                plan.merge(groups, plan.scan(archive, *span))
+        finally:
+            archive.close()
+    else:
+        with Pool(workers, _init_worker, (directory, query)) as pool:
+            for part in pool.imap_unordered(_scan, spans):
+                plan.merge(groups, part)
+    return plan.finish(groups)
+
+
+if __name__ == "__main__":
+    import argparse
+    import re
+    import time
+
+    parser = argparse.ArgumentParser(description="Filter, group and aggregate replayed archive matches",
+                                     epilog="fields: " + "; ".join(f"{t}: {', '.join(f)}" for t, f in TABLES.items()))
+    parser.add_argument("table", choices=list(TABLES))
+    parser.add_argument("--where", nargs="*", default=[], metavar="FIELD<OP>VALUE",
+                        help="e.g. remaining==2 tentative<400 method==adding")
+    parser.add_argument("--group-by", nargs="*", default=[], metavar="FIELD")
+    parser.add_argument("--aggregate", nargs="*", default=["count"], metavar="FUNCTION[:FIELD]",
+                        help="count, sum:FIELD, mean:FIELD, min:FIELD or max:FIELD")
+    parser.add_argument("--directory", default=ARCHIVE_DIR)
+    parser.add_argument("--workers", type=int, default=None)
+    options = parser.parse_args()
+
+    query = Query(options.table).group_by(*options.group_by).aggregate(*options.aggregate)
+    for condition in options.where:
+        parsed = re.fullmatch(r"(\w+)(==|!=|<=|>=|<|>)(.+)", condition)
+        if parsed is None:
+            parser.error(f"cannot parse condition {condition!r}")
+        field, op, value = parsed.groups()
+        query = query.where(field, op, int(value) if value.lstrip("-").isdigit() else
+                            {"True": True, "False": False}.get(value, value))
+    began = time.perf_counter()
+    try:
+        result = run_query(query, options.directory, options.workers)
+    except ValueError as error:
+        parser.error(str(error))
+    elapsed = time.perf_counter() - began
+    for key, values in result.items():
+        label = ", ".join(f"{k}={v}" for k, v in zip(query.keys, key)) or "all"
+        print(f"{label}: " + ", ".join(f"{name} {value:.4g}" if isinstance(value, float) else f"{name} {value}"
+                                      for name, value in values.items()))
+    print(f"({elapsed:.1f}s)")
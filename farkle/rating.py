@@ -0,0 +1,155 @@
+import json
+import math
+from collections.abc import Iterable, Sequence
+
+MU = 25.0
+SIGMA = MU / 3
+BETA = SIGMA / 2
+KAPPA = 1e-4  # floor on the variance shrink factor so sigma never collapses
+
+
+class Rating:
+    """Bayesian skill estimate (TrueSkill-style mean and uncertainty).
+
+    Attributes
+    ----------
+    mu : float
+        Estimated skill.
+    sigma : float
+        Uncertainty of ``mu``; shrinks as games are played.
+    """
+    __slots__ = ("mu", "sigma")
+
+    def __init__(self, mu: float = MU, sigma: float = SIGMA):
+        self.mu: float = mu
+        self.sigma: float = sigma
+
+    @property
+    def conservative(self) -> float:
+        """``mu - 3 * sigma``: a skill the player very likely exceeds; used for ranking."""
+        return self.mu - 3 * self.sigma
+
+    def to_dict(self) -> dict:
+        return {"mu": self.mu, "sigma": self.sigma}
+
+    @staticmethod
+    def from_dict(data: dict | None) -> "Rating":
+        data = data or {}
+        return Rating(data.get("mu", MU), data.get("sigma", SIGMA))
+
+
+def update_ratings(ratings: Sequence[Rating], points: Sequence[int]):
+    """Update ratings in place from one finished match of any number of players.
+
+    Uses the Weng–Lin Bayesian approximation under a Plackett–Luce model: the
+    finishing order (by match points, highest first, equal points tied) is
+    treated as successive "who is best among the rest" choices. The sums over
+    "everyone ranked at or below" are suffix sums, so after sorting the update
+    is linear in the number of players.
+
+    :param ratings: One :class:`Rating` per player.
+    :type ratings: Sequence[Rating]
+    :param points: Final match points, aligned with ``ratings``.
+    :type points: Sequence[int]
+    """
+    n = len(ratings)
+    if n < 2:
+        return
+    order = sorted(range(n), key=lambda k: -points[k])
+    c = math.sqrt(sum(r.sigma * r.sigma + BETA * BETA for r in ratings))
+    strength = [math.exp(ratings[k].mu / c) for k in order]
+
+    # group tied positions: [start, end) in ``order``
+    groups: list[tuple[int, int]] = []
+    start = 0
+    for pos in range(1, n + 1):
+        if pos == n or points[order[pos]] != points[order[start]]:
+            groups.append((start, pos))
+            start = pos
+
+    # suffix sum of strengths from each group down, then prefix sums of 1/(S*A), 1/(S^2*A)
+    suffix = 0.0
+    group_sums = [0.0] * len(groups)
+    for g in range(len(groups) - 1, -1, -1):
+        lo, hi = groups[g]
+        suffix += sum(strength[lo:hi])
+        group_sums[g] = suffix
+
+    prefix_a = prefix_b = 0.0
+    for g, (lo, hi) in enumerate(groups):
+        size = hi - lo
+        total = group_sums[g]
+        # each of the ``size`` tied players adds 1/(S * A) and 1/(S^2 * A) with A == size
+        prefix_a += 1.0 / total
+        prefix_b += 1.0 / (total * total)
+        for pos in range(lo, hi):
+            rating, e = ratings[order[pos]], strength[pos]
+            omega = 1.0 / size - e * prefix_a
+            delta = e * prefix_a - e * e * prefix_b
+            variance = rating.sigma * rating.sigma
+            rating.mu += variance / c * omega
+            rating.sigma = math.sqrt(variance * max(1.0 - (rating.sigma / c) * variance / (c * c) * delta, KAPPA))
+
+
+class RatingBook:
+    """Ratings keyed by username, for re-rating whole match histories in bulk.
+
+    Attributes
+    ----------
+    ratings : dict[str, Rating]
+        Current rating per (upper-cased) username.
+    """
+    def __init__(self):
+        self.ratings: dict[str, Rating] = {}
+
+    def record(self, usernames: Sequence[str], points: Sequence[int]):
+        """Apply one finished match."""
+        get = self.ratings.get
+        match = []
+        for name in usernames:
+            rating = get(name)
+            if rating is None:
+                rating = self.ratings[name] = Rating()
+            match.append(rating)
+        update_ratings(match, points)
+
+    def replay(self, matches: Iterable[tuple[Sequence[str], Sequence[int]]]) -> int:
+        """Apply matches in order, e.g. to recompute every rating from an archive.
+
+        :param matches: ``(usernames, points)`` pairs, oldest first.
+        :return: Number of matches applied.
+        :rtype: int
+        """
+        count = 0
+        for usernames, points in matches:
+            self.record(usernames, points)
+            count += 1
+        return count
+
+    def leaderboard(self) -> list[tuple[str, Rating]]:
+        """Usernames with ratings, best conservative rating first."""
+        return sorted(self.ratings.items(), key=lambda item: -item[1].conservative)
+
+
+def read_matches(path: str) -> Iterable[tuple[list[str], list[int]]]:
+    """Stream ``{"players": [...], "points": [...]}`` JSON lines from ``path``."""
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                match = json.loads(line)
+                yield [name.upper() for name in match["players"]], match["points"]
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    if len(sys.argv) != 2:
+        sys.exit("usage: python -m farkle.rating <matches.jsonl>")
+    book = RatingBook()
+    began = time.perf_counter()
+    count = book.replay(read_matches(sys.argv[1]))
+    print(f"Re-rated {count} matches in {time.perf_counter() - began:.1f}s")
+    print("Player     Rating  (mu ± sigma)")
+    for name, rating in book.leaderboard()[:20]:
+        print(f"{name: <10} {rating.conservative:6.2f}  ({rating.mu:.2f} ± {rating.sigma:.2f})")
@@ -0,0 +1,252 @@
+import os
+from multiprocessing import Pool
+from typing import NamedTuple
+
+from .archive import ARCHIVE_DIR, ArchivedMatch, MatchArchive
+from .dice import Die
+from .simulate import RollTable
+
+
+class Rescored(NamedTuple):
+    """One archived match replayed under other rules.
+
+    Attributes
+    ----------
+    points : list[int]
+        Each seat's points when the replay ended.
+    winner : int | None
+        Seat that reached the target first, or None if nobody did within
+        the recorded turns (or a player quit).
+    turns : int
+        Turns replayed before the match ended.
+    """
+    points: list[int]
+    winner: int | None
+    turns: int
+
+
+class PlayerImpact(NamedTuple):
+    """How one player's archived matches change under the new rules.
+
+    Attributes
+    ----------
+    matches : int
+        Archived matches the player sat in.
+    delta : int
+        Rescored minus recorded final points, summed over those matches.
+    wins : int
+        Matches the player won as recorded.
+    rescored_wins : int
+        Matches the player wins when rescored.
+    """
+    matches: int
+    delta: int
+    wins: int
+    rescored_wins: int
+
+
+class RescoreReport(NamedTuple):
+    """Archive-wide outcome of :func:`rescore`.
+
+    Attributes
+    ----------
+    matches : int
+        Matches replayed.
+    winner_changed : int
+        Matches whose winner differs, counting those left unfinished.
+    unfinished : int
+        Matches nobody wins under the new rules within the recorded turns.
+    players : dict[str, PlayerImpact]
+        Per-username impact, sorted by username.
+    """
+    matches: int
+    winner_changed: int
+    unfinished: int
+    players: dict[str, PlayerImpact]
+
+
+class Rules:
+    """Scores for recorded rolls under a match's own rules and the alternative ones, cached per distinct roll."""
+    def __init__(self, recorded: RollTable, alternative: RollTable):
+        self.recorded, self.alternative = recorded, alternative
+        self.seen: dict[tuple[int, ...], tuple[int, int, int]] = {}
+
+    def __call__(self, faces: tuple[int, ...]) -> tuple[int, int, int]:
+        """``(recorded score, recorded dice used, alternative score)`` of one roll."""
+        outcome = self.seen.get(faces)
+        if outcome is None:
+            dice = [Die(face) for face in faces]
+            outcome = self.seen[faces] = self.recorded.score(dice) + self.alternative.score(dice)[:1]
+        return outcome
+
+
+def rescore_match(match: ArchivedMatch, rules: Rules, hot_dice_enabled: bool | None = None) -> Rescored:
+    """Replay ``match`` with its recorded dice and decisions, scoring every roll under ``rules.alternative``.
+
+    Each turn keeps the dice and bank/roll choices that were recorded and
+    ends where the recorded turn ended, or earlier if the new rules end it:
+    a roll they score nothing on farkles, and with hot dice turned off a
+    pool reset auto-banks. A turn the new rules would have let go on (a
+    recorded farkle they score, or a recorded auto-bank with hot dice now
+    on) banks what it has, since no further dice were rolled. The match
+    ends on the first turn that reaches the target.
+
+    :param hot_dice_enabled: Hot-dice setting to replay under (default: the match's own).
+    """
+    hot = match.hot_dice_enabled if hot_dice_enabled is None else hot_dice_enabled
+    points = [0] * len(match.usernames)
+    seat = turns = tentative = n = 0
+    done = True  # nothing to bank before the first turn
+    for move in match.moves():
+        kind = move[0]
+        if kind == "turn":
+            seat, tentative, n, done = move[1], 0, match.num_dice, False
+            continue
+        if done:
+            continue
+        if kind == "roll":
+            score, used, score_now = rules(move[1])
+            if score_now == 0:
+                tentative = 0
+                done = True
+            tentative += score_now
+            if score == 0:  # the recorded turn farkled here
+                done = True
+            else:
+                n -= used
+                if n == 0:
+                    n = match.num_dice
+                    done = done or not match.hot_dice_enabled or not hot
+        elif kind == "decision":
+            if move[1] == "q":
+                return Rescored(points, None, turns + 1)
+            done = move[1] == "b"
+        if done:
+            points[seat] += tentative
+            turns += 1
+            if points[seat] >= match.target_score:
+                return Rescored(points, seat, turns)
+    return Rescored(points, None, turns)
+
+
+class _Rescorer:
+    """Replays runs of matches under one alternative rule set and keeps mergeable tallies."""
+    def __init__(self, method: str, hot_dice_enabled: bool | None):
+        from .game import Game
+        if method not in Game.scoring_methods:
+            raise ValueError(f"unknown scoring method {method!r}; choose from {', '.join(Game.scoring_methods)}")
+        self.method, self.hot_dice_enabled = method, hot_dice_enabled
+        self.rules: dict[tuple[str, int], Rules] = {}
+
+    def rules_for(self, match: ArchivedMatch) -> Rules:
+        from .game import Game
+        key = (match.method, match.num_dice)
+        rules = self.rules.get(key)
+        if rules is None:
+            if match.method not in Game.scoring_methods:
+                raise ValueError(f"match {match.number} uses scoring method {match.method!r}, "
+                                 f"which cannot be replayed")
+            rules = self.rules[key] = Rules(RollTable(Game.scoring_methods[match.method], match.num_dice),
+                                            RollTable(Game.scoring_methods[self.method], match.num_dice))
+        return rules
+
+    def scan(self, archive: MatchArchive, start: int, stop: int) -> list:
+        """Tallies of matches ``start``..``stop``: ``[matches, winner changed, unfinished, {username: [4 counts]}]``."""
+        matches = changed = unfinished = 0
+        players: dict[str, list[int]] = {}
+        for number in range(start, stop):
+            match = archive[number]
+            rescored = rescore_match(match, self.rules_for(match), self.hot_dice_enabled)
+            matches += 1
+            changed += rescored.winner != match.winner
+            unfinished += rescored.winner is None
+            for seat, username in enumerate(match.usernames):
+                tally = players.setdefault(username, [0, 0, 0, 0])
+                tally[0] += 1
+                tally[1] += rescored.points[seat] - match.points[seat]
+                tally[2] += seat == match.winner
+                tally[3] += seat == rescored.winner
+        return [matches, changed, unfinished, players]
+
+    @staticmethod
+    def merge(total: list, part: list):
+        for k in range(3):
+            total[k] += part[k]
+        for username, tally in part[3].items():
+            into = total[3].setdefault(username, [0, 0, 0, 0])
+            for k in range(4):
+                into[k] += tally[k]
+
+
+# --- worker side: each process opens the archive and builds the roll tables once ---
+
+_worker: dict = {}
+
+
+def _init_worker(directory: str, method: str, hot_dice_enabled: bool | None):
+    _worker.update(archive=MatchArchive(directory), rescorer=_Rescorer(method, hot_dice_enabled))
+
+
+def _scan(span: tuple[int, int]) -> list:
+    return _worker["rescorer"].scan(_worker["archive"], *span)
+
+
+def rescore(method: str, hot_dice_enabled: bool | None = None, directory: str = ARCHIVE_DIR,
+            workers: int | None = None, chunk: int = 5000) -> RescoreReport:
+    """Replay every archived match under scoring ``method`` (and optionally another hot-dice setting).
+
+    Works like :func:`~farkle.query.run_query`: the archive is split into
+    runs of ``chunk`` matches, each worker maps its own view of the archive
+    and returns per-player tallies, which are summed here.
+
+    :param method: Name in ``Game.scoring_methods`` to score the recorded rolls with.
+    :param workers: Processes to use (default: CPU count; 1 runs inline).
+    :raises ValueError: For an unknown method or a match that cannot be replayed.
+    """
+    rescorer = _Rescorer(method, hot_dice_enabled)
+    count = len(MatchArchive(directory))
+    spans = [(start, min(start + chunk, count)) for start in range(0, count, chunk)]
+    workers = min(workers or os.cpu_count() or 1, len(spans)) or 1
+    total = [0, 0, 0, {}]
+    if workers == 1:
+        archive = MatchArchive(directory)
+        try:
+            for span in spans:
+                rescorer.merge(total, rescorer.scan(archive, *span))
+        finally:
+            archive.close()
+    else:
+        with Pool(workers, _init_worker, (directory, method, hot_dice_enabled)) as pool:
+            for part in pool.imap_unordered(_scan, spans):
+                rescorer.merge(total, part)
+    players = {username: PlayerImpact(*tally) for username, tally in sorted(total[3].items())}
+    return RescoreReport(total[0], total[1], total[2], players)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    from .game import Game
+
+    parser = argparse.ArgumentParser(description="Replay archived matches under another scoring method "
+                                                 "or hot-dice setting, keeping the recorded dice and choices")
+    parser.add_argument("method", choices=list(Game.scoring_methods))
+    parser.add_argument("--hot-dice", choices=["on", "off"], default=None,
+                        help="replay with Hot Dice on or off (default: as recorded)")
+    parser.add_argument("--directory", default=ARCHIVE_DIR)
+    parser.add_argument("--workers", type=int, default=None)
+    options = parser.parse_args()
+
+    began = time.perf_counter()
+    try:
+        report = rescore(options.method, None if options.hot_dice is None else options.hot_dice == "on",
+                         options.directory, options.workers)
+    except ValueError as error:
+        parser.error(str(error))
+    print("Player     Matches  Mean delta  Wins (recorded → rescored)\n"
+          "-----------------------------------------------------------")
+    for username, impact in report.players.items():
+        print(f"{username: <10} {impact.matches:>7}  {impact.delta / impact.matches:>+10.1f}  "
+              f"{impact.wins} → {impact.rescored_wins}")
+    print(f"{report.winner_changed} of {report.matches} winners change "
+          f"({report.unfinished} matches nobody finishes) ({time.perf_counter() - began:.1f}s)")
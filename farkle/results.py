@@ -0,0 +1,231 @@
+import json
+import os
+import tempfile
+from array import array
+from collections.abc import Iterator, Sequence
+
+RESULTS_DIR = "results"
+
+# one entry per match
+MATCH_COLUMNS = {
+    "seed": "q",      # dice seed, -1 when the match was not seeded
+    "method": "H",    # code into the chunk's ``methods`` list
+    "target": "l",
+    "dice": "B",
+    "hot": "B",
+    "players": "H",   # how many entries the match owns in the player columns
+    "turns": "l",
+    "winner": "l",    # seat index
+    "duration": "d",  # seconds
+}
+# ``players`` entries per match, seat order
+PLAYER_COLUMNS = {
+    "username": "I",  # code into the chunk's ``usernames`` list
+    "points": "l",
+}
+
+
+class ResultChunk:
+    """A block of matches stored column by column in typed arrays.
+
+    String columns are dictionary-encoded: ``method`` and ``username`` hold
+    small integer codes into ``methods`` and ``usernames``, which are local
+    to the chunk so every chunk file can be read on its own.
+
+    Attributes
+    ----------
+    columns : dict[str, array]
+        Every match and player column by name.
+    methods, usernames : list[str]
+        Category names referenced by the coded columns.
+    """
+    def __init__(self):
+        self.columns: dict[str, array] = {name: array(code) for name, code in
+                                          (MATCH_COLUMNS | PLAYER_COLUMNS).items()}
+        self.methods: list[str] = []
+        self.usernames: list[str] = []
+        self._codes: dict[str, dict[str, int]] = {"methods": {}, "usernames": {}}
+
+    def __len__(self) -> int:
+        return len(self.columns["seed"])
+
+    def _code(self, kind: str, name: str) -> int:
+        codes = self._codes[kind]
+        code = codes.get(name)
+        if code is None:
+            code = codes[name] = len(codes)
+            getattr(self, kind).append(name)
+        return code
+
+    def append(self, seed: int, method: str, target: int, dice: int, hot: bool, usernames: Sequence[str],
+               points: Sequence[int], turns: int, winner: int, duration: float):
+        """Add one match row.
+
+        The row is packed into its column types before any column grows, so a
+        value that does not fit raises ``OverflowError`` and leaves the chunk
+        as it was instead of with columns of different lengths.
+        """
+        if len(points) != len(usernames):
+            raise ValueError(f"{len(usernames)} usernames but {len(points)} point totals")
+        values = {"seed": [seed], "target": [target], "dice": [dice], "hot": [hot], "players": [len(usernames)],
+                  "turns": [turns], "winner": [winner], "duration": [duration], "points": points}
+        row = {name: array(self.columns[name].typecode, column) for name, column in values.items()}
+        row["method"] = array(self.columns["method"].typecode, [self._code("methods", method)])
+        row["username"] = array(self.columns["username"].typecode,
+                                [self._code("usernames", name) for name in usernames])
+        for name, column in self.columns.items():
+            column.extend(row[name])
+
+    def to_bytes(self) -> bytes:
+        """One JSON header line (row count, categories, column byte lengths) then the raw columns."""
+        header = {"rows": len(self), "methods": self.methods, "usernames": self.usernames,
+                  "columns": [[name, col.typecode, col.itemsize * len(col)] for name, col in self.columns.items()]}
+        return json.dumps(header).encode() + b"\n" + b"".join(col.tobytes() for col in self.columns.values())
+
+    @staticmethod
+    def read(path: str) -> "ResultChunk":
+        chunk = ResultChunk()
+        with open(path, "rb") as f:
+            header = json.loads(f.readline())
+            for name, code, size in header["columns"]:
+                column = array(code)
+                column.frombytes(f.read(size))
+                chunk.columns[name] = column
+        chunk.methods, chunk.usernames = header["methods"], header["usernames"]
+        chunk._codes = {"methods": {name: i for i, name in enumerate(chunk.methods)},
+                        "usernames": {name: i for i, name in enumerate(chunk.usernames)}}
+        return chunk
+
+
+class ResultStore:
+    """Append-only store of finished matches, written in fixed-size chunk files.
+
+    Matches accumulate in an in-memory :class:`ResultChunk` that is written
+    to ``chunk-NNNNNN.bin`` once it holds ``chunk_size`` matches. A partial
+    chunk written by :meth:`flush` is reopened and topped up by the next
+    store on the same directory, so every file but the last is full.
+    Aggregations read one chunk at a time, so memory stays bounded by the
+    chunk size however many matches are stored.
+
+    Attributes
+    ----------
+    directory : str
+        Where chunk files live.
+    chunk_size : int
+        Matches per chunk file.
+    """
+    def __init__(self, directory: str = RESULTS_DIR, chunk_size: int = 4096):
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        self.directory: str = directory
+        self.chunk_size: int = chunk_size
+        paths = self._paths()
+        self._index: int = len(paths)
+        self._buffer: ResultChunk = ResultChunk()
+        if paths:
+            last = ResultChunk.read(paths[-1])
+            if len(last) < chunk_size:
+                self._index -= 1
+                self._buffer = last
+        self._dirty: bool = False
+
+    def _paths(self) -> list[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        names = sorted(name for name in os.listdir(self.directory)
+                       if name.startswith("chunk-") and name.endswith(".bin"))
+        return [os.path.join(self.directory, name) for name in names]
+
+    def record(self, method: str, target: int, dice: int, hot: bool, usernames: Sequence[str],
+               points: Sequence[int], turns: int, winner: int, duration: float, seed: int = -1):
+        """Append one finished match, writing the chunk out once it is full."""
+        self._buffer.append(seed, method, target, dice, hot, usernames, points, turns, winner, duration)
+        self._dirty = True
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+            self._index += 1
+            self._buffer = ResultChunk()
+
+    def flush(self):
+        """Write the current chunk (even if partial) atomically."""
+        if not self._dirty:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"chunk-{self._index:06d}.bin")
+        fd, temp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._buffer.to_bytes())
+            os.replace(temp, path)
+        except BaseException:
+            os.unlink(temp)
+            raise
+        self._dirty = False
+
+    def chunks(self) -> Iterator[ResultChunk]:
+        """Stream every stored chunk, including matches not yet flushed."""
+        paths = self._paths()[:self._index]
+        for path in paths:
+            yield ResultChunk.read(path)
+        if len(self._buffer):
+            yield self._buffer
+
+    def __len__(self) -> int:
+        return sum(len(chunk) for chunk in self.chunks())
+
+    def group_mean(self, key: str, value: str) -> dict:
+        """Mean of a match column grouped by another, e.g. ``group_mean("target", "turns")``.
+
+        ``method`` keys are reported by name.
+
+        :return: ``{key value: mean}`` sorted by key.
+        :rtype: dict
+        """
+        sums: dict = {}
+        for chunk in self.chunks():
+            keys = chunk.columns[key]
+            if key == "method":
+                keys = [chunk.methods[code] for code in keys]
+            for k, v in zip(keys, chunk.columns[value]):
+                total = sums.get(k)
+                if total is None:
+                    sums[k] = [v, 1]
+                else:
+                    total[0] += v
+                    total[1] += 1
+        return {k: total / count for k, (total, count) in sorted(sums.items())}
+
+    def win_rates(self, by: str = "method") -> dict[tuple, tuple[int, int]]:
+        """Wins and games per player, split by a match column (default: scoring method).
+
+        :return: ``{(group, username): (wins, games)}``.
+        :rtype: dict[tuple, tuple[int, int]]
+        """
+        tally: dict[tuple, list[int]] = {}
+        for chunk in self.chunks():
+            c = chunk.columns
+            groups = c[by]
+            names, codes = chunk.usernames, c["username"]
+            offset = 0
+            for row, seats in enumerate(c["players"]):
+                group = chunk.methods[groups[row]] if by == "method" else groups[row]
+                winner = c["winner"][row]
+                for seat in range(seats):
+                    counts = tally.setdefault((group, names[codes[offset + seat]]), [0, 0])
+                    counts[0] += seat == winner
+                    counts[1] += 1
+                offset += seats
+        return {k: (wins, games) for k, (wins, games) in sorted(tally.items())}
+
+
+if __name__ == "__main__":
+    import sys
+
+    store = ResultStore(sys.argv[1] if len(sys.argv) > 1 else RESULTS_DIR)
+    print(f"{len(store)} matches")
+    print("\nWin rate by scoring method\n--------------------------")
+    for (method, username), (wins, games) in store.win_rates("method").items():
+        print(f"{method: <10} {username: <10} {wins / games:6.1%} of {games}")
+    print("\nMean turns by target score\n--------------------------")
+    for target, turns in store.group_mean("target", "turns").items():
+        print(f"{target: <10} {turns:6.1f}")
@@ -0,0 +1,237 @@
+import contextlib
+import io
+import random
+from array import array
+from collections import Counter
+from functools import cached_property
+from itertools import combinations_with_replacement, product
+from math import factorial
+
+from .dice import Die
+
+
+class RollTable:
+    """Precomputed ``(score, used)`` outcome for every roll of 1..``num_dice`` dice.
+
+    Each distinct roll (as a multiset of faces) is scored exactly once with the
+    given scoring method, with its console output silenced, so lookups follow
+    the same rules as :meth:`Game.calculate_score`. Rolls are addressed by a
+    base-6 index so a single uniform draw selects a whole roll.
+
+    Attributes
+    ----------
+    num_dice : int
+        Largest number of dice covered by the table (1–6).
+    outcomes : list[list[tuple[int, int]]]
+        ``outcomes[n][index]`` is the ``(score, used)`` pair of roll ``index``
+        of ``n`` dice. ``outcomes[0]`` is empty.
+    sizes : list[int]
+        ``sizes[n] == 6 ** n``, the number of ordered rolls of ``n`` dice.
+    """
+    def __init__(self, calculate_score=None, num_dice: int = 6):
+        if not 1 <= num_dice <= 6:
+            raise ValueError(f"num_dice must be between 1 and 6, got {num_dice}")
+        if calculate_score is None:
+            from .game import Game  # game.py imports the strategies built on this module
+            calculate_score = Game.scoring_methods["default"]
+
+        self.num_dice: int = num_dice
+        self.sizes: list[int] = [6 ** n for n in range(num_dice + 1)]
+        self._multisets: list[dict[tuple[int, ...], tuple[int, int]]] = [{}]
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            for n in range(1, num_dice + 1):
+                self._multisets.append({faces: calculate_score([Die(f) for f in faces])
+                                        for faces in combinations_with_replacement(range(1, 7), n)})
+
+    @cached_property
+    def outcomes(self) -> list[list[tuple[int, int]]]:
+        """Outcome of every ordered roll, expanded on first use (46656 entries for 6 dice)."""
+        outcomes: list[list[tuple[int, int]]] = [[]]
+        for n in range(1, self.num_dice + 1):
+            scored = self._multisets[n]
+            outcomes.append([scored[tuple(sorted(roll))] for roll in product(range(1, 7), repeat=n)])
+        return outcomes
+
+    def lookup(self, n: int, u: float) -> tuple[int, int]:
+        """Map a uniform draw ``u`` in [0, 1) to the outcome of rolling ``n`` dice.
+
+        :param n: Number of dice rolled.
+        :type n: int
+        :param u: Uniform random number in ``[0, 1)``.
+        :type u: float
+        :return: The ``(score, used)`` pair for the selected roll.
+        :rtype: tuple[int, int]
+        """
+        return self.outcomes[n][int(u * self.sizes[n])]
+
+    def score(self, selection: list[Die]) -> tuple[int, int]:
+        """Silent, table-driven drop-in for the scoring method the table was built from.
+
+        :param selection: Dice to score (1..``num_dice`` of them).
+        :type selection: list[Die]
+        :rtype: tuple[int, int]
+        """
+        return self._multisets[len(selection)][tuple(sorted(d.value for d in selection))]
+
+    def distribution(self, n: int) -> list[tuple[float, int, int]]:
+        """Exact outcome distribution of rolling ``n`` dice.
+
+        :param n: Number of dice rolled.
+        :type n: int
+        :return: ``(probability, score, used)`` triples, one per distinct
+                 outcome, sorted by ``(score, used)``.
+        :rtype: list[tuple[float, int, int]]
+        """
+        weights: Counter = Counter()
+        for faces, outcome in self._multisets[n].items():
+            ways = factorial(n)
+            for count in Counter(faces).values():
+                ways //= factorial(count)
+            weights[outcome] += ways
+        total = self.sizes[n]
+        return [(w / total, score, used) for (score, used), w in sorted(weights.items())]
+
+    def farkle_probability(self, n: int) -> float:
+        """Probability that rolling ``n`` dice scores nothing.
+
+        :param n: Number of dice rolled.
+        :type n: int
+        :rtype: float
+        """
+        return sum(p for p, score, _ in self.distribution(n) if score == 0)
+
+
+class StoppingRuleGrid:
+    """Expected banked points per turn for a grid of stopping rules.
+
+    Rule ``(threshold, dice_left)`` banks once the pool is not fresh and either
+    the tentative score reaches ``threshold`` or at most ``dice_left`` dice
+    remain — the shape of the bot rule in :meth:`Game.get_player_choice`,
+    which is ``(500, 3)``.
+
+    Attributes
+    ----------
+    thresholds : list[int]
+        Row labels of the grid.
+    dice_left : list[int]
+        Column labels of the grid.
+    means : list[list[float]]
+        ``means[i][j]`` is the mean banked score for
+        ``(thresholds[i], dice_left[j])``.
+    turns : int
+        Number of simulated turns behind each cell.
+    """
+    def __init__(self, thresholds: list[int], dice_left: list[int], means: list[list[float]], turns: int):
+        self.thresholds: list[int] = thresholds
+        self.dice_left: list[int] = dice_left
+        self.means: list[list[float]] = means
+        self.turns: int = turns
+
+    def __getitem__(self, rule: tuple[int, int]) -> float:
+        threshold, dice_left = rule
+        return self.means[self.thresholds.index(threshold)][self.dice_left.index(dice_left)]
+
+    def best(self) -> tuple[int, int]:
+        """Return the ``(threshold, dice_left)`` rule with the highest mean."""
+        return max(((t, d) for t in self.thresholds for d in self.dice_left), key=self.__getitem__)
+
+    def render(self) -> str:
+        """Format the grid as a text heatmap; the best rule is marked with ``<``."""
+        shades = " .:-=+#%@"
+        flat = [m for row in self.means for m in row]
+        low, high = min(flat), max(flat)
+        span = (high - low) or 1.0
+        best = self.best()
+
+        lines = [f"Expected banked points per turn ({self.turns} turns per rule)",
+                 "threshold \\ dice-left " + "".join(f"{d:>9}" for d in self.dice_left)]
+        for t, row in zip(self.thresholds, self.means):
+            cells = []
+            for d, mean in zip(self.dice_left, row):
+                shade = shades[int((mean - low) / span * (len(shades) - 1))]
+                cells.append(f"{mean:>7.1f}{'<' if (t, d) == best else ' '}{shade}")
+            lines.append(f"{t:>21} " + "".join(cells))
+        return "\n".join(lines)
+
+
+def simulate_stopping_rules(turns: int, thresholds: list[int], dice_left: list[int],
+                            calculate_score=None, num_dice: int = 6, hot_dice_enabled: bool = True,
+                            seed: int | None = None, table: RollTable | None = None) -> StoppingRuleGrid:
+    """Simulate ``turns`` turns in lockstep under every stopping rule in the grid.
+
+    All rules share the same random draws: the ``k``-th roll of turn ``m``
+    uses the same uniform number under every rule, so differences between
+    cells come from the rules and not from luck. Each turn follows
+    :meth:`Game.iter_events`: a scoreless roll is a farkle and banks nothing,
+    scoring dice are removed as in :meth:`Game.record_roll`, and when every
+    die has scored the pool is reset (hot dice) or the turn auto-banks.
+
+    :param turns: Number of turns simulated per rule.
+    :type turns: int
+    :param thresholds: Tentative-score thresholds (grid rows).
+    :type thresholds: list[int]
+    :param dice_left: Remaining-dice cutoffs (grid columns).
+    :type dice_left: list[int]
+    :param calculate_score: Scoring method; defaults to ``Game.scoring_methods["default"]``.
+    :param num_dice: Dice in a fresh pool (1–6).
+    :type num_dice: int
+    :param hot_dice_enabled: Whether scoring every die resets the pool.
+    :type hot_dice_enabled: bool
+    :param seed: Seed for the shared random draws.
+    :type seed: int | None
+    :param table: Prebuilt :class:`RollTable` to reuse across calls.
+    :type table: RollTable | None
+    :return: Mean banked points per rule.
+    :rtype: StoppingRuleGrid
+    """
+    if table is None:
+        table = RollTable(calculate_score, num_dice)
+    rng = random.Random(seed)
+    draws: list[array] = []  # draws[k][m]: uniform for the k-th roll of turn m
+    outcomes, sizes = table.outcomes, table.sizes
+
+    means: list[list[float]] = []
+    for threshold in thresholds:
+        row = []
+        for cutoff in dice_left:
+            tentative = array("l", [0]) * turns
+            remaining = array("l", [num_dice]) * turns
+            alive = list(range(turns))
+            banked = 0
+            step = 0
+            while alive:
+                if step == len(draws):
+                    draws.append(array("d", (rng.random() for _ in range(turns))))
+                u = draws[step]
+                still_alive = []
+                for m in alive:
+                    n = remaining[m]
+                    score, used = outcomes[n][int(u[m] * sizes[n])]
+                    if score == 0:  # farkle
+                        continue
+                    t = tentative[m] + score
+                    n -= used
+                    if n == 0:
+                        if not hot_dice_enabled:
+                            banked += t
+                            continue
+                        n = num_dice
+                    if n != num_dice and (t >= threshold or n <= cutoff):
+                        banked += t
+                        continue
+                    tentative[m] = t
+                    remaining[m] = n
+                    still_alive.append(m)
+                alive = still_alive
+                step += 1
+            row.append(banked / turns)
+        means.append(row)
+
+    return StoppingRuleGrid(list(thresholds), list(dice_left), means, turns)
+
+
+if __name__ == "__main__":
+    grid = simulate_stopping_rules(20000, list(range(0, 1601, 200)), list(range(0, 6)), seed=1)
+    print(grid.render())
+    print(f"Best rule: threshold={grid.best()[0]}, dice-left={grid.best()[1]}")
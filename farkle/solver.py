@@ -0,0 +1,307 @@
+import json
+import os
+from functools import lru_cache
+from multiprocessing import Pool, shared_memory
+
+from .odds import turn_odds
+
+POLICY_DIR = "policies"
+
+
+class _Layout:
+    """Index arithmetic for the packed (own, opponent, turn, dice) tables.
+
+    Scores are stored in units of ``step``; ``grid = target // step``. Only
+    turn scores that do not already reach the target are stored, so the
+    block for own score ``i`` holds ``grid - i`` turn scores per opponent
+    score, which halves the table compared with a full cube.
+    """
+    def __init__(self, grid: int, num_dice: int):
+        self.grid: int = grid
+        self.num_dice: int = num_dice
+        self.base: list[int] = []
+        size = 0
+        for i in range(grid):
+            self.base.append(size)
+            size += grid * (grid - i) * (num_dice + 1)
+        self.size: int = size
+
+    def index(self, i: int, j: int, t: int, n: int) -> int:
+        return self.base[i] + (j * (self.grid - i) + t) * (self.num_dice + 1) + n
+
+
+class Policy:
+    """Solved bank/roll decisions for two-player games under one rule set.
+
+    Attributes
+    ----------
+    meta : dict
+        ``target``, ``step``, ``num_dice``, ``hot_dice`` and ``method`` the
+        policy was solved for.
+    rolls : bytearray
+        One byte per state, 1 where rolling maximizes the win probability.
+    start_win_probability : float
+        Win probability of the player who moves first, both playing optimally.
+    """
+    def __init__(self, meta: dict, rolls: bytearray):
+        self.meta: dict = meta
+        self.rolls: bytearray = rolls
+        self._layout: _Layout = _Layout(meta["target"] // meta["step"], meta["num_dice"])
+
+    @property
+    def start_win_probability(self) -> float:
+        return self.meta.get("start_win_probability", 0.0)
+
+    def should_roll(self, points: int, opponent_points: int, tentative_score: int, remaining_dice: int) -> bool:
+        """Look up the solved decision; banking is chosen whenever it wins outright."""
+        step, grid = self.meta["step"], self._layout.grid
+        i, j, t = points // step, min(opponent_points // step, grid - 1), tentative_score // step
+        if i + t >= grid:
+            return False
+        return bool(self.rolls[self._layout.index(i, j, t, remaining_dice)])
+
+    def save(self, path: str):
+        """Write the policy as one JSON header line followed by the raw decision bytes."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(json.dumps(self.meta).encode() + b"\n")
+            f.write(self.rolls)
+
+    @staticmethod
+    def load(path: str) -> "Policy":
+        with open(path, "rb") as f:
+            meta = json.loads(f.readline())
+            return Policy(meta, bytearray(f.read()))
+
+
+def method_name(calculate_score) -> str:
+    """Name of a scoring method in ``Game.scoring_methods`` (preferring an explicit name over "default")."""
+    from .game import Game
+    names = [name for name, method in Game.scoring_methods.items() if method is calculate_score]
+    names.sort(key=lambda name: name == "default")
+    return names[0] if names else "custom"
+
+
+def policy_path(method: str, target: int, num_dice: int = 6, hot_dice_enabled: bool = True) -> str:
+    """Where :func:`solve` saves, and the ``solved`` strategy looks for, a policy."""
+    return os.path.join(POLICY_DIR, f"{method}-{target}-{num_dice}{'-hot' if hot_dice_enabled else ''}.bin")
+
+
+@lru_cache(maxsize=8)
+def _load_policy(method: str, target: int, num_dice: int, hot_dice_enabled: bool) -> Policy:
+    return Policy.load(policy_path(method, target, num_dice, hot_dice_enabled))
+
+
+def load_policy(method: str, target: int, num_dice: int = 6, hot_dice_enabled: bool = True) -> Policy | None:
+    """Load (once) the saved policy for a rule set, or None if it has not been solved.
+
+    Misses are not cached, so a policy solved later in the session is found.
+    """
+    try:
+        return _load_policy(method, target, num_dice, hot_dice_enabled)
+    except FileNotFoundError:
+        return None
+
+
+load_policy.cache_clear = _load_policy.cache_clear
+
+
+# --- worker side: every process attaches to the same two shared-memory blocks ---
+
+_shared: dict = {}
+
+
+def _attach(values_name: str, rolls_name: str, grid: int, num_dice: int, hot_dice_enabled: bool,
+            step: int, method: str):
+    from .game import Game
+    values = shared_memory.SharedMemory(name=values_name)
+    rolls = shared_memory.SharedMemory(name=rolls_name)
+    odds = turn_odds(Game.scoring_methods[method], num_dice, hot_dice_enabled)
+    # per dice count: (probability, score steps gained, dice left or 0 to auto-bank)
+    moves = [[]]
+    for n in range(1, num_dice + 1):
+        row = []
+        for p, score, used in odds.outcomes[n]:
+            left = n - used
+            if left == 0 and hot_dice_enabled:
+                left = num_dice
+            row.append((p, score // step, left))
+        moves.append(row)
+    _shared.update(values_shm=values, rolls_shm=rolls, values=values.buf.cast("d"), rolls=rolls.buf,
+                   layout=_Layout(grid, num_dice), farkle=odds.farkle, moves=moves)
+
+
+def _detach():
+    values, rolls = _shared.pop("values"), _shared.pop("rolls")
+    values.release()
+    rolls.release()
+    _shared.pop("values_shm").close()
+    _shared.pop("rolls_shm").close()
+
+
+def _solve_block(i: int, j: int, opponent_start: float) -> tuple[float, float]:
+    """Recompute every state of own score ``i`` vs opponent ``j``.
+
+    ``opponent_start`` is the opponent's win probability at the start of
+    their turn from ``(j, i)`` — what a farkle hands them. Banking hands them
+    the turn at a higher combined score, which is already solved.
+
+    :return: This block's turn-start win probability and its derivative with
+             respect to ``opponent_start`` (for the Newton step in :func:`_solve_pair`).
+    """
+    values, rolls, layout = _shared["values"], _shared["rolls"], _shared["layout"]
+    farkle, moves = _shared["farkle"], _shared["moves"]
+    grid, num_dice = layout.grid, layout.num_dice
+    width = num_dice + 1
+    block = layout.index(i, j, 0, 0)  # state (i, j, t, n) lives at block + t * width + n
+    opponent = layout.base[j] + num_dice  # opponent turn start (j, i + t) at opponent + (i + t) * stride
+    stride = (grid - j) * width
+    lose_on_farkle = 1.0 - opponent_start
+    slopes = [0.0] * ((grid - i) * width)  # d value / d opponent_start, per block state
+
+    for t in range(grid - i - 1, -1, -1):
+        bank = 1.0 - values[opponent + (i + t) * stride] if t > 0 else 0.0
+        for n in range(1, width) if t > 0 else (num_dice,):
+            roll = farkle[n] * lose_on_farkle
+            slope = -farkle[n]
+            for p, gained, left in moves[n]:
+                t2 = t + gained
+                if i + t2 >= grid:
+                    roll += p
+                elif left == 0:  # hot dice off: all dice scored, bank automatically
+                    roll += p * (1.0 - values[opponent + (i + t2) * stride])
+                else:
+                    roll += p * values[block + t2 * width + left]
+                    slope += p * slopes[t2 * width + left]
+            k = block + t * width + n
+            if t > 0 and bank >= roll:
+                values[k], rolls[k] = bank, 0
+            else:
+                values[k], rolls[k] = roll, 1
+                slopes[t * width + n] = slope
+    return values[block + num_dice], slopes[num_dice]
+
+
+def _solve_pair(task: tuple[int, int, float]) -> float:
+    """One sweep for the score pair ``(i, j)`` / ``(j, i)`` of a layer.
+
+    The two blocks only depend on each other through their turn-start win
+    probabilities (a farkle hands the turn over at the same scores), so the
+    pair is an independent fixed point ``y = g(f(y))``. Both blocks are
+    recomputed from the current guess ``y`` for ``(j, i)``, then ``y`` takes a
+    Newton step using the derivatives from :func:`_solve_block`; with the
+    policy fixed the problem is linear, so a couple of sweeps converge.
+
+    :return: How far the guess was from consistent, ``|g(f(y)) - y|``.
+    """
+    i, j, y = task
+    values, layout, num_dice = _shared["values"], _shared["layout"], _shared["layout"].num_dice
+    x, dx = _solve_block(i, j, y)
+    if i == j:
+        residual, slope, guess = x - y, dx, y
+    else:
+        y2, dy = _solve_block(j, i, x)
+        residual, slope, guess = y2 - y, dy * dx, y
+    guess += residual / (1.0 - slope)
+    values[layout.index(j, i, 0, num_dice)] = min(1.0, max(0.0, guess))
+    return abs(residual)
+
+
+def solve(target_score: int = 10000, calculate_score=None, num_dice: int = 6, hot_dice_enabled: bool = True,
+          workers: int | None = None, tolerance: float = 1e-9, report=None) -> Policy:
+    """Compute the win-maximizing bank/roll policy for two-player games by value iteration.
+
+    States are ``(own score, opponent score, turn score, dice left)``. A bank
+    moves the game to a state with a larger combined score, so states are
+    solved in layers of equal combined score from the top down. Inside a
+    layer the only cycle is a farkle handing the turn to the opponent at the
+    same scores, so each layer is swept (see :func:`_solve_pair`) until the
+    turn-start win probabilities stop changing. Each sweep splits the
+    layer's score pairs across ``workers`` processes, which all read and
+    write one value table and one decision table in
+    ``multiprocessing.shared_memory``.
+
+    The table has roughly ``(target/step)^3 / 2 * (num_dice + 1)`` doubles
+    (about 220 MB for ``target_score=10000``).
+
+    :param target_score: Points needed to win.
+    :type target_score: int
+    :param calculate_score: A method from ``Game.scoring_methods``; defaults to ``"default"``.
+    :param num_dice: Dice in a fresh pool (1–6).
+    :type num_dice: int
+    :param hot_dice_enabled: Whether scoring every die resets the pool.
+    :type hot_dice_enabled: bool
+    :param workers: Worker processes; 1 solves in-process, None uses every core.
+    :type workers: int | None
+    :param tolerance: Stop sweeping a layer once no win probability moves more than this.
+    :type tolerance: float
+    :param report: Optional ``report(layer, sweep, delta)`` called after every sweep.
+    :return: The solved policy (not yet saved).
+    :rtype: Policy
+    :raises ValueError: If the method is not registered or the target is not
+                        a multiple of the scoring granularity.
+    """
+    from .game import Game
+    method = method_name(calculate_score or Game.scoring_methods["default"])
+    if method not in Game.scoring_methods:
+        raise ValueError("solve() needs a method registered in Game.scoring_methods")
+    step = turn_odds(Game.scoring_methods[method], num_dice, hot_dice_enabled).step
+    if target_score <= 0 or target_score % step:
+        raise ValueError(f"target_score must be a positive multiple of {step}")
+    grid = target_score // step
+    layout = _Layout(grid, num_dice)
+    workers = workers or os.cpu_count() or 1
+
+    values_shm = shared_memory.SharedMemory(create=True, size=layout.size * 8)
+    rolls_shm = shared_memory.SharedMemory(create=True, size=layout.size)
+    attach_args = (values_shm.name, rolls_shm.name, grid, num_dice, hot_dice_enabled, step, method)
+    pool = Pool(workers, initializer=_attach, initargs=attach_args) if workers > 1 else None
+    try:
+        _attach(*attach_args)
+        values, start = _shared["values"], lambda i, j: values[layout.index(i, j, 0, num_dice)]
+        for layer in range(2 * grid - 2, -1, -1):
+            pairs = [(i, layer - i) for i in range(max(0, layer - grid + 1), min(layer, grid - 1) + 1)
+                     if i <= layer - i]
+            sweep, delta = 0, 1.0
+            while delta > tolerance:
+                tasks = [(i, j, start(j, i)) for i, j in pairs]
+                deltas = pool.map(_solve_pair, tasks) if pool else map(_solve_pair, tasks)
+                delta = max(deltas)
+                sweep += 1
+                if report is not None:
+                    report(layer, sweep, delta)
+
+        meta = {"target": target_score, "step": step, "num_dice": num_dice, "hot_dice": hot_dice_enabled,
+                "method": method, "start_win_probability": start(0, 0)}
+        policy = Policy(meta, bytearray(_shared["rolls"]))
+        _detach()
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        values_shm.close()
+        values_shm.unlink()
+        rolls_shm.close()
+        rolls_shm.unlink()
+    return policy
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    from .game import Game
+
+    parser = argparse.ArgumentParser(description="Solve optimal bank/roll play and save the policy")
+    parser.add_argument("--target", type=int, default=10000)
+    parser.add_argument("--method", choices=list(Game.scoring_methods), default="default")
+    parser.add_argument("--dice", type=int, default=6)
+    parser.add_argument("--no-hot-dice", action="store_true")
+    parser.add_argument("--workers", type=int, default=None)
+    options = parser.parse_args()
+
+    began = time.perf_counter()
+    solved = solve(options.target, Game.scoring_methods[options.method], options.dice, not options.no_hot_dice,
+                   options.workers, report=lambda layer, sweep, delta: print(f"layer {layer:>4} sweep {sweep:>2}: max change {delta:.2e}"))
+    path = policy_path(solved.meta["method"], solved.meta["target"], options.dice, not options.no_hot_dice)
+    solved.save(path)
+    print(f"Solved in {time.perf_counter() - began:.1f}s; first player wins {solved.start_win_probability:.2%}; saved {path}")
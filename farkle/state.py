@@ -0,0 +1,179 @@
+from collections import OrderedDict
+from functools import lru_cache
+from typing import NamedTuple
+
+
+class GameState(NamedTuple):
+    """A decoded decision state.
+
+    Attributes
+    ----------
+    turn : int
+        Seat index of the player to move.
+    remaining_dice : int
+        Dice available for the next roll.
+    points : tuple[int, ...]
+        Banked match points per seat.
+    tentative_score : int
+        Points accumulated so far this turn.
+    """
+    turn: int
+    remaining_dice: int
+    points: tuple[int, ...]
+    tentative_score: int
+
+
+class StateCodec:
+    """Packs a whole bank/roll decision state into one non-negative integer.
+
+    Scores are stored in units of ``step`` (every score in this game is a
+    multiple of 50). From the low bits up the fields are the seat to move,
+    the remaining dice, each seat's banked points and finally the tentative
+    score. Banked points stay below the target at every decision (the match
+    ends as soon as anyone reaches it), so those fields have a fixed width;
+    the tentative score is unbounded and takes the high bits. Equal states
+    always encode to the same integer, so keys can be shared across games
+    with the same rules.
+
+    Attributes
+    ----------
+    num_players, num_dice, target_score, step : int
+        The rules the layout was sized for.
+    """
+    def __init__(self, num_players: int, num_dice: int = 6, target_score: int = 10000, step: int = 50):
+        if num_players < 1 or num_dice < 1 or target_score < 1 or step < 1:
+            raise ValueError("players, dice, target and step must all be positive")
+        self.num_players: int = num_players
+        self.num_dice: int = num_dice
+        self.target_score: int = target_score
+        self.step: int = step
+        self._turn_bits: int = (num_players - 1).bit_length()
+        self._dice_bits: int = num_dice.bit_length()
+        self._points_bits: int = ((target_score - 1) // step).bit_length()
+        self._points_shift: int = self._turn_bits + self._dice_bits
+        self._tentative_shift: int = self._points_shift + num_players * self._points_bits
+
+    def _units(self, score: int, name: str) -> int:
+        if score < 0 or score % self.step:
+            raise ValueError(f"{name} {score} is not a non-negative multiple of {self.step}")
+        return score // self.step
+
+    def encode(self, turn: int, remaining_dice: int, points, tentative_score: int) -> int:
+        """Pack a state; raises ``ValueError`` for states outside the layout.
+
+        :param turn: Seat index of the player to move.
+        :param remaining_dice: Dice available for the next roll (0..num_dice).
+        :param points: Banked points per seat, each below the target.
+        :param tentative_score: Points accumulated so far this turn.
+        :return: The packed key.
+        :rtype: int
+        """
+        if not 0 <= turn < self.num_players:
+            raise ValueError(f"turn {turn} is not a seat of a {self.num_players}-player game")
+        if not 0 <= remaining_dice <= self.num_dice:
+            raise ValueError(f"remaining_dice {remaining_dice} is outside 0..{self.num_dice}")
+        if len(points) != self.num_players:
+            raise ValueError(f"expected {self.num_players} point totals, got {len(points)}")
+
+        key = self._units(tentative_score, "tentative score")
+        for seat in range(self.num_players - 1, -1, -1):
+            if points[seat] >= self.target_score:
+                raise ValueError(f"seat {seat} has already reached the target")
+            key = (key << self._points_bits) | self._units(points[seat], "points")
+        key = (key << self._dice_bits) | remaining_dice
+        return (key << self._turn_bits) | turn
+
+    def decode(self, key: int) -> GameState:
+        """Unpack a key produced by :meth:`encode`."""
+        if key < 0:
+            raise ValueError("state keys are non-negative")
+        turn = key & ((1 << self._turn_bits) - 1)
+        key >>= self._turn_bits
+        remaining_dice = key & ((1 << self._dice_bits) - 1)
+        key >>= self._dice_bits
+        mask = (1 << self._points_bits) - 1
+        points = []
+        for _ in range(self.num_players):
+            points.append((key & mask) * self.step)
+            key >>= self._points_bits
+        return GameState(turn, remaining_dice, tuple(points), key * self.step)
+
+
+@lru_cache(maxsize=None)
+def state_codec(num_players: int, num_dice: int = 6, target_score: int = 10000, step: int = 50) -> StateCodec:
+    """Return the shared :class:`StateCodec` for a rule set."""
+    return StateCodec(num_players, num_dice, target_score, step)
+
+
+class TranspositionTable:
+    """Size-bounded map from packed state keys to cached evaluations.
+
+    Least recently used entries are evicted once ``capacity`` is reached, so
+    a long-running bot keeps the states it revisits (the opening of every
+    turn, common endgame totals) and forgets one-off positions.
+
+    Attributes
+    ----------
+    capacity : int
+        Maximum number of stored entries.
+    hits, misses : int
+        Lookup counters, for judging whether the table pays off.
+    """
+    def __init__(self, capacity: int = 1 << 16):
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity: int = capacity
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[int, object] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._entries
+
+    def get(self, key: int, default=None):
+        """Return the stored evaluation (marking it recently used) or ``default``."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def store(self, key: int, value) -> None:
+        """Insert or refresh an entry, evicting the least recently used one if full."""
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+        elif len(entries) >= self.capacity:
+            entries.popitem(last=False)
+        entries[key] = value
+
+    def lookup(self, key: int, evaluate):
+        """Return the cached evaluation of ``key``, computing and storing ``evaluate()`` on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = evaluate()
+            self.store(key, value)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def transposition_table(rules: tuple, capacity: int = 1 << 16) -> TranspositionTable:
+    """Return the table shared by every bot playing under ``rules``.
+
+    ``rules`` is any hashable description of the rule set (see
+    :meth:`Game.rules`); keys are only comparable under identical rules.
+    """
+    return TranspositionTable(capacity)
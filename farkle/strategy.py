@@ -0,0 +1,144 @@
+from typing import NamedTuple
+
+from .odds import turn_odds
+from .solver import load_policy, method_name
+from .tuner import load_tuned
+
+
+class DecisionState(NamedTuple):
+    """Everything a bot strategy may look at when choosing to bank or roll.
+
+    Attributes
+    ----------
+    tentative_score : int
+        Points accumulated so far this turn.
+    remaining_dice : int
+        Dice available for the next roll.
+    num_dice : int
+        Dice in a fresh pool.
+    points : int
+        The deciding player's banked match points.
+    opponent_points : int
+        Highest banked total among the other players.
+    target_score : int
+        Points required to win.
+    calculate_score : callable
+        The game's scoring method.
+    hot_dice_enabled : bool
+        Whether scoring every die resets the pool.
+    rules : tuple
+        Hashable rule set (:attr:`Game.rules`), for picking a shared
+        :func:`~farkle.state.transposition_table`.
+    state_key : int | None
+        The full game state packed by :meth:`Game.encode_state`, usable as a
+        transposition-table key under ``rules``. Only filled in for
+        strategies with a true ``uses_state_key`` attribute.
+    """
+    tentative_score: int
+    remaining_dice: int
+    num_dice: int = 6
+    points: int = 0
+    opponent_points: int = 0
+    target_score: int = 10000
+    calculate_score: object = None
+    hot_dice_enabled: bool = True
+    rules: tuple = ()
+    state_key: int | None = None
+
+
+def default(state: DecisionState) -> str:
+    """The original bot rule: bank at 500+ points or with 3 or fewer dice, never on a fresh 6-dice pool."""
+    if state.remaining_dice != 6 and (state.tentative_score >= 500 or state.remaining_dice <= 3):
+        return "b"
+    return "r"
+
+
+def max_ev(state: DecisionState) -> str:
+    """Roll exactly when that raises the turn's expected banked score (see :class:`TurnOdds`)."""
+    odds = turn_odds(state.calculate_score, state.num_dice, state.hot_dice_enabled)
+    return "r" if odds.should_roll(state.remaining_dice, state.tentative_score) else "b"
+
+
+def solved(state: DecisionState) -> str:
+    """Follow the win-maximizing policy saved by :func:`farkle.solver.solve` for these rules.
+
+    Falls back to :func:`max_ev` when no policy has been solved for the
+    game's scoring method, target, dice count and hot-dice setting.
+    """
+    policy = load_policy(method_name(state.calculate_score), state.target_score, state.num_dice,
+                         state.hot_dice_enabled)
+    if policy is None:
+        return max_ev(state)
+    return "r" if policy.should_roll(state.points, state.opponent_points, state.tentative_score,
+                                     state.remaining_dice) else "b"
+
+
+def tuned(state: DecisionState) -> str:
+    """Bank at the thresholds evolved by :func:`farkle.tuner.tune` for these rules.
+
+    Falls back to :func:`default` when nothing has been tuned for the game's
+    scoring method, dice count and hot-dice setting.
+    """
+    thresholds = load_tuned(method_name(state.calculate_score), state.num_dice, state.hot_dice_enabled)
+    return default(state) if thresholds is None else thresholds(state)
+
+
+def bandit(state: DecisionState) -> str:
+    """Portfolio mode: each match, a :class:`~farkle.bandit.Bandit` picks one of the other strategies
+    to play it (see :attr:`Player.playing`). Asked outside a match, it plays the strongest.
+    """
+    return strategies[strongest()](state)
+
+
+strategies = {
+    "default": default,
+    "max-ev": max_ev,
+    "solved": solved,
+    "tuned": tuned,
+    "bandit": bandit
+}
+
+# strategy names from strongest to weakest, used to pick hints and new bots
+strength_order = ["solved", "max-ev", "tuned", "default"]
+
+# strategies that ignore the opponents' habits, so :func:`~farkle.profile.endgame_choice` may overrule them
+heuristic = {"max-ev", "tuned", "default"}
+
+
+def strongest() -> str:
+    """Name of the strongest registered strategy."""
+    return next(name for name in strength_order if name in strategies)
+
+
+def preload_hints(calculate_score, target_score: int, num_dice: int = 6, hot_dice_enabled: bool = True):
+    """Build the odds tables and load the solved policy :func:`hint` reads, so the first prompt does not wait."""
+    turn_odds(calculate_score, num_dice, hot_dice_enabled)
+    if strongest() == "solved":
+        load_policy(method_name(calculate_score), target_score, num_dice, hot_dice_enabled)
+
+
+def _stand_in(name: str, state: DecisionState) -> str | None:
+    """The strategy ``name`` falls back to under ``state``'s rules, or None if it plays itself."""
+    method = method_name(state.calculate_score)
+    if name == "solved" and load_policy(method, state.target_score, state.num_dice, state.hot_dice_enabled) is None:
+        return "max-ev"
+    if name == "tuned" and load_tuned(method, state.num_dice, state.hot_dice_enabled) is None:
+        return "default"
+    return None
+
+
+def hint(state: DecisionState) -> str:
+    """One-line advice for a human: farkle risk, roll vs bank expectation and the strongest bot's pick.
+
+    Reads only the precomputed :class:`TurnOdds` tables, so it costs a few lookups. When the
+    strongest strategy has nothing saved for these rules, the hint names the one standing in for it.
+    """
+    odds = turn_odds(state.calculate_score, state.num_dice, state.hot_dice_enabled)
+    n, tentative = state.remaining_dice, state.tentative_score
+    name = strongest()
+    stand_in = _stand_in(name, state)
+    choice = strategies[stand_in or name](state)
+    bot = f"{stand_in} bot (no {name} data for these rules)" if stand_in else f"{name} bot"
+    return (f"Hint: {odds.farkle[n]:.0%} farkle risk with {n} dice | "
+            f"roll EV {odds.roll_ev(n, tentative):.0f} vs bank {tentative} | "
+            f"{bot} would {'bank' if choice == 'b' else 'roll'}")
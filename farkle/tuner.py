@@ -0,0 +1,315 @@
+import json
+import os
+import random
+import tempfile
+from bisect import bisect_right
+from functools import lru_cache
+from multiprocessing import Pool
+
+from .simulate import RollTable
+from .solver import POLICY_DIR, method_name
+
+# score-gap buckets (own points minus best opponent): far behind, behind, level, ahead, far ahead
+GAP_EDGES = (-3000, -1000, 1000, 3000)
+MAX_THRESHOLD = 5000
+NEVER = -1  # threshold of a cell that never banks
+STEP = 50
+
+
+class ThresholdStrategy:
+    """Bot rule with one bank threshold per dice count and score-gap bucket.
+
+    The bot banks once its tentative score reaches
+    ``thresholds[remaining_dice][bucket]``, where ``bucket`` indexes
+    :data:`GAP_EDGES` by how far ahead of the best opponent it is, and a
+    threshold of :data:`NEVER` always rolls. The
+    original rule (bank at 500, always bank with 3 or fewer dice, never bank
+    a fresh pool) is one such table, see :meth:`from_default`.
+
+    Attributes
+    ----------
+    num_dice : int
+        Dice in a fresh pool.
+    thresholds : list[list[int]]
+        ``thresholds[n][bucket]`` for ``n`` in 1..num_dice; row 0 is unused.
+    """
+    def __init__(self, thresholds: list[list[int]]):
+        self.num_dice: int = len(thresholds) - 1
+        self.thresholds: list[list[int]] = thresholds
+
+    def __call__(self, state) -> str:
+        gap = state.points - state.opponent_points
+        threshold = self.thresholds[state.remaining_dice][bisect_right(GAP_EDGES, gap)]
+        return "b" if threshold != NEVER and state.tentative_score >= threshold else "r"
+
+    @staticmethod
+    def from_default(num_dice: int = 6) -> "ThresholdStrategy":
+        """The original bot rule as a threshold table."""
+        buckets = len(GAP_EDGES) + 1
+        rows = [[0] * buckets]
+        for n in range(1, num_dice + 1):
+            rows.append([0 if n <= 3 else NEVER if n == num_dice else 500] * buckets)
+        return ThresholdStrategy(rows)
+
+    @property
+    def genes(self) -> list[int]:
+        """The thresholds flattened row by row, skipping the unused row 0."""
+        return [t for row in self.thresholds[1:] for t in row]
+
+    @staticmethod
+    def from_genes(genes: list[int], num_dice: int = 6) -> "ThresholdStrategy":
+        buckets = len(GAP_EDGES) + 1
+        if len(genes) != num_dice * buckets:
+            raise ValueError(f"expected {num_dice * buckets} genes, got {len(genes)}")
+        return ThresholdStrategy([[0] * buckets] + [list(genes[i:i + buckets])
+                                                    for i in range(0, len(genes), buckets)])
+
+    def to_dict(self) -> dict:
+        return {"gap_edges": list(GAP_EDGES), "thresholds": self.thresholds[1:]}
+
+    @staticmethod
+    def from_dict(data: dict) -> "ThresholdStrategy":
+        if tuple(data["gap_edges"]) != GAP_EDGES:
+            raise ValueError("thresholds were tuned for different score-gap buckets")
+        return ThresholdStrategy([[0] * (len(GAP_EDGES) + 1)] + data["thresholds"])
+
+
+def tuned_path(method: str, num_dice: int = 6, hot_dice_enabled: bool = True) -> str:
+    """Where :func:`tune` saves, and the ``tuned`` strategy looks for, the best thresholds."""
+    return os.path.join(POLICY_DIR, f"tuned-{method}-{num_dice}{'-hot' if hot_dice_enabled else ''}.json")
+
+
+@lru_cache(maxsize=8)
+def _load_tuned(method: str, num_dice: int, hot_dice_enabled: bool) -> ThresholdStrategy:
+    with open(tuned_path(method, num_dice, hot_dice_enabled)) as f:
+        return ThresholdStrategy.from_dict(json.load(f))
+
+
+def load_tuned(method: str, num_dice: int = 6, hot_dice_enabled: bool = True) -> ThresholdStrategy | None:
+    """Load (once) the tuned thresholds for a rule set, or None if none were saved.
+
+    Misses are not cached, so thresholds tuned later in the session are found.
+    """
+    try:
+        return _load_tuned(method, num_dice, hot_dice_enabled)
+    except FileNotFoundError:
+        return None
+
+
+load_tuned.cache_clear = _load_tuned.cache_clear
+
+
+def play_match(deciders: list, table: RollTable, seed: int, target_score: int = 10000, calculate_score=None,
+               num_dice: int = 6, hot_dice_enabled: bool = True) -> int:
+    """Play one silent match with the same rules as :meth:`Game.run` and return the winning seat.
+
+    Rolls come from ``table`` driven by ``random.Random(seed)``, so two
+    matches with the same seed see the same stream of dice.
+
+    :param deciders: One strategy per seat, called with a :class:`DecisionState`.
+    :type deciders: list
+    :param table: Precomputed roll outcomes for the rule set.
+    :type table: RollTable
+    :param seed: Seed of the dice stream.
+    :type seed: int
+    :rtype: int
+    """
+    from .strategy import DecisionState
+    rand = random.Random(seed).random
+    lookup = table.lookup
+    points = [0] * len(deciders)
+    while True:
+        for seat, decide in enumerate(deciders):
+            tentative, n = 0, num_dice
+            opponent = max(p for s, p in enumerate(points) if s != seat) if len(points) > 1 else 0
+            while True:
+                score, used = lookup(n, rand())
+                if score == 0:
+                    tentative = 0
+                    break
+                tentative += score
+                n -= used
+                if n == 0:
+                    if not hot_dice_enabled:
+                        break
+                    n = num_dice
+                state = DecisionState(tentative, n, num_dice, points[seat], opponent, target_score,
+                                      calculate_score, hot_dice_enabled)
+                if decide(state) == "b":
+                    break
+            points[seat] += tentative
+            if points[seat] >= target_score:
+                return seat
+
+
+# --- worker side: each process builds the roll table and reference bots once ---
+
+_worker: dict = {}
+
+
+def _init_worker(method: str, num_dice: int, hot_dice_enabled: bool, target_score: int, opponents: tuple):
+    from .game import Game
+    from .strategy import strategies
+    calculate_score = Game.scoring_methods[method]
+    _worker.update(table=RollTable(calculate_score, num_dice), calculate_score=calculate_score,
+                   num_dice=num_dice, hot=hot_dice_enabled, target=target_score,
+                   opponents=[strategies[name] for name in opponents])
+
+
+def _fitness(task: tuple[list[int], list[int]]) -> float:
+    """Win rate of one gene vector against every reference bot, from both seats, on shared seeds."""
+    genes, seeds = task
+    w = _worker
+    candidate = ThresholdStrategy.from_genes(genes, w["num_dice"])
+    wins = games = 0
+    for opponent in w["opponents"]:
+        for seed in seeds:
+            for seats, mine in (([candidate, opponent], 0), ([opponent, candidate], 1)):
+                winner = play_match(seats, w["table"], seed, w["target"], w["calculate_score"],
+                                    w["num_dice"], w["hot"])
+                wins += winner == mine
+                games += 1
+    return wins / games
+
+
+def _mutate(genes: list[int], rng: random.Random, rate: float, scale: int) -> list[int]:
+    """Nudge each gene with probability ``rate``; a :data:`NEVER` gene moves down from :data:`MAX_THRESHOLD`."""
+    return [min(MAX_THRESHOLD, max(0, (MAX_THRESHOLD if g == NEVER else g) + STEP * round(rng.gauss(0, scale) / STEP)))
+            if rng.random() < rate else g for g in genes]
+
+
+def _write_json(path: str, data: dict):
+    """Replace ``path`` atomically so an interrupted run never leaves a torn file."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fd, temp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, path)
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+
+def tune(generations: int = 40, population: int = 24, matches: int = 100, target_score: int = 10000,
+         calculate_score=None, num_dice: int = 6, hot_dice_enabled: bool = True,
+         opponents: tuple[str, ...] = ("default", "max-ev"), workers: int | None = None, seed: int | None = None,
+         checkpoint: str | None = None, report=None) -> tuple[ThresholdStrategy, float]:
+    """Evolve :class:`ThresholdStrategy` tables that beat a pool of reference bots.
+
+    Each generation draws ``matches`` seeds and every candidate plays every
+    reference bot on exactly those seeds from both seats (common random
+    numbers), so fitness differences reflect the thresholds rather than the
+    luck of the dice. The best quarter survives unchanged; the rest are bred
+    by tournament selection, uniform crossover and mutation in steps of 50.
+    Candidates are scored in parallel on a process pool.
+
+    With ``checkpoint``, the population and random state are saved after every
+    generation and an existing checkpoint with the same settings is resumed.
+
+    :param generations: Generations to run in total (including resumed ones).
+    :param population: Candidates per generation.
+    :param matches: Seeds per generation; each gives 2 games per opponent.
+    :param opponents: Names from ``strategies`` forming the reference pool.
+    :param workers: Processes to use (default: CPU count; 1 runs inline).
+    :param seed: Seed for the whole run, for reproducibility.
+    :param checkpoint: Path of the resumable checkpoint file.
+    :param report: Optional ``report(generation, best_fitness, mean_fitness)`` callback.
+    :return: The leader of the last generation and its fitness on that generation's seeds.
+    :raises ValueError: If the population is below 3 (tournaments pick 3) or
+                        the checkpoint was made with different settings.
+    """
+    from .game import Game
+    if population < 3:
+        raise ValueError(f"population must be at least 3, got {population}")
+    if calculate_score is None:
+        calculate_score = Game.scoring_methods["default"]
+    method = method_name(calculate_score)
+    if method == "custom":
+        raise ValueError("tuning needs a scoring method from Game.scoring_methods")
+    config = {"population": population, "matches": matches, "target": target_score, "method": method,
+              "dice": num_dice, "hot": hot_dice_enabled, "opponents": list(opponents), "gap_edges": list(GAP_EDGES)}
+
+    rng = random.Random(seed)
+    start_genes = ThresholdStrategy.from_default(num_dice).genes
+    genomes = [start_genes] + [_mutate(start_genes, rng, 0.5, 750) for _ in range(population - 1)]
+    generation, best, best_fitness = 0, start_genes, 0.0
+    if checkpoint and os.path.exists(checkpoint):
+        with open(checkpoint) as f:
+            saved = json.load(f)
+        if saved["config"] != config:
+            raise ValueError(f"checkpoint {checkpoint} was made with different settings")
+        generation, genomes = saved["generation"], saved["genomes"]
+        best, best_fitness = saved["best"], saved["best_fitness"]
+        version, internal, gauss = saved["rng_state"]
+        rng.setstate((version, tuple(internal), gauss))
+
+    init_args = (method, num_dice, hot_dice_enabled, target_score, tuple(opponents))
+    workers = workers or os.cpu_count() or 1
+    pool = Pool(workers, _init_worker, init_args) if workers > 1 else None
+    if pool is None:
+        _init_worker(*init_args)
+    try:
+        elite = max(1, population // 4)
+        while generation < generations:
+            seeds = [rng.getrandbits(32) for _ in range(matches)]
+            tasks = [(genes, seeds) for genes in genomes]
+            fitness = pool.map(_fitness, tasks) if pool else list(map(_fitness, tasks))
+            ranked = sorted(range(population), key=lambda k: -fitness[k])
+            # keep the latest leader rather than the luckiest score ever seen on other seeds
+            best, best_fitness = genomes[ranked[0]], fitness[ranked[0]]
+
+            def pick() -> list[int]:
+                return genomes[min(rng.sample(range(population), 3), key=lambda k: -fitness[k])]
+
+            children = [genomes[k] for k in ranked[:elite]]
+            while len(children) < population:
+                mother, father = pick(), pick()
+                child = [m if rng.random() < 0.5 else f for m, f in zip(mother, father)]
+                children.append(_mutate(child, rng, 0.2, 300))
+            genomes = children
+            generation += 1
+
+            if report is not None:
+                report(generation, fitness[ranked[0]], sum(fitness) / population)
+            if checkpoint:
+                _write_json(checkpoint, {"config": config, "generation": generation, "genomes": genomes,
+                                         "best": best, "best_fitness": best_fitness,
+                                         "rng_state": rng.getstate()})
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return ThresholdStrategy.from_genes(best, num_dice), best_fitness
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    from .game import Game
+
+    parser = argparse.ArgumentParser(description="Evolve bot bank thresholds against reference bots")
+    parser.add_argument("--generations", type=int, default=40)
+    parser.add_argument("--population", type=int, default=24)
+    parser.add_argument("--matches", type=int, default=100)
+    parser.add_argument("--target", type=int, default=10000)
+    parser.add_argument("--method", choices=list(Game.scoring_methods), default="default")
+    parser.add_argument("--dice", type=int, default=6)
+    parser.add_argument("--no-hot-dice", action="store_true")
+    parser.add_argument("--opponents", nargs="+", default=["default", "max-ev"])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--checkpoint", default=os.path.join(POLICY_DIR, "tuner-checkpoint.json"))
+    options = parser.parse_args()
+
+    began = time.perf_counter()
+    calculate_score = Game.scoring_methods[options.method]
+    best, fitness = tune(options.generations, options.population, options.matches, options.target,
+                         calculate_score, options.dice, not options.no_hot_dice, tuple(options.opponents),
+                         options.workers, options.seed, options.checkpoint,
+                         report=lambda gen, top, mean: print(f"generation {gen:>3}: best {top:.1%}, mean {mean:.1%}"))
+    path = tuned_path(method_name(calculate_score), options.dice, not options.no_hot_dice)
+    _write_json(path, best.to_dict())
+    print(f"Tuned in {time.perf_counter() - began:.1f}s; best win rate {fitness:.1%}; saved {path}")
@@ -0,0 +1,321 @@
+import contextlib
+import random
+from collections.abc import Callable, Iterable
+from itertools import product
+from math import sqrt
+from typing import NamedTuple
+
+from .dice import DicePool, Die
+from .events import Bank, Decision, Event, Farkle, MatchEnd, TurnStart
+from .game import Game
+from .odds import TurnOdds, turn_odds
+from .player import Player
+from .scoring import scoring_methods
+from .simulate import RollTable, simulate_stopping_rules
+from .strategy import strategies
+from .tuner import play_match
+
+BOTS = ("default", "max-ev")  # strategies of the two seats in seeded bot matches
+
+
+class Divergence(NamedTuple):
+    """The first place a fast path disagreed with the reference.
+
+    Attributes
+    ----------
+    check : str
+        Which comparison failed, e.g. ``"doubling: RollTable.score"``.
+    where : str
+        The roll (``"roll (1, 5, 5)"``) or event (``"seed 3, event 41"``).
+    expected, actual : object
+        The reference and fast-path results there.
+    """
+    check: str
+    where: str
+    expected: object
+    actual: object
+
+    def __str__(self) -> str:
+        return f"{self.check} diverged at {self.where}: expected {self.expected!r}, got {self.actual!r}"
+
+
+class _Discard:
+    """stdout replacement that drops the reference scorers' commentary without buffering it."""
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def verify_scoring(reference: Callable, candidate: Callable, num_dice: int = 6,
+                   check: str = "scoring") -> Divergence | None:
+    """Compare two scoring functions on every ordered roll of 1..``num_dice`` dice (6^1..6^6).
+
+    :param reference: The rules as written, e.g. :func:`farkle.scoring.doubling`.
+    :param candidate: A replacement with the same ``(selection) -> (score, used)`` signature.
+    :return: The first disagreement, or None.
+    :rtype: Divergence | None
+    """
+    with contextlib.redirect_stdout(_Discard()):
+        for n in range(1, num_dice + 1):
+            for roll in product(range(1, 7), repeat=n):
+                expected = reference([Die(f) for f in roll])
+                actual = candidate([Die(f) for f in roll])
+                if expected != actual:
+                    return Divergence(check, f"roll {roll}", expected, actual)
+    return None
+
+
+def verify_roll_table(reference: Callable, table: RollTable, check: str = "RollTable") -> Divergence | None:
+    """Compare a :class:`RollTable` with the reference on every ordered roll of 1..``num_dice`` dice.
+
+    Both table paths are checked against one reference call per roll: the
+    index-addressed :attr:`~RollTable.outcomes` (so roll index ``k`` must be
+    the ``k``-th roll ``product(range(1, 7), repeat=n)`` yields) and the
+    :meth:`~RollTable.score` drop-in.
+    """
+    with contextlib.redirect_stdout(_Discard()):
+        for n in range(1, table.num_dice + 1):
+            outcomes = table.outcomes[n]
+            for index, roll in enumerate(product(range(1, 7), repeat=n)):
+                dice = [Die(f) for f in roll]
+                expected = reference(dice)
+                if outcomes[index] != expected:
+                    return Divergence(f"{check}.outcomes", f"roll {roll} (index {index})", expected, outcomes[index])
+                actual = table.score(dice)
+                if actual != expected:
+                    return Divergence(f"{check}.score", f"roll {roll}", expected, actual)
+    return None
+
+
+def snapshot(event: Event) -> tuple:
+    """A comparable, detached view of an event: players by name and dice by face."""
+    fields = []
+    for name in event.__slots__:
+        value = getattr(event, name)
+        if isinstance(value, Player):
+            value = value.username
+        elif isinstance(value, list):
+            value = tuple(d.value for d in value)
+        fields.append(value)
+    return (type(event).__name__, *fields)
+
+
+def verify_matches(make_reference: Callable[[int], Game], make_candidate: Callable[[int], Game],
+                   seeds: Iterable[int], check: str = "match") -> Divergence | None:
+    """Play each seed on a reference and a candidate game and compare their event streams.
+
+    :param make_reference: ``seed -> Game`` built with the reference paths.
+    :param make_candidate: ``seed -> Game`` built with the fast paths under test.
+    :param seeds: Seeds to play; both games of a pair get the same one.
+    :return: The first differing event (or early end of one stream), or None.
+    :rtype: Divergence | None
+    """
+    with contextlib.redirect_stdout(_Discard()):
+        for seed in seeds:
+            expected_events = make_reference(seed).iter_events()
+            actual_events = make_candidate(seed).iter_events()
+            index = 0
+            while True:
+                expected = next(expected_events, None)
+                actual = next(actual_events, None)
+                if expected is None and actual is None:
+                    break
+                expected = None if expected is None else snapshot(expected)
+                actual = None if actual is None else snapshot(actual)
+                if expected != actual:
+                    return Divergence(check, f"seed {seed}, event {index}", expected, actual)
+                index += 1
+    return None
+
+
+class _TablePool(DicePool):
+    """A dice pool that rolls like the fast paths: each roll takes one uniform ``draw()`` and shows the
+    ordered roll it selects in :meth:`RollTable.lookup`, so a :class:`Game` can replay their dice streams.
+    """
+    def __init__(self, length: int, draw: Callable[[], float]):
+        super().__init__(length)
+        self.draw: Callable[[], float] = draw
+
+    def roll(self) -> list[Die]:
+        n = self.remaining_dice
+        k = int(self.draw() * 6 ** n)
+        for die in reversed(self.dice[:n]):  # the last die varies fastest in product() order
+            k, face = divmod(k, 6)
+            die.value = face + 1
+        rolled = self.dice[:n]
+        if self.observer is not None:
+            self.observer(rolled)
+        return rolled
+
+
+def _bots(seed: int, calculate_score, target_score: int, num_dice: int, hot_dice_enabled: bool) -> Game:
+    players = [Player("A", is_ai=True), Player("B", is_ai=True)]
+    for player, strategy in zip(players, BOTS):
+        player.strategy = strategy
+    return Game(calculate_score, players, target_score, num_dice, hot_dice_enabled, ai_delay=False, seed=seed)
+
+
+def _solo_turns(game: Game, turns: int, decide: Callable[[int, int], str],
+                on_turn: Callable[[int], None] | None = None) -> list[int]:
+    """Points banked in each of the first ``turns`` turns of a one-player ``game``.
+
+    :param decide: ``(tentative, remaining) -> "b" | "r"`` for every decision.
+    :param on_turn: Called with the turn number as each turn starts.
+    """
+    banked: list[int] = []
+    events = game.iter_events()
+    choice = None
+    while len(banked) < turns:
+        event = events.send(choice)
+        choice = None
+        kind = type(event)
+        if kind is TurnStart and on_turn is not None:
+            on_turn(len(banked))
+        elif kind is Decision:
+            choice = decide(event.tentative, event.remaining)
+        elif kind is Bank:
+            banked.append(event.points)
+        elif kind is Farkle:
+            banked.append(0)
+    events.close()
+    return banked
+
+
+def verify_tuner_matches(calculate_score, table: RollTable, seeds: Iterable[int], target_score: int = 2000,
+                         hot_dice_enabled: bool = True, check: str = "tuner.play_match") -> Divergence | None:
+    """Compare :func:`~farkle.tuner.play_match` with a :class:`Game` fed the same seeded dice.
+
+    The game's pool rolls from ``random.Random(seed)`` the way ``play_match``
+    draws from its table, and both seat the :data:`BOTS`; the winning seats
+    must agree.
+    """
+    deciders = [strategies[name] for name in BOTS]
+    with contextlib.redirect_stdout(_Discard()):
+        for seed in seeds:
+            game = _bots(seed, calculate_score, target_score, table.num_dice, hot_dice_enabled)
+            game.dice_pool = _TablePool(table.num_dice, random.Random(seed).random)
+            expected = None
+            for event in game.iter_events():
+                if type(event) is MatchEnd:
+                    expected = game.players.index(event.winner)
+            actual = play_match(deciders, table, seed, target_score, calculate_score, table.num_dice,
+                                hot_dice_enabled)
+            if expected != actual:
+                return Divergence(check, f"seed {seed}", expected, actual)
+    return None
+
+
+def verify_stopping_rules(calculate_score, table: RollTable, thresholds: list[int], dice_left: list[int],
+                          turns: int = 200, seed: int = 0, hot_dice_enabled: bool = True,
+                          check: str = "simulate_stopping_rules") -> Divergence | None:
+    """Compare :func:`~farkle.simulate.simulate_stopping_rules` with :class:`Game` turns on the same draws.
+
+    For every rule in the grid, ``turns`` turns of a one-player game are
+    played with the rule's bank/roll choices, the ``k``-th roll of turn
+    ``m`` showing the dice the simulation's ``k``-th draw for turn ``m``
+    selects. The mean banked points must match the grid's cell exactly.
+    """
+    num_dice = table.num_dice
+    grid = simulate_stopping_rules(turns, thresholds, dice_left, calculate_score, num_dice, hot_dice_enabled,
+                                   seed, table)
+    rng, draws = random.Random(seed), []  # draws[k][m] as in simulate_stopping_rules
+    position = [0, 0]  # turn, roll within it
+
+    def draw() -> float:
+        m, k = position
+        while k >= len(draws):
+            draws.append([rng.random() for _ in range(turns)])
+        position[1] += 1
+        return draws[k][m]
+
+    def start(m: int):
+        position[:] = [m, 0]
+
+    with contextlib.redirect_stdout(_Discard()):
+        for i, threshold in enumerate(thresholds):
+            for j, cutoff in enumerate(dice_left):
+                game = Game(calculate_score, [Player("SOLO")], 10 ** 9, num_dice, hot_dice_enabled, ai_delay=False)
+                game.dice_pool = _TablePool(num_dice, draw)
+                banked = _solo_turns(game, turns, lambda tentative, n: "b" if n != num_dice and (
+                    tentative >= threshold or n <= cutoff) else "r", start)
+                if sum(banked) / turns != grid.means[i][j]:
+                    return Divergence(check, f"rule ({threshold}, {cutoff})", sum(banked) / turns, grid.means[i][j])
+    return None
+
+
+def verify_turn_odds(calculate_score, num_dice: int = 6, hot_dice_enabled: bool = True, turns: int = 2000,
+                     seed: int = 0, odds: TurnOdds | None = None, check: str = "TurnOdds") -> Divergence | None:
+    """Compare the :class:`~farkle.odds.TurnOdds` tables with seeded :class:`Game` turns.
+
+    ``turns`` turns are played in a one-player game seeded with ``seed``,
+    rolling exactly when :meth:`TurnOdds.should_roll` says so. The tables
+    are exact expectations, so the check is statistical: the mean banked
+    points must lie within four standard errors of the table's value of a
+    fresh turn.
+
+    :param odds: The tables to check (default: the shared :func:`~farkle.odds.turn_odds` ones the bots use).
+    """
+    if odds is None:
+        odds = turn_odds(calculate_score, num_dice, hot_dice_enabled)
+    game = Game(calculate_score, [Player("SOLO")], 10 ** 9, num_dice, hot_dice_enabled, ai_delay=False, seed=seed)
+    with contextlib.redirect_stdout(_Discard()):
+        banked = _solo_turns(game, turns, lambda tentative, n: "r" if odds.should_roll(n, tentative) else "b")
+    mean = sum(banked) / turns
+    spread = sqrt(sum((points - mean) ** 2 for points in banked) / (turns - 1) / turns)
+    expected = odds.value[num_dice][0]
+    if abs(mean - expected) > 4 * spread:
+        return Divergence(check, f"seed {seed}, {turns} turns", round(expected, 1), round(mean, 1))
+    return None
+
+
+def verify_all(num_dice: int = 6, seeds: Iterable[int] = range(10), target_score: int = 2000,
+               report: Callable[[str], None] | None = None) -> Divergence | None:
+    """Run every check on every scoring method; stop at the first divergence.
+
+    Checks, per method: :meth:`RollTable.score` and :attr:`RollTable.outcomes`
+    against the method on all 6^1..6^``num_dice`` rolls, then, with hot dice
+    on and off, seeded bot matches where the reference game scores with the
+    method and the candidate with the table (comparing every event), and
+    seeded :class:`Game` play against :func:`~farkle.tuner.play_match`,
+    :func:`~farkle.simulate.simulate_stopping_rules` and the
+    :class:`~farkle.odds.TurnOdds` tables.
+
+    :param report: Optional callback receiving each method name once all its checks pass.
+    """
+    seeds = list(seeds)
+    methods = {method: name for name, method in scoring_methods.items()}  # one name per distinct method
+    for method, name in methods.items():
+        table = RollTable(method, num_dice)
+        divergence = verify_roll_table(method, table, f"{name}: RollTable")
+        for hot in (True, False):
+            if divergence is None:
+                divergence = verify_matches(
+                    lambda seed: _bots(seed, method, target_score, num_dice, hot),
+                    lambda seed: _bots(seed, table.score, target_score, num_dice, hot),
+                    seeds, f"{name}: table-scored match (hot dice {'on' if hot else 'off'})")
+            if divergence is None:
+                divergence = verify_tuner_matches(method, table, seeds, target_score, hot,
+                                                  f"{name}: tuner.play_match")
+            if divergence is None:
+                divergence = verify_stopping_rules(method, table, [300, 1000], [0, 2], 100, seeds[0] if seeds else 0,
+                                                   hot, f"{name}: simulate_stopping_rules")
+            if divergence is None:
+                divergence = verify_turn_odds(method, num_dice, hot, check=f"{name}: TurnOdds")
+        if divergence is not None:
+            return divergence
+        if report is not None:
+            report(name)
+    return None
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    began = time.perf_counter()
+    divergence = verify_all(report=lambda name: print(f"{name}: all rolls and matches agree"))
+    if divergence is not None:
+        sys.exit(str(divergence))
+    print(f"Verified in {time.perf_counter() - began:.1f}s")
@@ -0,0 +1,131 @@
+# tests/test_archive.py
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from farkle.archive import HEADER, MAX_DICE, MAX_SEATS, MatchArchive, recordable  # noqa: E402
+from farkle.events import Decision, Roll, TurnStart  # noqa: E402
+from farkle.game import Game  # noqa: E402
+from farkle.player import Player  # noqa: E402
+
+
+def bots() -> list[Player]:
+    players = [Player("ALICE", is_ai=True), Player("BOB", is_ai=True)]
+    players[1].strategy = "max-ev"
+    return players
+
+
+class TestMatchArchive(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.archive = MatchArchive(self.directory)
+
+    def tearDown(self):
+        self.archive.close()
+
+    def play(self, seed: int, choose=None) -> list[tuple]:
+        """Play one archived match; return its turns, rolls and decisions as the archive should store them."""
+        moves = []
+        game = Game(players=bots(), target_score=2000, ai_delay=False, seed=seed, archive=self.archive)
+        events = game.iter_events()
+        choice = None
+        with contextlib.redirect_stdout(io.StringIO()):
+            while True:
+                try:
+                    event = events.send(choice)
+                except StopIteration:
+                    break
+                choice = None
+                if type(event) is TurnStart:
+                    moves.append(("turn", event.seat))
+                elif type(event) is Roll:
+                    moves.append(("roll", tuple(d.value for d in event.dice)))
+                elif type(event) is Decision:
+                    choice = choose(event) if choose else game.get_player_choice(event.player)
+                    moves.append(("decision", choice))
+        return moves
+
+    def test_round_trip(self):
+        expected = [self.play(seed) for seed in range(5)]
+        self.assertEqual(len(self.archive), 5)
+        for number, moves in enumerate(expected):
+            match = self.archive[number]
+            self.assertEqual(list(match.moves()), moves)
+            self.assertEqual(match.seed, number)
+            self.assertEqual(match.usernames, ("ALICE", "BOB"))
+            self.assertGreaterEqual(match.points[match.winner], 2000)
+            self.assertEqual((match.method, match.target_score, match.num_dice, match.hot_dice_enabled),
+                             ("doubling", 2000, 6, True))
+        self.assertEqual(self.archive[-1].number, 4)
+        with self.assertRaises(IndexError):
+            self.archive[5]
+
+    def test_records_choices_sent_by_the_caller(self):
+        moves = self.play(3, choose=lambda event: "b" if event.tentative >= 300 else "r")
+        self.assertEqual(list(self.archive[0].moves()), moves)
+
+    def test_reopened_archive_appends_and_finds_seeds(self):
+        for seed in (7, 8, 7):
+            self.play(seed)
+        self.archive.close()
+        self.archive = MatchArchive(self.directory)
+        self.play(7)
+        self.assertEqual(len(self.archive), 4)
+        self.assertEqual(self.archive.by_seed(7), [0, 2, 3])
+        self.assertEqual(self.archive.by_seed(9), [])
+        self.assertEqual(list(self.archive[0].moves()), list(self.archive[3].moves()))
+
+    def test_interrupted_append_is_cut_off(self):
+        for seed in range(3):
+            self.play(seed)
+        self.archive.close()
+        size = os.path.getsize(self.archive.data_path)
+        with open(self.archive.data_path, "ab") as f:  # a record that never got its index entry
+            f.write(b"\x01" * (HEADER.size + 5))
+        with open(self.archive.index_path, "ab") as f:  # and a torn index entry
+            f.write(b"\x02\x03")
+        self.archive = MatchArchive(self.directory)
+        self.assertEqual(len(self.archive), 3)
+        self.assertEqual(os.path.getsize(self.archive.data_path), size + HEADER.size + 5)  # reading cuts nothing
+        self.play(4)  # the writer repairs before its first append
+        self.assertEqual(self.archive[3].seed, 4)
+        self.assertEqual(self.archive[3].usernames, ("ALICE", "BOB"))
+
+    def test_readers_leave_a_live_writer_alone(self):
+        for seed in range(3):
+            self.play(seed)
+        self.archive._data.flush()  # records reach the file, their index entries are still buffered
+        size = os.path.getsize(self.archive.data_path)
+        reader = MatchArchive(self.directory)
+        self.assertEqual(len(reader), 0)
+        reader.close()
+        self.assertEqual(os.path.getsize(self.archive.data_path), size)
+        self.archive.flush()
+        self.assertEqual([match.seed for match in MatchArchive(self.directory)], [0, 1, 2])
+
+    def test_unsupported_matches_are_refused(self):
+        crowd = [Player(f"P{seat}", is_ai=True) for seat in range(MAX_SEATS + 1)]
+        game = Game(players=crowd, target_score=500, ai_delay=False, seed=1, archive=self.archive)
+        with self.assertRaises(ValueError), contextlib.redirect_stdout(io.StringIO()):
+            next(game.iter_events())
+        with self.assertRaises(ValueError):
+            self.archive.append(1, "quadrupling", 500, 6, True, 0, 1, ["A", "B"], [500, 0], b"")
+        for options in ({"num_dice": MAX_DICE + 1}, {"target_score": -5}, {"seed": 2 ** 63}):
+            game = Game(players=bots(), ai_delay=False, archive=self.archive, **{"seed": 1, **options})
+            self.assertFalse(recordable(game), options)
+            with self.assertRaises(ValueError), contextlib.redirect_stdout(io.StringIO()):
+                next(game.iter_events())  # refused before any dice are rolled
+        self.archive.flush()
+        self.assertEqual(len(self.archive), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
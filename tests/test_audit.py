@@ -0,0 +1,88 @@
+# tests/test_audit.py
+import random
+import unittest
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from farkle.audit import DiceAuditor, FaceStats, chi_square_p  # noqa: E402
+from farkle.game import Game  # noqa: E402
+from farkle.player import Player  # noqa: E402
+
+
+class TestFaceStats(unittest.TestCase):
+    def test_fair_stream_passes(self):
+        rng = random.Random(5)
+        stats = FaceStats()
+        for _ in range(5000):
+            stats.add([rng.randint(1, 6) for _ in range(6)])
+        self.assertEqual(stats.total, 30000)
+        self.assertEqual(stats.rolls, 5000)
+        self.assertGreater(stats.chi_square_p, 0.01)
+        self.assertGreater(stats.runs_p, 0.01)
+
+    def test_chi_square_matches_direct_formula(self):
+        rng = random.Random(9)
+        stats = FaceStats()
+        for _ in range(300):
+            stats.add([rng.randint(1, 6) for _ in range(rng.randint(1, 6))])
+        expected = stats.total / 6
+        direct = sum((c - expected) ** 2 / expected for c in stats.counts)
+        self.assertAlmostEqual(stats.chi_square, direct, places=6)
+
+    def test_loaded_die_fails_chi_square(self):
+        rng = random.Random(3)
+        stats = FaceStats()
+        for _ in range(2000):
+            stats.add([6 if rng.random() < 0.3 else rng.randint(1, 6) for _ in range(6)])
+        self.assertLess(stats.chi_square_p, 1e-6)
+
+    def test_alternating_faces_fail_runs_test(self):
+        stats = FaceStats()
+        for _ in range(500):
+            stats.add([1, 6, 2, 5, 3, 4])
+        self.assertLess(stats.chi_square, 1e-9)
+        self.assertGreater(stats.runs_z, 10)
+        self.assertLess(stats.runs_p, 1e-6)
+
+    def test_chi_square_p_known_values(self):
+        # Critical values of chi-square with 5 degrees of freedom
+        self.assertAlmostEqual(chi_square_p(11.0705), 0.05, places=4)
+        self.assertAlmostEqual(chi_square_p(15.0863), 0.01, places=4)
+        self.assertEqual(chi_square_p(0), 1.0)
+
+
+class TestDiceAuditor(unittest.TestCase):
+    def play(self, auditor, seed):
+        players = [Player("A", is_ai=True), Player("B", is_ai=True)]
+        game = Game(players=players, target_score=1000, ai_delay=False, seed=seed, auditor=auditor)
+        for _ in game.iter_events():
+            pass
+
+    def test_counts_every_rolled_die_by_player_and_game(self):
+        auditor = DiceAuditor()
+        rolled = {"A": 0, "B": 0}
+        players = [Player("A", is_ai=True), Player("B", is_ai=True)]
+        game = Game(players=players, target_score=3000, ai_delay=False, seed=11, auditor=auditor)
+        for event in game.iter_events():
+            if type(event).__name__ == "Roll":
+                rolled[event.player.username] += len(event.dice)
+        self.assertEqual({name: stats.total for name, stats in auditor.players.items()},
+                         {name: dice for name, dice in rolled.items() if dice})
+        self.assertEqual(auditor.overall.total, sum(rolled.values()))
+        self.assertEqual(auditor.games[1].total, sum(rolled.values()))
+
+    def test_keeps_only_recent_games(self):
+        auditor = DiceAuditor(max_games=2)
+        for seed in range(4):
+            self.play(auditor, seed)
+        self.assertEqual(list(auditor.games), [3, 4])
+        self.assertGreater(auditor.overall.total, sum(s.total for s in auditor.games.values()))
+        self.assertIn("game 4", auditor.render())
+
+
+if __name__ == "__main__":
+    unittest.main()
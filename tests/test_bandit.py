@@ -0,0 +1,82 @@
+# tests/test_bandit.py
+import contextlib
+import io
+import random
+import tempfile
+import timeit
+import unittest
+from array import array
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from farkle.bandit import PORTFOLIO, Bandit  # noqa: E402
+from farkle.game import Game  # noqa: E402
+from farkle.player import Player  # noqa: E402
+
+
+class TestBandit(unittest.TestCase):
+    def test_learns_the_best_strategy_per_opponent(self):
+        bandit, rng = Bandit(), random.Random(4)
+        best = {"ANN": "default", "BOB": "solved"}
+        for _ in range(400):
+            opponent = rng.choice(sorted(best))
+            arm = bandit.choose([opponent], rng)
+            bandit.update([opponent], rng.random() < (0.8 if arm == best[opponent] else 0.3))
+        for opponent, arm in best.items():
+            picks = [bandit.choose([opponent], rng) for _ in range(200)]
+            self.assertGreater(picks.count(arm), 150, opponent)
+        games = bandit.stats["ANN"][1::2]
+        self.assertEqual(max(games), games[PORTFOLIO.index("default")])
+
+    def test_matches_update_and_persist_the_record(self):
+        bot, rival = Player("LEARNER", is_ai=True), Player("RIVAL", is_ai=True)
+        bot.strategy = "bandit"
+        with contextlib.redirect_stdout(io.StringIO()):
+            for seed in range(6):
+                game = Game(players=[bot, rival], target_score=1000, ai_delay=False, seed=seed)
+                self.assertTrue(game.run())
+                self.assertIn(bot.playing, PORTFOLIO)
+        counts = bot.bandit.stats["RIVAL"]
+        self.assertEqual((sum(counts[1::2]), sum(counts[0::2])), (6, bot.wins))
+        self.assertEqual(rival.bandit.stats, {})
+
+        bot.directory = tempfile.mkdtemp()
+        bot.save()
+        restored = Player("LEARNER")
+        restored.directory = bot.directory
+        restored.load()
+        self.assertEqual(restored.bandit.stats, bot.bandit.stats)
+
+    def test_seeded_matches_pick_the_same_strategy(self):
+        picks = []
+        for noise in (1, 2):
+            random.seed(noise)  # the global generator must not matter
+            bot = Player("LEARNER", is_ai=True)
+            bot.strategy = "bandit"
+            bot.bandit.stats["RIVAL"] = array("I", [1, 2] * len(PORTFOLIO))  # every strategy equally uncertain
+            game = Game(players=[bot, Player("RIVAL", is_ai=True)], target_score=1000, ai_delay=False, seed=9)
+            with contextlib.redirect_stdout(io.StringIO()):
+                next(game.iter_events())
+            picks.append(bot.playing)
+        self.assertEqual(picks[0], picks[1])
+
+    def test_saved_stats_follow_strategies_by_name(self):
+        saved = {"arms": ["gone", "default"], "opponents": {"ANN": [9, 9, 3, 5]}}
+        counts = Bandit.from_dict(saved).stats["ANN"]
+        self.assertEqual(list(counts[2 * PORTFOLIO.index("default"):][:2]), [3, 5])
+        self.assertEqual(sum(counts), 8)
+
+    def test_choosing_is_cheap(self):
+        bandit = Bandit()
+        for k, arm in enumerate(PORTFOLIO):
+            bandit.arm = arm
+            bandit.update(["ANN", "BOB"], k % 2 == 0)
+        self.assertLess(timeit.timeit(lambda: bandit.choose(["ANN", "BOB"]), number=1000) / 1000, 1e-3)
+
+
+if __name__ == "__main__":
+    unittest.main()
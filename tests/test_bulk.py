@@ -0,0 +1,121 @@
+# tests/test_bulk.py
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from farkle.bulk import export_players, import_players, read_records  # noqa: E402
+from farkle.player import Player  # noqa: E402
+
+
+class TestBulkPlayers(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.store = os.path.join(self.root, "players")
+
+    def write(self, name: str, text: str) -> str:
+        path = os.path.join(self.root, name)
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def saved(self, username: str, directory: str | None = None) -> Player:
+        player = Player(username)
+        player.directory = directory or self.store
+        self.assertTrue(player.load())
+        return player
+
+    def test_import_validates_and_deduplicates_in_one_pass(self):
+        path = self.write("league.jsonl", "\n".join([
+            json.dumps({"username": "Ann", "wins": 2, "games": 5, "lifetime_score": 9000}),
+            json.dumps({"username": "bob", "is_ai": True, "rating_mu": 30}),
+            json.dumps({"username": "ANN", "wins": 9, "games": 9}),  # repeat, different case
+            json.dumps({"username": "bad/name"}),
+            json.dumps({"username": "cy", "wins": 3, "games": 2}),
+            json.dumps({"username": "dee", "games": -1}),
+            "{not json",
+            "",
+            json.dumps({"username": "eve", "is_ai": "maybe"}),
+        ]))
+        report = import_players(path, self.store, batch_size=2)
+        self.assertEqual(report[:3], (2, 1, 5))
+        self.assertEqual([error.split(":")[0] for error in report.errors],
+                         ["line 4", "line 5", "line 6", "line 7", "line 9"])
+        ann = self.saved("ann")
+        self.assertEqual((ann.username, ann.wins, ann.games, ann.lifetime_score, ann.is_ai), ("ANN", 2, 5, 9000, False))
+        bob = self.saved("bob")
+        self.assertTrue(bob.is_ai)
+        self.assertEqual(bob.rating.mu, 30)
+        self.assertEqual(sorted(n for n in os.listdir(self.store) if n != ".locks"), ["ann.json", "bob.json"])
+
+    def test_existing_players_are_skipped_or_replaced(self):
+        existing = Player("ANN")
+        existing.directory = self.store
+        existing.wins = existing.games = 7
+        existing.save()
+        path = self.write("league.csv", "username,wins,games\nann,1,1\nzed,0,4\nzed,2,4\n")
+        self.assertEqual(import_players(path, self.store)[:3], (1, 2, 0))
+        self.assertEqual(self.saved("ann").wins, 7)
+        self.assertEqual(self.saved("zed").wins, 0)
+        self.assertEqual(import_players(path, self.store, replace=True)[:3], (2, 0, 0))
+        self.assertEqual(self.saved("ann").wins, 1)
+        self.assertEqual(self.saved("zed").wins, 2)  # the last record for a name wins
+
+    def test_export_round_trips_through_both_formats(self):
+        path = self.write("league.jsonl", "".join(
+            json.dumps({"username": f"p{i}", "wins": i % 3, "games": 3, "lifetime_score": 100 * i,
+                        "is_ai": i % 2 == 0, "rating_mu": 20 + i, "rating_sigma": 4}) + "\n" for i in range(25)))
+        self.assertEqual(import_players(path, self.store).written, 25)
+        for name in ("out.csv", "out.jsonl"):
+            out = os.path.join(self.root, name)
+            self.assertEqual(export_players(out, self.store), (25, ()))
+            copy = os.path.join(self.root, f"copy-{name}")
+            self.assertEqual(import_players(out, copy)[:3], (25, 0, 0))
+            for i in (0, 7, 24):
+                original, restored = self.saved(f"p{i}"), self.saved(f"p{i}", copy)
+                self.assertEqual((restored.wins, restored.games, restored.lifetime_score, restored.is_ai,
+                                  restored.rating.to_dict()),
+                                 (original.wins, original.games, original.lifetime_score, original.is_ai,
+                                  original.rating.to_dict()))
+
+    def test_export_skips_unreadable_saves(self):
+        path = self.write("league.jsonl", json.dumps({"username": "ann"}) + "\n")
+        import_players(path, self.store)
+        with open(os.path.join(self.store, "bad.json"), "w") as f:
+            f.write("{truncated")
+        with open(os.path.join(self.store, "list.json"), "w") as f:
+            f.write("[]")
+        out = os.path.join(self.root, "out.jsonl")
+        report = export_players(out, self.store)
+        self.assertEqual(report.written, 1)
+        self.assertEqual(sorted(skipped.split(":")[0] for skipped in report.skipped), ["bad.json", "list.json"])
+        with patch.object(Player, "_read", return_value=None):  # deleted between listing and reading
+            report = export_players(out, self.store)
+        self.assertEqual(report.written, 0)
+        self.assertIn("ann.json: no longer saved", report.skipped)
+
+    def test_import_without_hard_links(self):
+        path = self.write("league.csv", "username,wins,games\nann,1,1\nbob,0,4\n")
+        with patch("os.link", side_effect=PermissionError("no hard links")) as link:
+            self.assertEqual(import_players(path, self.store)[:3], (2, 0, 0))
+            self.assertEqual(import_players(path, self.store)[:3], (0, 2, 0))
+        self.assertEqual(link.call_count, 1)  # given up on after the first failure
+        self.assertEqual(self.saved("bob").games, 4)
+        self.assertEqual(sorted(n for n in os.listdir(self.store) if n.endswith(".tmp")), [])
+
+    def test_records_are_streamed(self):
+        path = self.write("league.jsonl", json.dumps({"username": "a"}) + "\n")
+        records = read_records(path)
+        self.assertIs(iter(records), records)
+        self.assertEqual(next(records), (1, {"username": "a"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+# tests/test_cluster.py
+import threading
+import unittest
+from multiprocessing import Process
+from multiprocessing.connection import Client
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from farkle.cluster import Coordinator, MatchConfig, Summary, play_range, run_local, work  # noqa: E402
+
+CONFIG = MatchConfig(target_score=2000)
+AUTHKEY = b"test-cluster-key"
+
+
+class TestCluster(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.serial = play_range(CONFIG, 0, 120)
+
+    def run_coordinator(self, coordinator: Coordinator) -> tuple[threading.Thread, dict]:
+        outcome = {}
+        thread = threading.Thread(target=lambda: outcome.update(summary=coordinator.run(timeout=30)))
+        thread.start()
+        return thread, outcome
+
+    def start_workers(self, address, count: int) -> list[Process]:
+        workers = [Process(target=work, args=(address, AUTHKEY), daemon=True) for _ in range(count)]
+        for worker in workers:
+            worker.start()
+        return workers
+
+    def test_summaries_merge_exactly(self):
+        parts = [play_range(CONFIG, start, start + 40) for start in (0, 40, 80)]
+        merged = Summary.empty(2)
+        for part in parts:
+            merged = merged.merge(part)
+        self.assertEqual(merged, self.serial)
+        self.assertEqual(self.serial.games, 120)
+        self.assertEqual(sum(self.serial.wins), 120)
+
+    def test_bandit_seats_do_not_depend_on_batching(self):
+        config = CONFIG._replace(strategies=("bandit", "default"), target_score=1000)
+        self.assertEqual(play_range(config, 0, 20), play_range(config, 0, 10).merge(play_range(config, 10, 20)))
+
+    def test_local_workers_match_serial_play(self):
+        self.assertEqual(run_local(CONFIG, range(120), workers=3, chunk=15, timeout=30), self.serial)
+
+    def test_batch_of_dead_worker_is_reassigned(self):
+        coordinator = Coordinator(CONFIG, range(120), AUTHKEY, chunk=15)
+        thread, outcome = self.run_coordinator(coordinator)
+        doomed = Client(coordinator.address, authkey=AUTHKEY)
+        self.assertEqual(doomed.recv()[0], "batch")
+        doomed.close()  # dies holding a batch
+        workers = self.start_workers(coordinator.address, 2)
+        thread.join(30)
+        for worker in workers:
+            worker.join(5)
+        self.assertEqual(outcome["summary"], self.serial)
+
+    def test_overdue_batch_is_leased_again(self):
+        coordinator = Coordinator(CONFIG, range(120), AUTHKEY, chunk=15, lease=0.2)
+        thread, outcome = self.run_coordinator(coordinator)
+        hung = Client(coordinator.address, authkey=AUTHKEY)
+        self.assertEqual(hung.recv()[0], "batch")  # never answers
+        workers = self.start_workers(coordinator.address, 2)
+        thread.join(30)
+        hung.close()
+        for worker in workers:
+            worker.join(5)
+        self.assertEqual(outcome["summary"], self.serial)
+
+    def test_authkey_is_required(self):
+        with self.assertRaises(ValueError):
+            Coordinator(CONFIG, range(10), b"")
+
+    def test_times_out_without_workers(self):
+        with self.assertRaises(TimeoutError):
+            Coordinator(CONFIG, range(10), AUTHKEY).run(timeout=0.2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+# tests/test_conformance.py
+"""Both front ends (Lab04 ``classes`` and Lab05 ``src``) must play identical matches on the shared core."""
+import unittest
+from unittest.mock import patch
+from io import StringIO
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+for path in (PROJECT_ROOT, PROJECT_ROOT / "Lab04" / "implementation", PROJECT_ROOT / "Lab05"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from classes.setup import Setup as Lab04Setup  # noqa: E402
+from src.setup import Setup as Lab05Setup  # noqa: E402
+
+
+def match_text(output: str) -> str:
+    """The match transcript, from the banner to the winner line."""
+    start = output.index("==== New Farkle Match ====")
+    end = output.index(" wins!", start)
+    return output[start:end]
+
+
+def play_lab04(seed: int, target: int, hot_dice: bool) -> tuple[str, list]:
+    setup = Lab04Setup(load_on_init=False, results_dir=None, archive_dir=None)
+    script = ["player toggle-ai p1", "player swap bot p1", f"scoring target {target}", f"dice seed {seed}", "start"]
+    if not hot_dice:
+        script.insert(0, "dice toggle-hot")
+    with patch("sys.stdout", new_callable=StringIO) as out:
+        setup.run_script(script)
+    return match_text(out.getvalue()), [(p.username, p.points, p.wins, p.games) for p in setup.players]
+
+
+def play_lab05(seed: int, target: int, hot_dice: bool) -> tuple[str, list]:
+    setup = Lab05Setup()
+    setup.players[0].is_ai = True
+    with patch("sys.stdout", new_callable=StringIO) as out, patch("builtins.input", return_value=""), \
+            patch("time.sleep"):
+        setup.cmd_scoring_target([str(target)])
+        setup.cmd_scoring_hotdice(["on" if hot_dice else "off"])
+        setup.cmd_scoring_seed([str(seed)])
+        setup.cmd_start([])
+    return match_text(out.getvalue()), [(p.username, p.points, p.wins, p.games) for p in setup.players]
+
+
+class TestFrontEndConformance(unittest.TestCase):
+    def test_same_seed_same_match(self):
+        for seed in (1, 7, 2024):
+            for hot_dice in (True, False):
+                with self.subTest(seed=seed, hot_dice=hot_dice):
+                    lab04, lab05 = play_lab04(seed, 3000, hot_dice), play_lab05(seed, 3000, hot_dice)
+                    self.assertEqual(lab04[0], lab05[0])
+                    self.assertEqual(lab04[1], lab05[1])
+
+    def test_seed_reproduces_and_varies(self):
+        self.assertEqual(play_lab04(5, 2000, True), play_lab04(5, 2000, True))
+        self.assertNotEqual(play_lab04(5, 2000, True)[0], play_lab04(6, 2000, True)[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# tests/test_duration.py
+import contextlib
+import io
+import random
+import tempfile
+import unittest
+from math import comb
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from farkle.duration import game_length, seconds_per_turn, turns_to_target  # noqa: E402
+from farkle.events import MatchEnd  # noqa: E402
+from farkle.game import Game  # noqa: E402
+from farkle.odds import turn_distribution  # noqa: E402
+from farkle.player import Player  # noqa: E402
+from farkle.results import ResultStore  # noqa: E402
+from farkle.simulate import RollTable  # noqa: E402
+from farkle.strategy import DecisionState, default  # noqa: E402
+
+
+def sample_turn_scores(target_score: int, turns: int, seed: int) -> dict[int, float]:
+    """Share of ``turns`` sampled turns of the default strategy banking each score, to cross-check the exact one.
+
+    Turns follow :meth:`Game._turn_events` (a scoreless roll banks 0, hot
+    dice reset the pool) with both players on 0 points.
+    """
+    table, rng, counts = RollTable(), random.Random(seed), {}
+    for _ in range(turns):
+        tentative, n = 0, 6
+        while True:
+            score, used = table.outcomes[n][int(rng.random() * table.sizes[n])]
+            if score == 0:
+                tentative = 0
+                break
+            tentative, n = tentative + score, n - used or 6
+            if default(DecisionState(tentative, n, target_score=target_score)) == "b":
+                break
+        counts[tentative] = counts.get(tentative, 0) + 1
+    return {score: count / turns for score, count in counts.items()}
+
+
+class TestGameLength(unittest.TestCase):
+    def test_convolution_matches_a_closed_form(self):
+        # a coin-flip turn banking 100 needs 3 heads to reach 300: P(t turns stay below) = P(Bin(t, 1/2) < 3)
+        alive = turns_to_target({0: 0.5, 100: 0.5}, 300)
+        for t, p in enumerate(alive):
+            self.assertAlmostEqual(p, sum(comb(t, k) for k in range(3)) / 2 ** t)
+        # seat 0 of 2 wins on odd turns: the match is over after m turns once seat 0 or 1 banked once
+        length = game_length({0: 0.5, 100: 0.5}, 100, players=2)
+        self.assertAlmostEqual(length.mean, 1 + sum(0.5 ** m for m in range(1, 60)))
+        self.assertEqual((length.percentile(0.5), length.percentile(0.75), length.percentile(0.99)), (1, 2, 7))
+        with self.assertRaises(ValueError):
+            turns_to_target({0: 1.0}, 100)
+
+    def test_estimate_agrees_with_played_matches(self):
+        played = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for seed in range(300):
+                game = Game(players=[Player("A", is_ai=True), Player("B", is_ai=True)], target_score=3000,
+                            ai_delay=False, seed=seed)
+                played += [event.turns for event in game.iter_events() if type(event) is MatchEnd]
+        length = game_length(turn_distribution(default, target_score=3000).probabilities, 3000)
+        self.assertAlmostEqual(length.mean, sum(played) / len(played), delta=0.6)
+        self.assertAlmostEqual(length.percentile(0.5), sorted(played)[len(played) // 2], delta=1)
+
+    def test_sampled_turns_agree_with_the_exact_distribution(self):
+        exact = turn_distribution(default, target_score=3000)
+        sampled = sample_turn_scores(target_score=3000, turns=50000, seed=1)
+        for score in (0, 300, 500, 1000):
+            self.assertAlmostEqual(sampled.get(score, 0.0), exact.probabilities.get(score, 0.0), delta=0.01)
+        self.assertAlmostEqual(sum(s * p for s, p in sampled.items()), exact.mean, delta=8)
+
+    def test_latency_from_stored_results(self):
+        store = ResultStore(tempfile.mkdtemp())
+        store.record("doubling", 5000, 6, True, ["A", "B"], [5000, 800], 20, 0, 2.0)
+        store.record("adding", 5000, 6, True, ["A", "B"], [5000, 800], 10, 0, 5.0)
+        self.assertAlmostEqual(seconds_per_turn(store), 7.0 / 30)
+        self.assertAlmostEqual(seconds_per_turn(store, "doubling", 5000), 0.1)
+        self.assertAlmostEqual(seconds_per_turn(store, "default", 5000), 0.1)  # recorded as "doubling"
+        self.assertIsNone(seconds_per_turn(store, "doubling", 10000))
+        self.assertAlmostEqual(game_length({0: 0.5, 100: 0.5}, 100).wall_clock(0.1, 0.5), 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
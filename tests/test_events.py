@@ -0,0 +1,169 @@
+# tests/test_events.py
+import os
+import selectors
+import unittest
+from unittest.mock import patch
+from io import StringIO
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from farkle.events import Bank, Decision, Farkle, MatchEnd, Quit, Roll, Score, Timeout, TurnStart  # noqa: E402
+from farkle.game import Game  # noqa: E402
+from farkle.player import Player  # noqa: E402
+
+
+def start_patch(test: unittest.TestCase, *args, **kwargs):
+    """Apply ``patch(*args, **kwargs)`` for the rest of ``test``."""
+    patcher = patch(*args, **kwargs)
+    mock = patcher.start()
+    test.addCleanup(patcher.stop)
+    return mock
+
+
+def bots(target: int = 1000, seed: int | None = None) -> Game:
+    return Game(players=[Player("A", is_ai=True), Player("B", is_ai=True)], target_score=target, ai_delay=False,
+                seed=seed)
+
+
+class TestIterEvents(unittest.TestCase):
+    def setUp(self):
+        start_patch(self, "sys.stdout", new_callable=StringIO)
+
+    def test_bot_match_streams_to_match_end(self):
+        game = bots()
+        events = game.iter_events()
+        kinds = []
+        try:
+            while True:
+                kinds.append(type(next(events)))
+        except StopIteration as stop:
+            self.assertIs(stop.value, True)
+        self.assertIs(kinds[0], TurnStart)
+        self.assertIs(kinds[-1], MatchEnd)
+        self.assertEqual(kinds.count(TurnStart), kinds.count(Farkle) + kinds.count(Bank))
+        self.assertEqual(sum(p.games for p in game.players), 2)
+
+    def test_send_decides_for_humans_without_prompting(self):
+        game = Game(players=[Player("A"), Player("B")], target_score=500, ai_delay=False)
+        start_patch(self, "builtins.input", side_effect=AssertionError("prompted"))
+        events = game.iter_events()
+        event = next(events)
+        while type(event) is not MatchEnd:
+            event = events.send("b") if type(event) is Decision else next(events)
+        self.assertGreaterEqual(event.winner.points, 500)
+
+    def test_quit_ends_without_settling(self):
+        game = bots()
+        events = game.iter_events()
+        event = next(events)
+        while type(event) is not Decision:
+            event = next(events)
+        self.assertIs(type(events.send("q")), Quit)
+        with self.assertRaises(StopIteration) as stop:
+            next(events)
+        self.assertIs(stop.exception.value, False)
+        self.assertEqual(sum(p.games for p in game.players), 0)
+
+    def test_records_are_reused_and_copyable(self):
+        events = bots(seed=3).iter_events()  # seeded: an unseeded match can end on its first roll
+        rolls = [event for event in events if type(event) is Roll]
+        self.assertGreater(len(rolls), 1)
+        self.assertTrue(all(roll is rolls[0] for roll in rolls))
+        first = rolls[0].copy()
+        self.assertIsNot(first, rolls[0])
+        self.assertEqual(first.player, rolls[0].player)
+
+    def test_interleaved_games_in_one_thread(self):
+        games = [bots(500) for _ in range(3)]
+        streams = [game.iter_events() for game in games]
+        finished = 0
+        while streams:
+            for stream in list(streams):
+                event = next(stream, None)
+                if event is None:
+                    streams.remove(stream)
+                    finished += 1
+                elif type(event) is Score:
+                    self.assertGreater(event.tentative, 0)
+        self.assertEqual(finished, 3)
+        self.assertTrue(all(sum(p.games for p in game.players) == 2 for game in games))
+
+    def test_run_prints_the_same_match(self):
+        out = StringIO()
+        with patch("sys.stdout", out):
+            self.assertTrue(bots(500).run())
+        text = out.getvalue()
+        self.assertIn("-- A's turn (Total: 0) --", text)
+        self.assertIn(" wins!", text)
+
+
+@unittest.skipUnless(hasattr(os, "openpty"), "needs a pseudo-terminal")
+class TestDecisionTimeouts(unittest.TestCase):
+    def setUp(self):
+        start_patch(self, "sys.stdout", new_callable=StringIO)
+        self.stdin, terminal = os.openpty()  # a real terminal the selector can wait on
+        stdin = os.fdopen(terminal)
+        self.addCleanup(stdin.close)
+        self.addCleanup(os.close, self.stdin)
+        start_patch(self, "sys.stdin", stdin)
+
+    def human_turn(self, **options) -> list:
+        game = Game(players=[Player("HUMAN"), Player("BOT", is_ai=True)], ai_delay=False, seed=4,
+                    decision_timeout=0.05, **options)
+        events = game.iter_events()
+        seen = []
+        for event in events:
+            seen.append(event.copy())
+            if type(event) in (Bank, Farkle, Quit):
+                events.close()
+                break
+        return seen
+
+    def test_idle_player_gets_the_timeout_action(self):
+        seen = self.human_turn()
+        timeouts = [e for e in seen if type(e) is Timeout]
+        self.assertEqual(len(timeouts), 1)
+        self.assertEqual((timeouts[0].player.username, timeouts[0].limit, timeouts[0].action), ("HUMAN", 0.05, "b"))
+        self.assertIs(type(seen[seen.index(timeouts[0]) + 1]), Bank)
+        self.assertIs(type(seen[seen.index(timeouts[0]) - 1]), Decision)
+
+    def test_timeout_action_can_roll(self):
+        seen = self.human_turn(timeout_action="r")
+        first = next(i for i, e in enumerate(seen) if type(e) is Timeout)
+        self.assertIs(type(seen[first + 1]), Roll)
+
+    def test_answer_in_time_is_used(self):
+        os.write(self.stdin, b"x\nb\n")  # an invalid answer is asked again within the same limit
+        seen = self.human_turn()
+        self.assertFalse(any(type(e) is Timeout for e in seen))
+        self.assertIs(type(seen[-1]), Bank)
+
+    def test_piped_input_is_not_timed(self):
+        read, write = os.pipe()
+        os.write(write, b"b\n")
+        os.close(write)
+        with os.fdopen(read) as piped, patch("sys.stdin", piped):
+            seen = self.human_turn()
+        self.assertFalse(any(type(e) is Timeout for e in seen))
+
+    def test_unselectable_console_falls_back_to_input(self):
+        class ConsoleSelector(selectors.SelectSelector):
+            def select(self, timeout=None):
+                raise OSError(10038, "not a socket")  # what select() says about a Windows console
+
+        with patch("selectors.DefaultSelector", ConsoleSelector), patch("builtins.input", return_value="b"):
+            seen = self.human_turn()
+        self.assertFalse(any(type(e) is Timeout for e in seen))
+        self.assertIs(type(seen[-1]), Bank)
+
+    def test_bad_timeout_action_rejected(self):
+        with self.assertRaises(ValueError):
+            Game(decision_timeout=1, timeout_action="q")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# tests/test_profile.py
+import contextlib
+import io
+import tempfile
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from farkle.events import Decision  # noqa: E402
+from farkle.game import Game  # noqa: E402
+from farkle.odds import turn_distribution  # noqa: E402
+from farkle.player import Player  # noqa: E402
+from farkle.profile import BUCKET, BUCKETS, MIN_DECISIONS, BankingProfile, endgame_choice  # noqa: E402
+from farkle.strategy import DecisionState  # noqa: E402
+
+
+def profile(choice: str, decisions: int = 10) -> BankingProfile:
+    """A player who always makes ``choice``, seen ``decisions`` times in every cell."""
+    learned = BankingProfile()
+    for n in range(1, 7):
+        for bucket in range(BUCKETS):
+            for _ in range(decisions):
+                learned.observe(n, bucket * BUCKET, choice)
+    return learned
+
+
+class TestBankingProfile(unittest.TestCase):
+    def test_counts_decisions_and_persists_with_the_player(self):
+        player = Player("ANN")
+        for remaining, tentative, choice in ((3, 300, "b"), (3, 450, "r"), (3, 9000, "b"), (2, 50, "q")):
+            player.profile.observe(remaining, tentative, choice)
+        counts = player.profile.counts
+        k = BankingProfile.cell(3, 300)
+        self.assertEqual((counts[k], counts[k + 1], player.profile.decisions), (1, 2, 3))
+        self.assertEqual(BankingProfile.cell(3, 9000), BankingProfile.cell(3, BUCKET * BUCKETS))
+
+        player.directory = tempfile.mkdtemp()
+        player.save()
+        restored = Player("ANN")
+        restored.directory = player.directory
+        restored.load()
+        self.assertEqual(restored.profile.counts, counts)
+        self.assertEqual(BankingProfile.from_dict({"bucket": BUCKET * 2, "counts": [1] * 3}).decisions, 0)
+
+    def test_finish_probability_matches_exact_turns(self):
+        need = 1000
+        exact = turn_distribution(lambda state: "b" if state.tentative_score >= need else "r")
+        reach = sum(p for points, p in exact.probabilities.items() if points >= need)
+        self.assertAlmostEqual(profile("r", 1000).finish_probability(need), reach, delta=1e-3)
+        first_roll = turn_distribution(lambda state: "b")
+        self.assertAlmostEqual(profile("b", 1000).finish_probability(need),
+                               sum(p for points, p in first_roll.probabilities.items() if points >= need), delta=1e-3)
+
+    def test_bots_roll_on_against_likely_finishers(self):
+        bold, cautious = profile("r"), profile("b")
+        state = DecisionState(400, 3, points=5000, target_score=10000)
+        self.assertEqual(endgame_choice(state, "b", [(bold, 9250)]), "r")
+        self.assertEqual(endgame_choice(state, "b", [(cautious, 9250)]), "b")
+        self.assertEqual(endgame_choice(state._replace(remaining_dice=1), "b", [(bold, 9250)]), "b")  # 67% farkle
+        self.assertEqual(endgame_choice(state, "b", [(bold, 5000)]), "b")  # not the endgame yet
+        self.assertEqual(endgame_choice(state._replace(points=9600), "b", [(bold, 9250)]), "b")  # banking wins
+        sparse = BankingProfile()
+        sparse.observe(3, 0, "r")
+        self.assertLess(sparse.decisions, MIN_DECISIONS)
+        self.assertEqual(endgame_choice(state, "b", [(sparse, 9250)]), "b")
+
+    def test_endgame_scales_with_the_target(self):
+        state = DecisionState(400, 3, points=1000, target_score=2000)
+        self.assertEqual(endgame_choice(state, "b", [(profile("r"), 1500)]), "r")
+        self.assertEqual(endgame_choice(state, "b", [(profile("r"), 1250)]), "b")  # 750 short is far in a short game
+
+    def test_only_heuristic_bots_are_overruled(self):
+        human, bot = Player("ANN"), Player("BOT", is_ai=True)
+        human.profile, human.points, bot.points = profile("r"), 9250, 5000
+        game = Game(players=[bot, human], target_score=10000, ai_delay=False, seed=1)
+        game.tentative_score, game.dice_pool.remaining_dice = 400, 3
+        with contextlib.redirect_stdout(io.StringIO()), patch("farkle.strategy.load_policy") as load:
+            load.return_value.should_roll.return_value = False
+            bot.strategy = "default"
+            self.assertEqual(game.get_player_choice(bot), "r")
+            bot.strategy = "solved"
+            self.assertEqual(game.get_player_choice(bot), "b")  # the solved policy already plays to win
+
+    def test_untabled_games_keep_the_choice(self):
+        state = DecisionState(400, 7, points=5000, target_score=10000, num_dice=7)
+        self.assertEqual(endgame_choice(state, "b", [(profile("r"), 9250)]), "b")
+        human, bot = Player("ANN"), Player("BOT", is_ai=True)
+        human.profile, human.points = profile("r"), 9250
+        game = Game(players=[bot, human], target_score=10000, num_dice=7, ai_delay=False, seed=1)
+        game.tentative_score = 400
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertIn(game.get_player_choice(bot), ("b", "r"))
+
+    def test_games_learn_from_human_decisions(self):
+        human = Player("ANN")
+        game = Game(players=[human, Player("BOT", is_ai=True)], target_score=2000, ai_delay=False, seed=5)
+        events, choice, seen = game.iter_events(), None, 0
+        with contextlib.redirect_stdout(io.StringIO()):
+            while True:
+                try:
+                    event = events.send(choice)
+                except StopIteration:
+                    break
+                choice = None
+                if type(event) is Decision and event.player is human:
+                    choice = "b" if event.tentative >= 350 else "r"
+                    seen += 1
+        self.assertGreater(seen, 0)
+        self.assertEqual(human.profile.decisions, seen)
+        self.assertEqual(game.players[1].profile.decisions, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+# tests/test_query.py
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from farkle.archive import MatchArchive  # noqa: E402
+from farkle.events import Bank, Decision, Farkle, Quit, Timeout, TurnStart  # noqa: E402
+from farkle.game import Game  # noqa: E402
+from farkle.player import Player  # noqa: E402
+from farkle.query import TABLES, Query, rows, run_query  # noqa: E402
+from farkle.simulate import RollTable  # noqa: E402
+
+
+class TestQuery(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Archive matches under mixed rules, noting what each decision and turn looked like live."""
+        cls.directory = tempfile.mkdtemp()
+        archive = MatchArchive(cls.directory)
+        cls.decisions, cls.turns = [], []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for seed in range(30):
+                players = [Player("A", is_ai=True), Player("B", is_ai=True), Player("C", is_ai=True)]
+                players[1].strategy = "max-ev"
+                method = Game.scoring_methods["adding" if seed % 2 else "doubling"]
+                game = Game(method, players, 2500, 6, seed % 3 != 0, ai_delay=False, seed=seed, archive=archive)
+                for event in game.iter_events():
+                    kind = type(event)
+                    if kind is Decision:
+                        cls.decisions.append((seed, event.player.username, event.remaining, event.tentative))
+                    elif kind is TurnStart:
+                        cls.turns.append([seed, event.seat, 0])
+                    elif kind is Bank:
+                        cls.turns[-1][2] = event.points
+                    elif kind in (Farkle, Quit):
+                        cls.turns[-1][2] = 0
+        archive.close()
+
+    def replay(self, kind: str) -> list[tuple]:
+        archive = MatchArchive(self.directory)
+        tables = {name: RollTable(method) for name, method in Game.scoring_methods.items()}
+        try:
+            return [row for match in archive for row in rows(match, tables[match.method], kind)]
+        finally:
+            archive.close()
+
+    def test_replay_matches_live_play(self):
+        fields = TABLES["decisions"]
+        decisions = [(row[fields.index("seed")], row[fields.index("player")], row[fields.index("remaining")],
+                      row[fields.index("tentative")]) for row in self.replay("decisions")]
+        self.assertEqual(decisions, self.decisions)
+        fields = TABLES["turns"]
+        turns = [[row[fields.index("seed")], row[fields.index("seat")], row[fields.index("banked")]]
+                 for row in self.replay("turns")]
+        self.assertEqual(turns, self.turns)
+
+    def test_parallel_matches_inline(self):
+        query = Query("turns").group_by("method", "hot_dice").aggregate("count", "mean:banked", "max:rolls")
+        self.assertEqual(run_query(query, self.directory, workers=3, chunk=4),
+                         run_query(query, self.directory, workers=1))
+
+    def test_filter_group_and_aggregate(self):
+        query = (Query("decisions").where("remaining", "==", 2).where("tentative", "<", 400)
+                 .group_by("choice").aggregate("count", "sum:tentative", "min:tentative"))
+        result = run_query(query, self.directory, workers=1)
+        matching = [t for _, _, remaining, t in self.decisions if remaining == 2 and t < 400]
+        self.assertEqual(sum(values["count"] for values in result.values()), len(matching))
+        self.assertEqual(sum(values["sum(tentative)"] for values in result.values()), sum(matching))
+        self.assertEqual(min(values["min(tentative)"] for values in result.values()), min(matching))
+
+    def test_hot_dice_streaks_under_adding(self):
+        query = Query("turns").where("method", "==", "adding").where("hot", "==", True).group_by("hot_dice")
+        result = run_query(query, self.directory, workers=1)
+        self.assertIn((0,), result)
+        self.assertTrue(all(key[0] >= 0 for key in result))
+
+    @unittest.skipUnless(hasattr(os, "openpty"), "needs a pseudo-terminal")
+    def test_timeouts_are_archived_and_queryable(self):
+        directory = tempfile.mkdtemp()
+        archive = MatchArchive(directory)
+        write, terminal = os.openpty()  # an idle player at a real terminal
+        with os.fdopen(terminal) as stdin, patch("sys.stdin", stdin), contextlib.redirect_stdout(io.StringIO()):
+            game = Game(players=[Player("IDLE"), Player("BOT", is_ai=True)], target_score=1500, ai_delay=False,
+                        seed=2, archive=archive, decision_timeout=0.01)
+            timeouts = sum(type(event) is Timeout for event in game.iter_events())
+        os.close(write)
+        archive.close()
+        self.assertGreater(timeouts, 0)
+        self.assertEqual(sum(move == ("timeout",) for move in MatchArchive(directory)[0].moves()), timeouts)
+        result = run_query(Query("decisions").group_by("player", "timed_out", "choice"), directory, workers=1)
+        self.assertEqual(result[("IDLE", True, "b")]["count"], timeouts)
+        self.assertNotIn(("IDLE", False, "b"), result)
+        turns = run_query(Query("turns").where("player", "==", "IDLE").aggregate("sum:timeouts"), directory, workers=1)
+        self.assertEqual(turns[()]["sum(timeouts)"], timeouts)
+
+    def test_rejects_malformed_queries(self):
+        for query in (Query("moves"), Query().where("nope", "==", 1), Query().where("turn", "~", 1),
+                      Query().aggregate("mean"), Query().aggregate("count:turn"), Query().group_by("rolls")):
+            with self.assertRaises(ValueError):
+                query.validate()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+# tests/test_rating.py
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from farkle.rating import Rating, RatingBook, SIGMA, read_matches, update_ratings  # noqa: E402
+
+
+class TestUpdateRatings(unittest.TestCase):
+    def test_winner_gains_loser_drops_and_both_grow_certain(self):
+        winner, loser = Rating(), Rating()
+        update_ratings([loser, winner], [4000, 10000])
+        self.assertGreater(winner.mu, 25)
+        self.assertLess(loser.mu, 25)
+        self.assertAlmostEqual(winner.mu - 25, 25 - loser.mu)
+        self.assertLess(winner.sigma, SIGMA)
+        self.assertLess(loser.sigma, SIGMA)
+
+    def test_tie_between_equals_changes_no_mean(self):
+        a, b = Rating(), Rating()
+        update_ratings([a, b], [500, 500])
+        self.assertAlmostEqual(a.mu, 25)
+        self.assertAlmostEqual(b.mu, 25)
+
+    def test_finishing_order_is_respected_for_many_players(self):
+        ratings = [Rating() for _ in range(4)]
+        update_ratings(ratings, [300, 10000, 50, 7000])
+        mus = [r.mu for r in ratings]
+        self.assertEqual(sorted(range(4), key=lambda k: -mus[k]), [1, 3, 0, 2])
+
+    def test_upset_moves_ratings_more(self):
+        expected_win = [Rating(30, 3), Rating(20, 3)]
+        upset = [Rating(30, 3), Rating(20, 3)]
+        update_ratings(expected_win, [10000, 0])
+        update_ratings(upset, [0, 10000])
+        self.assertGreater(30 - upset[0].mu, expected_win[0].mu - 30)
+
+    def test_single_player_is_unrated(self):
+        solo = Rating()
+        update_ratings([solo], [10000])
+        self.assertEqual((solo.mu, solo.sigma), (25, SIGMA))
+
+
+class TestRatingBook(unittest.TestCase):
+    def test_replay_from_jsonl(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "matches.jsonl")
+            with open(path, "w") as f:
+                for _ in range(20):
+                    f.write(json.dumps({"players": ["ali", "bot"], "points": [10000, 6000]}) + "\n")
+                f.write("\n")
+            book = RatingBook()
+            self.assertEqual(book.replay(read_matches(path)), 20)
+        names = [name for name, _ in book.leaderboard()]
+        self.assertEqual(names, ["ALI", "BOT"])
+
+    def test_round_trip_dict(self):
+        rating = Rating(31.5, 2.25)
+        again = Rating.from_dict(rating.to_dict())
+        self.assertEqual((again.mu, again.sigma), (31.5, 2.25))
+        self.assertEqual(Rating.from_dict(None).mu, 25)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# tests/test_rescore.py
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from farkle.archive import MatchArchive  # noqa: E402
+from farkle.events import Bank, Farkle, HotDice, Score, TurnStart  # noqa: E402
+from farkle.game import Game  # noqa: E402
+from farkle.player import Player  # noqa: E402
+from farkle.rescore import Rules, rescore, rescore_match  # noqa: E402
+from farkle.simulate import RollTable  # noqa: E402
+
+
+def bots() -> list[Player]:
+    players = [Player("A", is_ai=True), Player("B", is_ai=True)]
+    players[1].strategy = "max-ev"
+    return players
+
+
+class TestRescore(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Archive matches under mixed rules, noting what each turn would bank if Hot Dice ended it."""
+        cls.directory = tempfile.mkdtemp()
+        archive = MatchArchive(cls.directory)
+        cls.cold_turns = []  # per match: (seat, points banked with Hot Dice off) per turn
+        with contextlib.redirect_stdout(io.StringIO()):
+            for seed in range(40):
+                method = Game.scoring_methods["adding" if seed % 2 else "doubling"]
+                game = Game(method, bots(), 2500, 6, seed % 4 != 0, ai_delay=False, seed=seed, archive=archive)
+                turns, cut = [], False
+                for event in game.iter_events():
+                    kind = type(event)
+                    if kind is TurnStart:
+                        turns.append([event.seat, 0])
+                        cut = False
+                    elif kind is Score and not cut:
+                        turns[-1][1] = event.tentative
+                    elif kind is HotDice:
+                        cut = True
+                    elif kind is Farkle and not cut:
+                        turns[-1][1] = 0
+                    elif kind is Bank and not cut:
+                        turns[-1][1] = event.points
+                cls.cold_turns.append(turns)
+        archive.close()
+
+    def setUp(self):
+        self.archive = MatchArchive(self.directory)
+
+    def tearDown(self):
+        self.archive.close()
+
+    def rules(self, match, method: str) -> Rules:
+        return Rules(RollTable(Game.scoring_methods[match.method]), RollTable(Game.scoring_methods[method]))
+
+    def test_own_rules_reproduce_the_record(self):
+        for match in self.archive:
+            rescored = rescore_match(match, self.rules(match, match.method))
+            self.assertEqual((tuple(rescored.points), rescored.winner), (match.points, match.winner))
+
+    def test_hot_dice_off_banks_at_each_reset(self):
+        for match, turns in zip(self.archive, self.cold_turns):
+            points = [0, 0]
+            winner = None
+            for seat, banked in turns:
+                points[seat] += banked
+                if points[seat] >= match.target_score:
+                    winner = seat
+                    break
+            rescored = rescore_match(match, self.rules(match, match.method), hot_dice_enabled=False)
+            self.assertEqual((rescored.points, rescored.winner), (points, winner))
+
+    def test_alternative_scores_and_parallel_report(self):
+        rules = Rules(RollTable(Game.scoring_methods["doubling"]), RollTable(Game.scoring_methods["adding"]))
+        self.assertEqual(rules((2, 2, 2, 2, 3, 4)), (400, 4, 200))  # four of a kind doubles only under doubling
+        report = rescore("adding", directory=self.directory, workers=1, chunk=7)
+        self.assertEqual(report, rescore("adding", directory=self.directory, workers=2, chunk=7))
+        self.assertEqual(report.matches, 40)
+        self.assertEqual(sum(impact.matches for impact in report.players.values()), 80)
+        self.assertEqual(sum(impact.wins for impact in report.players.values()), 40)
+        self.assertEqual(sum(impact.rescored_wins for impact in report.players.values()) + report.unfinished, 40)
+        with self.assertRaises(ValueError):
+            rescore("tripling", directory=self.directory)
+
+
+if __name__ == "__main__":
+    unittest.main()
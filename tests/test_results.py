@@ -0,0 +1,83 @@
+# tests/test_results.py
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from io import StringIO
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from farkle.game import Game  # noqa: E402
+from farkle.player import Player  # noqa: E402
+from farkle.results import PLAYER_COLUMNS, ResultStore  # noqa: E402
+
+
+def record(store, method, target, usernames, points, turns, winner):
+    store.record(method, target, 6, True, usernames, points, turns, winner, 0.5)
+
+
+class TestResultStore(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def test_chunks_are_fixed_size_and_survive_reopening(self):
+        store = ResultStore(self.directory, chunk_size=4)
+        for i in range(10):
+            record(store, "adding", 1000, ["A", "B"], [1000, i * 50], 10 + i, 0)
+        store.flush()
+        self.assertEqual(sorted(os.listdir(self.directory)), [f"chunk-00000{i}.bin" for i in range(3)])
+
+        reopened = ResultStore(self.directory, chunk_size=4)
+        self.assertEqual(len(reopened), 10)
+        record(reopened, "adding", 1000, ["A", "B"], [0, 1000], 20, 1)
+        reopened.flush()  # tops up the partial last chunk instead of starting a new file
+        self.assertEqual(len(os.listdir(self.directory)), 3)
+        self.assertEqual([len(chunk) for chunk in ResultStore(self.directory, chunk_size=4).chunks()], [4, 4, 3])
+
+    def test_aggregations(self):
+        store = ResultStore(self.directory, chunk_size=2)
+        record(store, "doubling", 1000, ["A", "B"], [1000, 200], 10, 0)
+        record(store, "doubling", 1000, ["A", "B"], [300, 1050], 20, 1)
+        record(store, "adding", 2000, ["A", "B", "C"], [2000, 0, 50], 30, 0)
+        self.assertEqual(store.group_mean("target", "turns"), {1000: 15, 2000: 30})
+        self.assertEqual(store.group_mean("method", "players"), {"adding": 3, "doubling": 2})
+        self.assertEqual(store.win_rates(), {("adding", "A"): (1, 1), ("adding", "B"): (0, 1),
+                                             ("adding", "C"): (0, 1), ("doubling", "A"): (1, 2),
+                                             ("doubling", "B"): (1, 2)})
+        self.assertEqual(store.win_rates("target")[(1000, "A")], (1, 2))
+
+    def test_large_tables_and_rejected_rows(self):
+        store = ResultStore(self.directory)
+        usernames = [f"P{seat}" for seat in range(300)]
+        record(store, "adding", 1000, usernames, list(range(300)), 40, 200)
+        chunk = next(store.chunks())
+        self.assertEqual((chunk.columns["players"][0], chunk.columns["winner"][0]), (300, 200))
+        self.assertEqual(store.win_rates()[("adding", "P200")], (1, 1))
+
+        with self.assertRaises(OverflowError):
+            store.record("adding", 1000, 300, True, ["A", "B"], [0, 0], 10, 0, 0.5)  # dice fit in a byte
+        self.assertEqual({len(column) for name, column in chunk.columns.items() if name not in PLAYER_COLUMNS}, {1})
+        self.assertEqual({len(chunk.columns[name]) for name in PLAYER_COLUMNS}, {300})
+
+    def test_game_records_finished_matches(self):
+        store = ResultStore(self.directory)
+        players = [Player("A", is_ai=True), Player("B", is_ai=True)]
+        game = Game(Game.scoring_methods["adding"], players, target_score=500, ai_delay=False, results=store)
+        with patch("sys.stdout", new_callable=StringIO):
+            self.assertTrue(game.run())
+        chunk = next(store.chunks())
+        self.assertEqual(chunk.methods, ["adding"])
+        self.assertEqual(list(chunk.columns["points"]), [p.points for p in players])
+        winner = chunk.columns["winner"][0]
+        self.assertGreaterEqual(players[winner].points, 500)
+        self.assertGreaterEqual(chunk.columns["turns"][0], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+# tests/test_simulate.py
+import unittest
+from unittest.mock import patch
+from io import StringIO
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from farkle.dice import Die  # noqa: E402
+from farkle.game import Game  # noqa: E402
+from farkle.simulate import RollTable, simulate_stopping_rules  # noqa: E402
+
+
+class TestRollTable(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.table = RollTable(num_dice=6)
+
+    def test_outcomes_match_scoring_method(self):
+        for faces in [(1, 1, 1, 5, 5, 2), (2, 2, 2, 2, 3, 4), (2, 3, 4, 6, 2, 3), (5,), (1, 5)]:
+            index = 0
+            for f in faces:
+                index = index * 6 + (f - 1)
+            with patch("sys.stdout", new_callable=StringIO):
+                expected = Game.doubling([Die(f) for f in faces])
+            self.assertEqual(self.table.outcomes[len(faces)][index], expected)
+
+    def test_distribution_sums_to_one(self):
+        for n in range(1, 7):
+            self.assertAlmostEqual(sum(p for p, _, _ in self.table.distribution(n)), 1.0)
+
+    def test_farkle_probability_one_die(self):
+        self.assertAlmostEqual(self.table.farkle_probability(1), 4 / 6)
+
+    def test_rejects_too_many_dice(self):
+        with self.assertRaises(ValueError):
+            RollTable(num_dice=7)
+
+
+class TestStoppingRules(unittest.TestCase):
+    def test_same_seed_same_grid(self):
+        a = simulate_stopping_rules(500, [300, 500], [2, 3], seed=7)
+        b = simulate_stopping_rules(500, [300, 500], [2, 3], seed=7)
+        self.assertEqual(a.means, b.means)
+
+    def test_bank_asap_matches_exact_single_roll_expectation(self):
+        # threshold 0 banks after the first scoring roll unless hot dice forced a fresh pool
+        table = RollTable(num_dice=6)
+        grid = simulate_stopping_rules(20000, [0], [0], seed=3, table=table, hot_dice_enabled=False)
+        exact = sum(p * score for p, score, _ in table.distribution(6))
+        self.assertAlmostEqual(grid[0, 0], exact, delta=exact * 0.05)
+
+    def test_best_rule_is_in_grid(self):
+        grid = simulate_stopping_rules(300, [200, 400, 600], [1, 2, 3], seed=1)
+        self.assertIn(grid.best(), [(t, d) for t in (200, 400, 600) for d in (1, 2, 3)])
+        self.assertIn("threshold", grid.render())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+# tests/test_solver.py
+import os
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from farkle.game import Game  # noqa: E402
+from farkle.solver import Policy, load_policy, policy_path, solve  # noqa: E402
+from farkle.strategy import DecisionState, max_ev, solved  # noqa: E402
+
+
+class TestSolver(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sweeps = []
+        cls.policy = solve(600, workers=1, report=lambda layer, sweep, delta: cls.sweeps.append((layer, sweep, delta)))
+
+    def test_parallel_matches_serial(self):
+        parallel = solve(600, workers=2)
+        self.assertEqual(parallel.rolls, self.policy.rolls)
+        self.assertAlmostEqual(parallel.start_win_probability, self.policy.start_win_probability)
+
+    def test_reports_converging_sweeps(self):
+        self.assertEqual(self.sweeps[0][0], 2 * 600 // 50 - 2)
+        self.assertLess(self.sweeps[-1][2], 1e-9)
+        self.assertLessEqual(max(sweep for _, sweep, _ in self.sweeps), 10)
+
+    def test_first_player_advantage(self):
+        self.assertGreater(self.policy.start_win_probability, 0.5)
+        self.assertLess(self.policy.start_win_probability, 1.0)
+
+    def test_policy_decisions(self):
+        self.assertFalse(self.policy.should_roll(400, 0, 200, 3))  # banking wins outright
+        self.assertTrue(self.policy.should_roll(0, 550, 50, 5))  # opponent about to win: keep rolling
+
+    def test_save_load_and_solved_strategy(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                state = DecisionState(300, 2, target_score=600, opponent_points=0, points=0,
+                                      calculate_score=Game.scoring_methods["default"])
+                load_policy.cache_clear()
+                self.assertEqual(solved(state), max_ev(state))  # no policy yet
+
+                self.policy.save(policy_path("doubling", 600))
+                loaded = Policy.load(policy_path("doubling", 600))
+                self.assertEqual(loaded.rolls, self.policy.rolls)
+                expected = "r" if self.policy.should_roll(0, 0, 300, 2) else "b"
+                self.assertEqual(solved(state), expected)  # the earlier miss was not cached
+            finally:
+                os.chdir(cwd)
+                load_policy.cache_clear()
+
+    def test_target_must_match_score_granularity(self):
+        with self.assertRaises(ValueError):
+            solve(625, workers=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
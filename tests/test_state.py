@@ -0,0 +1,93 @@
+# tests/test_state.py
+import unittest
+from itertools import product
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from farkle.game import Game  # noqa: E402
+from farkle.player import Player  # noqa: E402
+from farkle.state import GameState, StateCodec, TranspositionTable, transposition_table  # noqa: E402
+
+
+class TestStateCodec(unittest.TestCase):
+    def test_round_trip_and_uniqueness(self):
+        codec = StateCodec(3, num_dice=6, target_score=300)
+        seen = set()
+        for turn, dice, a, b, c, tentative in product(range(3), range(7), range(0, 300, 50), range(0, 300, 50),
+                                                        range(0, 300, 50), (0, 50, 2500, 100000)):
+            key = codec.encode(turn, dice, (a, b, c), tentative)
+            self.assertEqual(codec.decode(key), GameState(turn, dice, (a, b, c), tentative))
+            seen.add(key)
+        self.assertEqual(len(seen), 3 * 7 * 6 ** 3 * 4)
+
+    def test_rejects_states_outside_layout(self):
+        codec = StateCodec(2, target_score=1000)
+        with self.assertRaises(ValueError):
+            codec.encode(2, 6, (0, 0), 0)
+        with self.assertRaises(ValueError):
+            codec.encode(0, 7, (0, 0), 0)
+        with self.assertRaises(ValueError):
+            codec.encode(0, 6, (1000, 0), 0)
+        with self.assertRaises(ValueError):
+            codec.encode(0, 6, (0, 0), 75)
+
+    def test_single_player_needs_no_turn_bits(self):
+        codec = StateCodec(1, target_score=1000)
+        self.assertEqual(codec.decode(codec.encode(0, 3, (950,), 400)), GameState(0, 3, (950,), 400))
+
+
+class TestGameState(unittest.TestCase):
+    def test_encode_decode_on_game(self):
+        players = [Player("A"), Player("B"), Player("C")]
+        game = Game(players=players, target_score=2000)
+        game.turn, game.tentative_score, game.dice_pool.remaining_dice = 1, 650, 2
+        for player, points in zip(players, (100, 1950, 0)):
+            player.points = points
+        key = game.encode_state()
+
+        other = Game(players=[Player("X"), Player("Y"), Player("Z")], target_score=2000)
+        state = other.decode_state(key)
+        self.assertEqual(state, GameState(1, 2, (100, 1950, 0), 650))
+        self.assertEqual([p.points for p in other.players], [100, 1950, 0])
+        self.assertEqual((other.turn, other.tentative_score, other.dice_pool.remaining_dice), (1, 650, 2))
+        self.assertEqual(other.encode_state(), key)
+        self.assertEqual(other.rules, game.rules)
+
+    def test_decision_state_carries_key(self):
+        game = Game(players=[Player("A"), Player("B")])
+        self.assertIsNone(game.decision_state(game.players[0]).state_key)
+        state = game.decision_state(game.players[0], keyed=True)
+        self.assertEqual(state.state_key, game.encode_state())
+        self.assertIs(transposition_table(state.rules), transposition_table(game.rules))
+
+
+class TestTranspositionTable(unittest.TestCase):
+    def test_least_recently_used_is_evicted(self):
+        table = TranspositionTable(capacity=2)
+        table.store(1, "a")
+        table.store(2, "b")
+        self.assertEqual(table.get(1), "a")  # 2 is now the oldest
+        table.store(3, "c")
+        self.assertNotIn(2, table)
+        self.assertEqual(len(table), 2)
+        self.assertIsNone(table.get(2))
+        self.assertEqual((table.hits, table.misses), (1, 1))
+
+    def test_lookup_evaluates_once(self):
+        table = TranspositionTable()
+        calls = []
+        for _ in range(3):
+            self.assertEqual(table.lookup(7, lambda: calls.append(1) or 0.5), 0.5)
+        self.assertEqual(len(calls), 1)
+
+    def test_capacity_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            TranspositionTable(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+# tests/test_strategy.py
+import unittest
+from unittest.mock import patch
+from io import StringIO
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from farkle.game import Game  # noqa: E402
+from farkle.odds import turn_distribution, turn_odds  # noqa: E402
+from farkle.player import Player  # noqa: E402
+from farkle.simulate import RollTable  # noqa: E402
+from farkle.strategy import DecisionState, default, hint, max_ev, strongest  # noqa: E402
+
+
+class TestStrategies(unittest.TestCase):
+    def test_default_matches_original_bot_rule(self):
+        self.assertEqual(default(DecisionState(600, 6)), "r")  # never banks a fresh pool
+        self.assertEqual(default(DecisionState(500, 4)), "b")
+        self.assertEqual(default(DecisionState(100, 3)), "b")
+        self.assertEqual(default(DecisionState(100, 4)), "r")
+
+    def test_max_ev_extremes(self):
+        self.assertEqual(max_ev(DecisionState(50, 6)), "r")
+        self.assertEqual(max_ev(DecisionState(3000, 2)), "b")
+
+    def test_roll_ev_table_matches_one_roll_when_banking_after(self):
+        odds = turn_odds(None, 6, False)
+        # with 1 die and no hot dice, a scoring roll (1 or 5) ends the turn
+        self.assertAlmostEqual(odds.roll_ev(1, 1000), (1100 + 1050) / 6)
+        self.assertAlmostEqual(odds.farkle[1], 4 / 6)
+
+    def test_strongest_and_hint(self):
+        self.assertEqual(strongest(), "solved")
+        with patch("farkle.strategy.load_policy", return_value=None):
+            line = hint(DecisionState(300, 3))
+        self.assertIn("28% farkle risk with 3 dice", line)
+        self.assertIn("max-ev bot (no solved data for these rules) would", line)  # what actually advised
+        with patch("farkle.strategy.load_policy") as load:
+            load.return_value.should_roll.return_value = False
+            self.assertTrue(hint(DecisionState(300, 3)).endswith("solved bot would bank"))
+
+    def test_hints_preload_the_solved_policy(self):
+        with patch("farkle.strategy.load_policy") as load:
+            Game(players=[Player("A"), Player("B")], target_score=3000, hints_enabled=True)
+        load.assert_called_once_with("doubling", 3000, 6, True)
+
+
+class TestTurnDistribution(unittest.TestCase):
+    def test_banking_at_once_is_one_roll(self):
+        turn = turn_distribution(lambda state: "b", num_dice=3, hot_dice_enabled=False)
+        one_roll: dict[int, float] = {}
+        for p, score, _ in RollTable(None, 3).distribution(3):
+            one_roll[score] = one_roll.get(score, 0.0) + p
+        self.assertEqual(turn.probabilities.keys(), one_roll.keys())
+        for score, p in one_roll.items():
+            self.assertAlmostEqual(turn.probabilities[score], p)
+        self.assertEqual(turn.error, 0.0)
+
+    def test_max_ev_attains_the_best_expected_turn(self):
+        odds = turn_odds(None, 6, True)
+        turn = turn_distribution(max_ev)
+        self.assertAlmostEqual(turn.mean, odds.roll_ev(6, 0), delta=0.01)
+        self.assertAlmostEqual(sum(turn.probabilities.values()) + turn.error, 1.0)
+
+    def test_capped_hot_dice_chains_are_bounded(self):
+        always_roll = turn_distribution(lambda state: "r", num_dice=2, cap=2000)
+        self.assertGreater(always_roll.error, 0.0)
+        self.assertAlmostEqual(sum(always_roll.probabilities.values()) + always_roll.error, 1.0)
+        wider = turn_distribution(lambda state: "r", num_dice=2, cap=4000)
+        self.assertLess(wider.error, always_roll.error)
+        self.assertLess(turn_distribution(default).error, 1e-20)
+
+
+class TestGameChoice(unittest.TestCase):
+    def test_ai_uses_its_strategy(self):
+        bot = Player("BOT", is_ai=True)
+        game = Game(players=[bot, Player("P1")], ai_delay=False)
+        game.tentative_score, game.dice_pool.remaining_dice = 100, 5
+        with patch("sys.stdout", new_callable=StringIO):
+            self.assertEqual(game.get_player_choice(bot), "r")
+            bot.strategy = "max-ev"
+            game.tentative_score = 5000
+            self.assertEqual(game.get_player_choice(bot), "b")
+
+    def test_human_sees_hint_only_when_enabled(self):
+        human = Player("P1")
+        for enabled in (False, True):
+            game = Game(players=[human, Player("BOT", is_ai=True)], hints_enabled=enabled)
+            game.tentative_score, game.dice_pool.remaining_dice = 300, 3
+            with patch("sys.stdout", new_callable=StringIO) as out, patch("builtins.input", return_value="b"):
+                self.assertEqual(game.get_player_choice(human), "b")
+            self.assertEqual("Hint:" in out.getvalue(), enabled)
+
+
+if __name__ == "__main__":
+    unittest.main()
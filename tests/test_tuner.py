@@ -0,0 +1,66 @@
+# tests/test_tuner.py
+import os
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from farkle.simulate import RollTable  # noqa: E402
+from farkle.strategy import DecisionState, default, strategies  # noqa: E402
+from farkle.tuner import ThresholdStrategy, play_match, tune  # noqa: E402
+
+
+class TestThresholdStrategy(unittest.TestCase):
+    def test_default_table_matches_default_rule(self):
+        table = ThresholdStrategy.from_default(6)
+        for n in range(1, 7):
+            for tentative in range(50, 3000, 50):
+                for gap in (-5000, 0, 5000):
+                    state = DecisionState(tentative, n, points=max(gap, 0), opponent_points=max(-gap, 0))
+                    self.assertEqual(table(state), default(state), (n, tentative, gap))
+        self.assertEqual(table(DecisionState(8000, 6)), "r")  # never banks a fresh pool, however high
+
+    def test_genes_round_trip(self):
+        table = ThresholdStrategy.from_default(4)
+        again = ThresholdStrategy.from_genes(table.genes, 4)
+        self.assertEqual(again.thresholds, table.thresholds)
+        self.assertEqual(ThresholdStrategy.from_dict(table.to_dict()).thresholds, table.thresholds)
+        with self.assertRaises(ValueError):
+            ThresholdStrategy.from_genes(table.genes[1:], 4)
+
+
+class TestPlayMatch(unittest.TestCase):
+    def test_same_seed_same_result(self):
+        table = RollTable()
+        bots = [strategies["default"], strategies["max-ev"]]
+        results = [play_match(bots, table, seed, target_score=2000) for seed in range(20)]
+        self.assertEqual(results, [play_match(bots, table, seed, target_score=2000) for seed in range(20)])
+        self.assertTrue(set(results) <= {0, 1})
+
+    def test_identical_bots_share_the_dice(self):
+        # with one decider and a single seat, the match only ends once the target is reached
+        table = RollTable()
+        self.assertEqual(play_match([default], table, 3, target_score=1000), 0)
+
+
+class TestTune(unittest.TestCase):
+    def test_checkpoint_resume_matches_uninterrupted_run(self):
+        settings = dict(population=4, matches=3, target_score=1000, opponents=("default",), workers=1, seed=7)
+        straight, straight_fitness = tune(generations=3, **settings)
+        with tempfile.TemporaryDirectory() as tmp:
+            checkpoint = os.path.join(tmp, "ck.json")
+            tune(generations=2, checkpoint=checkpoint, **settings)
+            resumed, resumed_fitness = tune(generations=3, checkpoint=checkpoint, **settings)
+            with self.assertRaises(ValueError):
+                tune(generations=4, checkpoint=checkpoint, **dict(settings, matches=5))
+        self.assertEqual(resumed.thresholds, straight.thresholds)
+        self.assertEqual(resumed_fitness, straight_fitness)
+        self.assertTrue(0.0 <= straight_fitness <= 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
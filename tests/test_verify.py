@@ -0,0 +1,63 @@
+# tests/test_verify.py
+import unittest
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from farkle.game import Game  # noqa: E402
+from farkle.odds import TurnOdds  # noqa: E402
+from farkle.player import Player  # noqa: E402
+from farkle.scoring import adding, doubling  # noqa: E402
+from farkle.simulate import RollTable  # noqa: E402
+from farkle.verify import (verify_all, verify_matches, verify_roll_table, verify_scoring,  # noqa: E402
+                           verify_stopping_rules, verify_tuner_matches, verify_turn_odds)
+
+
+def drifted(selection):
+    """doubling, except four 2s score like a triple (a plausible table bug)."""
+    values = sorted(d.value for d in selection)
+    score, used = doubling(selection)
+    if values.count(2) == 4:
+        score -= 100
+    return score, used
+
+
+class TestVerify(unittest.TestCase):
+    def test_fast_paths_match_reference(self):
+        divergence = verify_all(seeds=range(4), target_score=1000)
+        self.assertIsNone(divergence, str(divergence))
+
+    def test_first_diverging_roll_is_reported(self):
+        divergence = verify_scoring(doubling, drifted, check="drifted")
+        self.assertEqual(divergence.where, "roll (2, 2, 2, 2)")
+        self.assertEqual((divergence.expected, divergence.actual), ((400, 4), (300, 4)))
+        self.assertIn("drifted diverged at roll (2, 2, 2, 2)", str(divergence))
+
+    def test_table_built_from_other_method_diverges(self):
+        divergence = verify_roll_table(doubling, RollTable(adding, 4))
+        self.assertEqual(divergence.check, "RollTable.outcomes")
+        self.assertIn("(1, 1, 1, 1)", divergence.where)
+
+    def test_first_diverging_event_is_reported(self):
+        def game(scorer):
+            return lambda seed: Game(scorer, [Player("A", is_ai=True), Player("B", is_ai=True)], 1000,
+                                     ai_delay=False, seed=seed)
+        divergence = verify_matches(game(doubling), game(adding), range(20))
+        self.assertIsNotNone(divergence)
+        self.assertTrue(divergence.where.startswith("seed "))
+        self.assertNotEqual(divergence.expected, divergence.actual)
+
+    def test_simulators_diverge_from_games_with_other_rules(self):
+        table = RollTable(adding)  # a simulator scoring with the wrong method
+        self.assertTrue(verify_tuner_matches(doubling, table, range(20)).where.startswith("seed "))
+        divergence = verify_stopping_rules(doubling, table, [300, 1000], [0, 2], turns=100)
+        self.assertTrue(divergence.where.startswith("rule ("))
+        self.assertIsNone(verify_turn_odds(doubling, odds=TurnOdds(doubling)))
+        self.assertEqual(verify_turn_odds(doubling, turns=10000, odds=TurnOdds(adding)).check, "TurnOdds")
+
+
+if __name__ == "__main__":
+    unittest.main()